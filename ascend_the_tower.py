@@ -1,47 +1,226 @@
-def main(screen, clock, scene_handler):
+# frame_rate caps rendering only, the simulation keeps ticking at FRAME_RATE
+def main(screen, clock, scene_handler, deferred=None, frame_rate=None):
+    deferred = list(deferred) if deferred else []
     quit = False
 
     while not quit:
-        screen.fill(SCREEN_COLOR)
-
         quit = scene_handler.update()
-        pygame.display.flip()
 
-        clock.tick(FRAME_RATE)
+        if deferred:
+            StartupProfiler.mark('first_game_frame')
+
+            for init in deferred:
+                with StartupProfiler.section(init.__qualname__):
+                    init()
+
+            deferred.clear()
+
+            if StartupProfiler.enabled:
+                StartupProfiler.stop()
+                StartupProfiler.print_report()
+
+        clock.tick(frame_rate if frame_rate else FRAME_RATE)
+
+    scene_handler.renderer.stop()
+
+def draw_loading_bar(screen, done, total):
+    width, height = 400, 6
+    x = (screen.get_width() - width) // 2
+    y = (screen.get_height() - height) // 2
+
+    screen.fill(SCREEN_COLOR)
+    pygame.draw.rect(screen, (40, 40, 40), (x, y, width, height))
+    pygame.draw.rect(screen, (255, 255, 255), (x, y, round(width * done / total), height))
+
+    pygame.event.pump()
+    pygame.display.flip()
+
+def get_resolution_scale(value):
+    if value == 'auto':
+        return value
+
+    scale = float(value)
+    if scale not in [1.0, .75, .5]:
+        raise argparse.ArgumentTypeError('must be 1, .75, .5 or auto')
+
+    return scale
 
 if __name__ == '__main__':
+    from scripts.tools.startup_profiler import StartupProfiler
+
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--profile-startup', action='store_true', help='print import and init timings after the first frame')
+    parser.add_argument('--headless', action='store_true', help='run without a window on scripted input with a fixed dt')
+    parser.add_argument('--frames', type=int, default=None, help='headless: number of frames to simulate')
+    parser.add_argument('--floors', type=int, default=None, help='headless: number of floors to clear before stopping')
+    parser.add_argument('--no-draw', action='store_true', help='headless: skip all blitting work')
+    parser.add_argument('--seed', type=int, default=None, help='seed for every gameplay roll, random if not given')
+    parser.add_argument('--record', default=None, help='record the seed, input and dt of the run to this file')
+    parser.add_argument('--replay', default=None, help='play back a recorded run')
+    parser.add_argument('--fps', type=int, default=None, help='render frame rate cap, gameplay always ticks at the base frame rate')
+    parser.add_argument('--render-thread', action='store_true', help='draw each frame on a worker thread while the next one simulates')
+    parser.add_argument('--resolution-scale', type=get_resolution_scale, default=1.0, help='internal resolution of the world as 1, .75, .5 or auto, 7 cycles it')
+    parser.add_argument('--profile', action='store_true', help='start with the frame profiler overlay shown, 9 toggles it')
+    parser.add_argument('--hot-paths', action='store_true', help='count surface, transform, mask and blit calls per module, 8 toggles it')
+    parser.add_argument('--memory-report', action='store_true', help='report surface bytes and traced allocations at every floor load')
+    parser.add_argument('--memory-threshold', type=int, default=None, help='headless: fail when memory grows past this many kb across floors of the same map')
+    parser.add_argument('--auto-clear', type=int, default=None, help='headless: clear the floor every N frames, for soak runs over many floors')
+    parser.add_argument('--trace', default=None, help='write a Chrome trace of every frame to this file')
+    args = parser.parse_args()
+
+    if args.headless:
+        from scripts.headless import init_headless, create_scene_handler, run_headless
+        from scripts.tools.input_source import ScriptedInput, wander_script
+        from scripts.tools.replay import InputRecorder, InputReplayer, create_input_source
+        from scripts.tools.frame_profiler import FrameProfiler
+        from scripts.tools.hot_path_counters import HotPathCounters
+        from scripts.tools.memory_report import MemoryReport
+        from scripts.renderer import Renderer
+
+        import sys
+
+        screen, clock = init_headless()
+
+        if args.trace:
+            FrameProfiler.start_trace(args.trace)
+
+        if args.memory_report:
+            MemoryReport.start(args.memory_threshold)
+
+        input_source = create_input_source(ScriptedInput(wander_script), args.seed, args.record is not None, args.replay)
+        scene_handler = create_scene_handler(screen, clock, input_source, not args.no_draw, Renderer(threaded=args.render_thread, flip=False, scale=args.resolution_scale))
+
+        if hasattr(input_source, 'attach'):
+            input_source.attach(scene_handler)
+
+        frames = args.frames
+        if frames is None and args.floors is None and not args.replay:
+            frames = 1000
+
+        if args.profile:
+            FrameProfiler.toggle()
+
+        if args.hot_paths:
+            HotPathCounters.enable()
+
+        def auto_clear(scene_handler, frame):
+            if frame % args.auto_clear == 0 and hasattr(scene_handler.current_scene, 'on_floor_clear'):
+                scene_handler.current_scene.on_floor_clear()
+
+        print(f'[HEADLESS] {run_headless(scene_handler, frames, args.floors, on_frame=auto_clear if args.auto_clear else None)}')
+
+        if args.profile:
+            print(f'[FRAME_PROFILER] {FrameProfiler.get_report()}')
+
+        if args.hot_paths:
+            HotPathCounters.disable()
+            print(f'[HOT_PATHS] {HotPathCounters.get_report()}')
+
+        if args.trace:
+            FrameProfiler.stop_trace()
+
+        if isinstance(input_source, InputRecorder):
+            input_source.save(args.record)
+
+        replayer = input_source.source if isinstance(input_source, InputRecorder) else input_source
+        if isinstance(replayer, InputReplayer):
+            print(f'[REPLAY] {replayer.frame} frames, ' + ('no desync' if replayer.desync is None else f'desync at frame {replayer.desync}'))
+
+        if args.memory_report:
+            report = MemoryReport.get_report()
+            MemoryReport.stop()
+
+            print(f'[MEMORY] top growth since the first floor: {report["top_growth_kb"]}')
+
+            if report['flags']:
+                sys.exit(1)
+
+        sys.exit()
+
+    if args.profile_startup:
+        StartupProfiler.init()
+
+    with StartupProfiler.section('pygame'):
+        import pygame
+        import sys
+
+        pygame.init()
+        pygame.mixer.init()
+
     from scripts import (
         TITLE, VERSION,
         FRAME_RATE,
         SCREEN_DIMENSIONS,
         SCREEN_COLOR
     )
-    
-    from scripts.scene_handler import SceneHandler
-    
-    from scripts.tools.sfx_manager import Sfx
-    from scripts.tools.fonts import Fonts
-    from scripts.tools.inputs import Inputs
-
-    import pygame
-    import sys
-    
-    pygame.init()
-    pygame.mixer.init()
 
     pygame.display.set_caption(f'{TITLE} [{VERSION}]')
     pygame.mouse.set_visible(False)
 
-    screen = pygame.display.set_mode(SCREEN_DIMENSIONS)
-    clock = pygame.time.Clock()
-    
-    Sfx.init()
+    with StartupProfiler.section('display'):
+        screen = pygame.display.set_mode(SCREEN_DIMENSIONS)
+        clock = pygame.time.Clock()
+
+        screen.fill(SCREEN_COLOR)
+        pygame.display.flip()
+
+    StartupProfiler.mark('first_frame')
+
+    with StartupProfiler.section('AssetLoader.preload'):
+        from scripts.tools.asset_loader import AssetLoader
+
+        AssetLoader.preload(AssetLoader.get_startup_paths(), lambda done, total, path: draw_loading_bar(screen, done, total))
+
+    with StartupProfiler.section('imports'):
+        from scripts.scene_handler import SceneHandler
+        from scripts.renderer import Renderer
+
+        from scripts.tools.sfx_manager import Sfx
+        from scripts.tools.fonts import Fonts
+        from scripts.tools.inputs import Inputs
+
+    with StartupProfiler.section('Fonts.init'):
+        Fonts.init()
+
+    with StartupProfiler.section('Inputs.init'):
+        Inputs.init()
+
+    from scripts.tools.frame_profiler import FrameProfiler
+    from scripts.tools.hot_path_counters import HotPathCounters
+    from scripts.tools.memory_report import MemoryReport
+    from scripts.tools.input_source import LiveInput
+    from scripts.tools.replay import InputRecorder, create_input_source
+
+    if args.profile:
+        FrameProfiler.toggle()
+
+    if args.hot_paths:
+        HotPathCounters.enable()
+
+    if args.memory_report:
+        MemoryReport.start(args.memory_threshold)
+
+    if args.trace:
+        FrameProfiler.start_trace(args.trace)
+
+    input_source = create_input_source(LiveInput(), args.seed, args.record is not None, args.replay)
+
+    with StartupProfiler.section('SceneHandler'):
+        scene_handler = SceneHandler(screen, clock, input_source, renderer=Renderer(threaded=args.render_thread, scale=args.resolution_scale, budget_ms=1000 / args.fps if args.fps else None))
+
+    if hasattr(input_source, 'attach'):
+        input_source.attach(scene_handler)
+
+    main(screen, clock, scene_handler, [Sfx.init], args.fps)
+
+    if args.trace:
+        FrameProfiler.stop_trace()
 
-    Fonts.init()
-    Inputs.init()
+    if isinstance(input_source, InputRecorder):
+        input_source.save(args.record)
 
-    main(screen, clock, SceneHandler(screen, clock))
-    
     pygame.quit()
     pygame.mixer.quit()
 
@@ -0,0 +1,4 @@
+def init_pygame():
+    from scripts.headless import init_headless
+
+    return init_headless()
@@ -0,0 +1,59 @@
+# Idles on a floor with entity activation off and on, reporting frame times, how many entities slept and the particles left alive
+from benchmarks import init_pygame
+from benchmarks.scenarios import SEED, idle_script
+
+import argparse
+import time
+
+def run(frames, floor, render, enabled):
+    from scripts.headless import create_scene_handler
+    from scripts.core_systems.activation import Activation
+    from scripts.tools.input_source import ScriptedInput
+    from scripts.tools.rng import Rng
+
+    Rng.seed(SEED)
+    Activation.enabled = enabled
+
+    scene_handler = create_scene_handler(*init_pygame(), ScriptedInput(idle_script), render)
+    scene = scene_handler.current_scene
+
+    if floor != 1:
+        scene.level_info['pattern'][0] = floor
+        scene.load_tilemap()
+
+    frame_ms = []
+    asleep = 0
+    for _ in range(frames):
+        start = time.perf_counter_ns()
+        scene_handler.update(1)
+        frame_ms.append((time.perf_counter_ns() - start) / 1e6)
+
+        asleep += Activation.asleep
+
+    Activation.enabled = True
+
+    frame_ms.sort()
+    return {
+        'mean_ms': sum(frame_ms) / len(frame_ms),
+        'p95_ms': frame_ms[int(len(frame_ms) * .95)],
+        'asleep': asleep / frames,
+        'particles': len(scene.get_sprites('particle')),
+        'sprites': len(scene.sprite_list)
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--floor', type=int, default=1)
+    parser.add_argument('--no-draw', action='store_true')
+    args = parser.parse_args()
+
+    for name, enabled in [['always awake', False], ['activation', True]]:
+        result = run(args.frames, args.floor, not args.no_draw, enabled)
+        print(
+            f'[ACTIVATION] {name:<12} mean {result["mean_ms"]:.2f} ms  p95 {result["p95_ms"]:.2f} ms  '
+            f'{result["asleep"]:.0f} asleep per frame, {result["particles"]} particles of {result["sprites"]} sprites at the end'
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# Times the AI pass on a floor full of one enemy type, batched and one enemy at a time
+from benchmarks import init_pygame
+from benchmarks.scenarios import SEED, spawn_enemies, get_enemy_class
+
+import argparse
+import time
+
+def time_ai(scene, frames, batched):
+    from scripts.core_systems import enemy_ai
+    from scripts.core_systems.enemy_ai import AiSystem
+
+    numpy = enemy_ai.numpy
+    if not batched:
+        enemy_ai.numpy = None
+
+    try:
+        start = time.perf_counter_ns()
+        for _ in range(frames):
+            AiSystem.update(scene, scene.player)
+
+        return (time.perf_counter_ns() - start) / frames / 1e6
+
+    finally:
+        enemy_ai.numpy = numpy
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--enemies', type=int, default=200)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--enemy', default='Sentry')
+    args = parser.parse_args()
+
+    screen, clock = init_pygame()
+
+    from scripts.headless import create_scene_handler
+    from scripts.core_systems import enemy_ai
+    from scripts.tools.input_source import ScriptedInput, wander_script
+    from scripts.tools.rng import Rng
+
+    Rng.seed(SEED)
+
+    scene_handler = create_scene_handler(screen, clock, ScriptedInput(wander_script), False)
+    scene = scene_handler.current_scene
+
+    for enemy in spawn_enemies(scene, get_enemy_class(args.enemy), args.enemies):
+        enemy.lod_info['dt'] = 1
+
+    print(f'[ENEMY AI] {args.enemies} {args.enemy.lower()} enemies, {args.frames} frames')
+    print(f'[ENEMY AI] one at a time: {time_ai(scene, args.frames, False):.3f} ms per frame')
+
+    if enemy_ai.numpy is not None:
+        print(f'[ENEMY AI] batched: {time_ai(scene, args.frames, True):.3f} ms per frame')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# Runs the same spread out swarm with the AI tiers on and off, reports frame times and checks that throttled enemies catch up sanely
+from benchmarks import init_pygame
+from benchmarks.scenarios import SEED, idle_script, spawn_enemies, get_enemy_class, set_player_immune
+
+import argparse
+import time
+import sys
+
+ENEMY_NAMES = ['Sentry', 'Sentinel', 'Elemental']
+
+ARRIVAL_INTERVALS = 2
+
+def run(enemies, frames, render, lod):
+    from scripts.headless import create_scene_handler
+    from scripts.core_systems.enemy_ai import AiLod
+    from scripts.tools.input_source import ScriptedInput
+    from scripts.tools.rng import Rng
+
+    Rng.seed(SEED)
+    AiLod.enabled = lod
+
+    scene_handler = create_scene_handler(*init_pygame(), ScriptedInput(idle_script), render)
+    scene = scene_handler.current_scene
+
+    spawned = []
+    for name in ENEMY_NAMES:
+        spawned.extend(spawn_enemies(scene, get_enemy_class(name), enemies // len(ENEMY_NAMES), (3000, 1500)))
+
+    result = {'frame_ms': [], 'max_speed': 0, 'overspeed': 0, 'arrivals': {}, 'far': {}, 'tiers': {}, 'converged': frames}
+
+    for frame in range(frames):
+        set_player_immune(scene)
+
+        start = time.perf_counter_ns()
+        scene_handler.update(1)
+        result['frame_ms'].append((time.perf_counter_ns() - start) / 1e6)
+
+        # The camera only reaches the player at the end of the first tick, so tiers are counted from the second
+        if frame == 1:
+            result['tiers'] = AiLod.get_counts(spawned)
+
+        if lod and frame > 0 and result['converged'] == frames and all(enemy.lod_info['tier'] == 'visible' for enemy in spawned):
+            result['converged'] = frame
+
+        for enemy in spawned:
+            speed = max(abs(enemy.velocity[0]), abs(enemy.velocity[1]))
+            result['max_speed'] = max(result['max_speed'], speed)
+
+            if speed > enemy.movement_info['max_movespeed'] + enemy.movement_info['per_frame_movespeed'] * 2:
+                result['overspeed'] += 1
+
+            if id(enemy) not in result['arrivals'] and enemy.rect.colliderect(scene.view.move(scene.camera_offset)):
+                result['arrivals'][id(enemy)] = frame
+
+            if frame > 0 and enemy.lod_info['tier'] == 'far' and id(enemy) not in result['far']:
+                result['far'][id(enemy)] = tuple(enemy.rect.topleft)
+
+    AiLod.enabled = True
+
+    enemies = {id(enemy): enemy for enemy in scene.get_sprites('enemy')}
+    result['stuck'] = sum(1 for i, position in result['far'].items() if i in enemies and tuple(enemies[i].rect.topleft) == position)
+
+    result['order'] = [id(enemy) for enemy in spawned]
+    result['random'] = {id(enemy) for enemy in spawned if enemy.ai.ai_type == 'floater'}
+    return result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--enemies', type=int, default=150)
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--no-draw', action='store_true')
+    args = parser.parse_args()
+
+    from scripts.core_systems.enemy_ai import AiLod
+
+    full = run(args.enemies, args.frames, not args.no_draw, False)
+    tiered = run(args.enemies, args.frames, not args.no_draw, True)
+
+    converged = tiered['converged']
+    for name, result in [['every tick', full], ['tiered', tiered]]:
+        frame_ms = sorted(result['frame_ms'])
+        print(f'[ENEMY LOD] {name:<10} mean {sum(frame_ms) / len(frame_ms):.2f} ms  p95 {frame_ms[int(len(frame_ms) * .95)]:.2f} ms  max speed {result["max_speed"]}')
+
+        for label, phase in [['closing in', result['frame_ms'][1:converged]], ['all in view', result['frame_ms'][converged:]]]:
+            if phase:
+                print(f'[ENEMY LOD] {name:<10} {label:<11} mean {sum(phase) / len(phase):.2f} ms over {len(phase)} frames')
+
+    print(f'[ENEMY LOD] tiers on the second frame: {tiered["tiers"]}, {len(tiered["far"])} enemies far at some point, {tiered["stuck"]} of them never moved or despawned')
+
+    failures = []
+    if tiered['overspeed']:
+        failures.append(f'{tiered["overspeed"]} enemy frames over the speed cap')
+
+    if tiered['stuck']:
+        failures.append(f'{tiered["stuck"]} far enemies stuck in place')
+
+    # Floaters pick destinations off the shared rng, which throttled enemies draw from less often, so their paths differ between the runs
+    late = 0
+    arrived = 0
+    for full_id, tiered_id in zip(full['order'], tiered['order']):
+        if full_id not in full['arrivals'] or tiered_id in tiered['far'] or tiered_id in tiered['random']:
+            continue
+
+        arrived += 1
+        if tiered['arrivals'].get(tiered_id, args.frames) - full['arrivals'][full_id] > AiLod.NEAR_INTERVAL * ARRIVAL_INTERVALS:
+            late += 1
+
+    print(f'[ENEMY LOD] {arrived} enemies reached the view, {late} of them late by more than {AiLod.NEAR_INTERVAL * ARRIVAL_INTERVALS} frames with tiers on')
+    if late:
+        failures.append(f'{late} enemies reached the view late')
+
+    for failure in failures:
+        print(f'[ENEMY LOD] FAILED: {failure}')
+
+    if failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# Times the per-tile line scan elementals ran against the grid line of sight service, cold and cached, and reports how often the two agree
+from benchmarks import init_pygame
+
+import argparse
+import time
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--area', default='caverns')
+    parser.add_argument('--floor', default='floor-1')
+    args = parser.parse_args()
+
+    init_pygame()
+
+    from scripts.tilemap_loader import load_tilemap
+    from scripts.core_systems.line_of_sight import LineOfSight
+    from scripts.core_systems.navigation import NavGrid
+    from scripts.tools import check_line_collision
+    from scripts.tools.rng import Rng
+
+    tilemap = load_tilemap(args.area, args.floor)
+    NavGrid.load(tilemap['tiles'], tilemap['surface'].get_size(), tilemap['tile_dimensions'][0])
+
+    tiles = [tile for tile in tilemap['tiles'] if tile.sprite_id == 'tile' and tile.secondary_sprite_id != 'ramp']
+
+    Rng.seed(0)
+    spawn = tilemap['flags']['player_spawn'][0]
+    pairs = [[spawn, [spawn[0] + Rng.randint(-2560, 2560), spawn[1] + Rng.randint(-1440, 1440)]] for _ in range(args.queries)]
+
+    start = time.perf_counter_ns()
+    scanned = [not check_line_collision(a, b, tiles) for a, b in pairs]
+    scan_ms = (time.perf_counter_ns() - start) / 1e6
+
+    LineOfSight.reset()
+    LineOfSight.budget = args.queries
+
+    start = time.perf_counter_ns()
+    traced = [LineOfSight.check(a, b) for a, b in pairs]
+    cold_ms = (time.perf_counter_ns() - start) / 1e6
+
+    start = time.perf_counter_ns()
+    for a, b in pairs:
+        LineOfSight.check(a, b)
+
+    cached_ms = (time.perf_counter_ns() - start) / 1e6
+
+    agree = sum(a == b for a, b in zip(scanned, traced))
+
+    print(f'[LINE OF SIGHT] {args.queries} queries against {len(tiles)} tiles on {args.area}/{args.floor}')
+    print(f'[LINE OF SIGHT] tile scan: {scan_ms * 1e3 / args.queries:.1f} us per query')
+    print(f'[LINE OF SIGHT] grid, uncached: {cold_ms * 1e3 / args.queries:.1f} us per query')
+    print(f'[LINE OF SIGHT] grid, cached: {cached_ms * 1e3 / args.queries:.1f} us per query')
+    print(f'[LINE OF SIGHT] {agree} of {args.queries} answers match the tile scan')
+
+    LineOfSight.reset()
+    NavGrid.reset()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+# Runs each scenario with the inline and the threaded renderer and compares wall time per frame
+from benchmarks.scenarios import SCENARIOS
+
+import subprocess
+import statistics
+import argparse
+import json
+import sys
+
+DEFAULT_SCENARIOS = ['idle_floor_1', 'sentry_swarm_50', 'death_particle_burst', 'card_menu_open']
+
+def run_child(name, frames, render_thread):
+    command = [sys.executable, '-m', 'benchmarks.scenarios', '--child', name]
+    if frames:
+        command += ['--frames', str(frames)]
+
+    if render_thread:
+        command.append('--render-thread')
+
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=None)
+    parser.add_argument('--only', default=None, help='comma separated scenario names')
+    parser.add_argument('--repeats', type=int, default=3, help='runs of each renderer, the median is kept')
+    parser.add_argument('--out', default=None, help='write the results to this file')
+    args = parser.parse_args()
+
+    names = args.only.split(',') if args.only else DEFAULT_SCENARIOS
+    results = {}
+
+    for name in names:
+        if name not in SCENARIOS:
+            print(f'[RENDER_PIPELINE] Unknown scenario {name}.')
+            continue
+
+        runs = {False: [], True: []}
+        for _ in range(args.repeats):
+            for render_thread in runs:
+                result = run_child(name, args.frames, render_thread)
+                runs[render_thread].append(result['wall_ms'] / result['frames'])
+
+        inline_ms = statistics.median(runs[False])
+        threaded_ms = statistics.median(runs[True])
+
+        results[name] = {
+            'inline_ms': round(inline_ms, 3),
+            'threaded_ms': round(threaded_ms, 3),
+            'speedup': round(inline_ms / threaded_ms, 3)
+        }
+
+        r = results[name]
+        print(f'[RENDER_PIPELINE] {name:<22} inline {r["inline_ms"]:>7.2f} ms  threaded {r["threaded_ms"]:>7.2f} ms  speedup {r["speedup"]:.2f}x')
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == '__main__':
+    main()
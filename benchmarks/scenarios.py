@@ -0,0 +1,234 @@
+# Every scenario runs headless in its own process so peak RSS is per scenario
+from benchmarks import init_pygame
+
+import subprocess
+import argparse
+import json
+import time
+import sys
+import gc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SEED = 1
+
+COMPARED_METRICS = ['mean_ms', 'p95_ms', 'p99_ms', 'blocks_per_frame', 'peak_rss_kb']
+
+def idle_script(frame):
+    return [], []
+
+# 'all' is a timed immunity and abilities clear it when they end, so it is set again before every frame
+def set_player_immune(scene):
+    scene.player.combat_info['immunities']['all'] = float('inf')
+
+def spawn_enemies(scene, enemy_class, count, spread=(600, 300)):
+    from scripts.tools.rng import Rng
+
+    pos = scene.player.center_position
+    enemies = []
+
+    for _ in range(count):
+        enemy = enemy_class([pos[0] + Rng.randint(-spread[0], spread[0]), pos[1] - Rng.randint(0, spread[1])], 6)
+        enemy.swarm = True
+
+        enemies.append(enemy)
+
+    scene.add_sprites(enemies)
+    return enemies
+
+def get_enemy_class(name):
+    from scripts.entities.enemy import ENEMIES
+
+    return [e for e in ENEMIES[1] if e.__name__ == name][0]
+
+def setup_sentry_swarm(scene):
+    spawn_enemies(scene, get_enemy_class('Sentry'), 50)
+
+def setup_spread_swarm(scene):
+    for name in ['Sentry', 'Sentinel', 'Elemental']:
+        spawn_enemies(scene, get_enemy_class(name), 50, (3000, 1500))
+
+def setup_rain_of_arrows(scene):
+    from scripts.core_systems.abilities import RainOfArrows
+
+    spawn_enemies(scene, get_enemy_class('Sentry'), 30, (300, 150))
+    scene.player.abilities['ability_1'] = RainOfArrows(scene.player)
+
+def frame_rain_of_arrows(scene, frame):
+    ability = scene.player.abilities['ability_1']
+    if not ability.ability_info['active']:
+        ability.call(scene, ignore_cooldown=True)
+
+def frame_death_burst(scene, frame):
+    if frame % 60 == 1:
+        for enemy in spawn_enemies(scene, get_enemy_class('Sentry'), 25, (400, 200)):
+            enemy.on_death(scene, None)
+
+def setup_card_menu(scene):
+    cards, text, discard = scene.generate_standard_cards()
+    scene.load_card_event(cards, text, discard)
+
+def setup_floor_transition(scene):
+    scene.on_floor_clear()
+
+def setup_floor_4(scene):
+    scene.level_info['pattern'][0] = 4
+    scene.load_tilemap()
+
+# name: [frames, setup(scene), on_frame(scene, frame), input script]
+SCENARIOS = {
+    'idle_floor_1': [300, None, None, 'idle'],
+    'sentry_swarm_50': [300, setup_sentry_swarm, None, 'idle'],
+    'spread_swarm_150': [300, setup_spread_swarm, None, 'idle'],
+    'rain_of_arrows_crowd': [300, setup_rain_of_arrows, frame_rain_of_arrows, 'idle'],
+    'death_particle_burst': [300, None, frame_death_burst, 'idle'],
+    'card_menu_open': [300, setup_card_menu, None, 'idle'],
+    'floor_transition': [300, setup_floor_transition, None, 'idle'],
+    'floor_4_traversal': [300, setup_floor_4, None, 'wander']
+}
+
+def get_percentile(values, percentile):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(percentile / 100 * (len(values) - 1))))
+
+    return values[index]
+
+def run_scenario(name, frames=None, render=True, render_thread=False, scale=1.0):
+    screen, clock = init_pygame()
+
+    from scripts.headless import create_scene_handler
+    from scripts.renderer import Renderer
+    from scripts.tools.input_source import ScriptedInput, wander_script
+    from scripts.tools.rng import Rng
+
+    default_frames, setup, on_frame, script = SCENARIOS[name]
+    frames = frames if frames else default_frames
+
+    Rng.seed(SEED)
+
+    renderer = Renderer(threaded=render_thread, flip=False, scale=scale)
+    scene_handler = create_scene_handler(screen, clock, ScriptedInput(wander_script if script == 'wander' else idle_script), render, renderer)
+    scene = scene_handler.current_scene
+
+    if setup:
+        setup(scene)
+
+    frame_times = []
+    gc_start = gc.get_stats()[0]['collections']
+    blocks_start = sys.getallocatedblocks()
+
+    run_start = time.perf_counter_ns()
+    for frame in range(frames):
+        start = time.perf_counter_ns()
+
+        set_player_immune(scene_handler.current_scene)
+
+        if on_frame:
+            on_frame(scene_handler.current_scene, frame)
+
+        scene_handler.update(1)
+
+        frame_times.append((time.perf_counter_ns() - start) / 1e6)
+
+    # A threaded renderer still has the last frame in flight, wall time includes it
+    renderer.wait()
+    wall_ms = (time.perf_counter_ns() - run_start) / 1e6
+    renderer.stop()
+
+    return {
+        'frames': frames,
+        'render': render,
+        'render_thread': render_thread,
+        'scale': scale,
+        'wall_ms': round(wall_ms, 1),
+        'mean_ms': round(sum(frame_times) / len(frame_times), 3),
+        'p50_ms': round(get_percentile(frame_times, 50), 3),
+        'p95_ms': round(get_percentile(frame_times, 95), 3),
+        'p99_ms': round(get_percentile(frame_times, 99), 3),
+        'max_ms': round(max(frame_times), 3),
+        'blocks_per_frame': round((sys.getallocatedblocks() - blocks_start) / frames, 2),
+        'gc_gen0_per_frame': round((gc.get_stats()[0]['collections'] - gc_start) / frames, 3),
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+        'sprites': len(scene_handler.current_scene.sprite_list)
+    }
+
+def compare(results, baseline, threshold):
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        for metric in COMPARED_METRICS:
+            new, old = result.get(metric), baseline[name].get(metric)
+            if new is None or old is None:
+                continue
+
+            if new - old > max(abs(old), 1) * threshold:
+                regressions.append([name, metric, old, new])
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--child', default=None)
+    parser.add_argument('--frames', type=int, default=None)
+    parser.add_argument('--only', default=None, help='comma separated scenario names')
+    parser.add_argument('--no-draw', action='store_true')
+    parser.add_argument('--render-thread', action='store_true', help='draw on the renderer worker thread')
+    parser.add_argument('--resolution-scale', default='1', help='internal resolution of the world, 1, .75, .5 or auto')
+    parser.add_argument('--out', default=None, help='write the results to this file')
+    parser.add_argument('--compare', default=None, help='baseline results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=.1, help='allowed relative rise before a metric counts as a regression')
+    args = parser.parse_args()
+
+    scale = args.resolution_scale if args.resolution_scale == 'auto' else float(args.resolution_scale)
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.frames, not args.no_draw, args.render_thread, scale)))
+        return
+
+    names = args.only.split(',') if args.only else list(SCENARIOS.keys())
+    results = {}
+
+    for name in names:
+        command = [sys.executable, '-m', 'benchmarks.scenarios', '--child', name]
+        if args.frames:
+            command += ['--frames', str(args.frames)]
+
+        if args.no_draw:
+            command.append('--no-draw')
+
+        if args.render_thread:
+            command.append('--render-thread')
+
+        command += ['--resolution-scale', args.resolution_scale]
+
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        results[name] = json.loads(output.strip().splitlines()[-1])
+
+        r = results[name]
+        print(f'[SCENARIOS] {name:<22} mean {r["mean_ms"]:>7.2f} ms  p50 {r["p50_ms"]:>7.2f}  p95 {r["p95_ms"]:>7.2f}  p99 {r["p99_ms"]:>7.2f}  blocks/frame {r["blocks_per_frame"]:>8.1f}  rss {r["peak_rss_kb"]} kb')
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f'[SCENARIOS] REGRESSION {name} {metric}: {old} -> {new}')
+
+        if regressions:
+            sys.exit(1)
+
+        print('[SCENARIOS] No regressions.')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# Drives the sound pool with bursts of plays in every category, timing Sfx.update and checking it keeps to its limits
+from benchmarks import init_pygame
+
+import argparse
+import time
+import sys
+
+FRAME_MS = 1000 / 60
+
+SOUND_SECONDS = .3
+
+def run(sounds, frames, requests):
+    from scripts.tools.sfx_manager import Sfx
+
+    Sfx.voices = {}
+    Sfx.last_played = {}
+    Sfx.counters = dict.fromkeys(Sfx.counters, 0)
+
+    names = {Sfx.SOUNDS[sound]: sound for sound in sounds}
+
+    failures = []
+    update_ms = []
+
+    for frame in range(frames):
+        start = time.perf_counter()
+
+        last_played = dict(Sfx.last_played)
+        for sound in sounds:
+            for _ in range(requests):
+                Sfx.play(sound)
+
+        update_start = time.perf_counter_ns()
+        Sfx.update()
+        update_ms.append((time.perf_counter_ns() - update_start) / 1e6)
+
+        for sound in sounds:
+            settings = Sfx.get_settings(sound)
+
+            if len(Sfx.voices.get(sound, [])) > settings['max_voices']:
+                failures.append(f'frame {frame}: {sound} over its {settings["max_voices"]} voices')
+
+            gap = Sfx.last_played.get(sound, 0) - last_played.get(sound, 0)
+            if sound in last_played and 0 < gap < settings['retrigger']:
+                failures.append(f'frame {frame}: {sound} retriggered after {gap} ms')
+
+        for category, pool in Sfx.channels.items():
+            for channel in pool:
+                if channel.get_busy() and Sfx.get_category(names.get(channel.get_sound(), category)) != category:
+                    failures.append(f'frame {frame}: a {category} channel is playing {names[channel.get_sound()]}')
+
+        time.sleep(max(FRAME_MS / 1000 - (time.perf_counter() - start), 0))
+
+    counters = Sfx.get_counters()
+    dropped = counters['dropped_retrigger'] + counters['dropped_voices'] + counters['dropped_channels']
+
+    if counters['requested'] != counters['coalesced'] + counters['played'] + dropped:
+        failures.append(f'{counters["requested"]} requests but {counters["coalesced"]} coalesced, {counters["played"]} played and {dropped} dropped')
+
+    if not counters['played']:
+        failures.append('nothing played')
+
+    return sorted(update_ms), counters, failures
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--requests', type=int, default=5, help='plays of every sound requested per frame')
+    args = parser.parse_args()
+
+    init_pygame()
+
+    from scripts.tools.sfx_manager import Sfx
+
+    import pygame
+
+    Sfx.init()
+
+    # The game ships no sounds yet, so silent ones are made up under names in every category
+    frequency, _, channels = pygame.mixer.get_init()
+    buffer = bytes(int(frequency * SOUND_SECONDS) * channels * 2)
+
+    failures = []
+
+    for name, count in [['voices', 1], ['channels', max(Sfx.CATEGORIES.values()) + 2]]:
+        sounds = [f'{category}-{i}' for category in Sfx.CATEGORIES for i in range(count)]
+        for sound in sounds:
+            Sfx.SOUNDS[sound] = pygame.mixer.Sound(buffer=buffer)
+
+        update_ms, counters, run_failures = run(sounds, args.frames, args.requests)
+        failures.extend(f'{name}: {failure}' for failure in run_failures)
+
+        print(f'[SFX] {name:<8} {len(sounds)} sounds, update mean {sum(update_ms) / len(update_ms):.3f} ms  p95 {update_ms[int(len(update_ms) * .95)]:.3f} ms')
+        print(f'[SFX] {name:<8} {counters}')
+
+        pygame.mixer.stop()
+
+    for failure in failures[:10]:
+        print(f'[SFX] FAILED: {failure}')
+
+    if failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
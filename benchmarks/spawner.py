@@ -0,0 +1,85 @@
+# Times spawn point lookups and free placement through the spawner against the list and tile scans it replaced
+from benchmarks import init_pygame
+
+import argparse
+import time
+
+def get_spawn_scanned(spawns, position, distance):
+    from scripts.tools import get_distance
+
+    elgible_spawns = [s for s in spawns if get_distance(position, s['position']) <= distance and s['count'][0] < s['count'][1]]
+    if not elgible_spawns:
+        return None
+
+    return [s for s in elgible_spawns if s['position'] == min([p['position'] for p in elgible_spawns])][0]
+
+def get_free_position_scanned(tiles, position, lift):
+    position = list(position)
+
+    collide_tiles = True
+    while collide_tiles:
+        collide_tiles = []
+        for tile in tiles:
+            if tile.rect.collidepoint(position):
+                position[1] -= tile.rect.height * lift
+                collide_tiles.append(tile)
+
+    return position
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--spawns', type=int, default=200)
+    parser.add_argument('--area', default='caverns')
+    parser.add_argument('--floor', default='floor-1')
+    args = parser.parse_args()
+
+    init_pygame()
+
+    from scripts.tilemap_loader import load_tilemap
+    from scripts.core_systems.navigation import NavGrid
+    from scripts.core_systems.spawner import Spawner
+    from scripts.tools.rng import Rng
+
+    tilemap = load_tilemap(args.area, args.floor)
+    NavGrid.load(tilemap['tiles'], tilemap['surface'].get_size(), tilemap['tile_dimensions'][0])
+
+    tiles = [tile for tile in tilemap['tiles'] if tile.sprite_id == 'tile']
+    width, height = tilemap['surface'].get_size()
+
+    Rng.seed(0)
+    spawns = [{'position': [Rng.randint(0, width), Rng.randint(0, height)], 'count': [0, 3], 'enemy': 1} for _ in range(args.spawns)]
+    positions = [[Rng.randint(0, width), Rng.randint(0, height)] for _ in range(args.queries)]
+
+    Spawner.load(spawns, 500)
+
+    start = time.perf_counter_ns()
+    scanned = [get_spawn_scanned(spawns, position, 500) for position in positions]
+    scan_us = (time.perf_counter_ns() - start) / 1e3 / args.queries
+
+    start = time.perf_counter_ns()
+    indexed = [Spawner.get_spawn(position, 500) for position in positions]
+    index_us = (time.perf_counter_ns() - start) / 1e3 / args.queries
+
+    print(f'[SPAWNER] {args.spawns} spawn points, {args.queries} lookups on {args.area}/{args.floor}')
+    print(f'[SPAWNER] spawn lookup: scanned {scan_us:.1f} us  indexed {index_us:.1f} us, {sum(a is b for a, b in zip(scanned, indexed))} picks match')
+
+    start = time.perf_counter_ns()
+    for position in positions:
+        get_free_position_scanned(tiles, position, 4)
+
+    scan_us = (time.perf_counter_ns() - start) / 1e3 / args.queries
+
+    start = time.perf_counter_ns()
+    for position in positions:
+        Spawner.get_free_position(position, 4)
+
+    grid_us = (time.perf_counter_ns() - start) / 1e3 / args.queries
+
+    print(f'[SPAWNER] free placement: tile scan {scan_us:.1f} us  grid {grid_us:.1f} us')
+
+    Spawner.reset()
+    NavGrid.reset()
+
+if __name__ == '__main__':
+    main()
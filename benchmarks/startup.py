@@ -0,0 +1,73 @@
+from benchmarks import init_pygame
+
+import subprocess
+import tempfile
+import json
+import time
+import sys
+import os
+
+def run_startup(mode, cache_path):
+    timings = {}
+
+    start = time.perf_counter()
+    screen, clock = init_pygame()
+
+    from scripts.tools.asset_cache import AssetCache
+    AssetCache.init(enabled=mode != 'off', path=cache_path)
+
+    from scripts.tools.sfx_manager import Sfx
+    from scripts.tools.fonts import Fonts
+    from scripts.tools.inputs import Inputs
+    from scripts.scene_handler import SceneHandler
+
+    timings['imports'] = time.perf_counter() - start
+
+    section = time.perf_counter()
+    Sfx.init()
+    Fonts.init()
+    Inputs.init()
+    timings['tools_init'] = time.perf_counter() - section
+
+    section = time.perf_counter()
+    SceneHandler(screen, clock)
+    timings['scene_handler'] = time.perf_counter() - section
+
+    timings['total'] = time.perf_counter() - start
+
+    return {
+        'mode': mode,
+        'timings_ms': {k: round(v * 1000, 2) for k, v in timings.items()},
+        'cache': AssetCache.stats
+    }
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--child':
+        print(json.dumps(run_startup(sys.argv[2], sys.argv[3])))
+        return
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    results = {}
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        for mode in ['off', 'cold', 'warm']:
+            results[mode] = []
+
+            for _ in range(runs):
+                if mode == 'cold':
+                    for file in os.listdir(cache_path):
+                        os.remove(os.path.join(cache_path, file))
+
+                output = subprocess.run(
+                    [sys.executable, '-m', 'benchmarks.startup', '--child', mode, cache_path],
+                    capture_output=True, text=True, check=True
+                ).stdout
+
+                results[mode].append(json.loads(output.strip().splitlines()[-1]))
+
+    for mode, runs in results.items():
+        totals = sorted(r['timings_ms']['total'] for r in runs)
+        print(f'[STARTUP] {mode:>4}: median {totals[len(totals) // 2]:.1f} ms, min {totals[0]:.1f} ms, cache {runs[-1]["cache"]}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Equips every talent on a floor full of sentries and reports dispatch counts and the time spent dispatching
+from benchmarks import init_pygame
+from benchmarks.scenarios import SEED, setup_sentry_swarm, set_player_immune
+
+import argparse
+import time
+
+def equip_all_talents(scene):
+    from scripts.core_systems.talents import get_all_talents, add_talent
+
+    for talent in get_all_talents():
+        add_talent(scene.player, talent(scene, scene.player))
+
+def scan_talents(player, call):
+    return [talent for talent in player.talents if call in talent.TALENT_CALLS]
+
+def time_lookups(player, calls, repeat=20000):
+    start = time.perf_counter_ns()
+    for _ in range(repeat):
+        for call in calls:
+            scan_talents(player, call)
+
+    scan_ns = (time.perf_counter_ns() - start) / (repeat * len(calls))
+
+    talent_calls = player.talent_calls
+    start = time.perf_counter_ns()
+    for _ in range(repeat):
+        for call in calls:
+            talent_calls.get(call)
+
+    table_ns = (time.perf_counter_ns() - start) / (repeat * len(calls))
+
+    return round(scan_ns), round(table_ns)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    screen, clock = init_pygame()
+
+    from scripts.headless import create_scene_handler
+    from scripts.core_systems import talents
+    from scripts.core_systems.talents import TalentCalls
+    from scripts.tools.input_source import ScriptedInput, wander_script
+    from scripts.tools.rng import Rng
+
+    Rng.seed(SEED)
+
+    scene_handler = create_scene_handler(screen, clock, ScriptedInput(wander_script), False)
+    scene = scene_handler.current_scene
+
+    setup_sentry_swarm(scene)
+    equip_all_talents(scene)
+
+    dispatch = {'ns': 0, 'depth': 0}
+    call_talents = talents.call_talents
+
+    def timed_call_talents(scene, player, calls):
+        dispatch['depth'] += 1
+        start = time.perf_counter_ns()
+
+        try:
+            call_talents(scene, player, calls)
+
+        finally:
+            dispatch['depth'] -= 1
+            if not dispatch['depth']:
+                dispatch['ns'] += time.perf_counter_ns() - start
+
+    talents.call_talents = timed_call_talents
+    for module in ['scripts.core_systems.abilities', 'scripts.entities.player']:
+        __import__(module, fromlist=['call_talents']).call_talents = timed_call_talents
+
+    TalentCalls.reset()
+
+    start = time.perf_counter_ns()
+    for _ in range(args.frames):
+        set_player_immune(scene)
+        scene_handler.update(1)
+
+    frame_ms = (time.perf_counter_ns() - start) / args.frames / 1e6
+
+    print(f'[TALENTS] {len(scene.player.talents)} talents, {len(scene.player.talent_calls)} subscribed calls')
+    print(f'[TALENTS] frame {frame_ms:.2f} ms, dispatch {dispatch["ns"] / args.frames / 1e3:.1f} us per frame')
+
+    for call, (count, notified) in TalentCalls.get_report().items():
+        print(f'[TALENTS] {call:<32} {count / args.frames:>7.2f} per frame, {notified / args.frames:>7.2f} talents notified')
+
+    scan_ns, table_ns = time_lookups(scene.player, list(TalentCalls.counts.keys()))
+    print(f'[TALENTS] lookup per call: scan {scan_ns} ns, table {table_ns} ns')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Tweens x, y and alpha on a batch of frames and times one tick of the table step against the per-sprite evaluation it replaced
+from benchmarks import init_pygame
+
+import argparse
+import time
+
+def step_per_sprite(infos, dt):
+    from scripts.tools.bezier import get_bezier_point
+
+    for sprite, prop, info in infos:
+        if info['f'][0] >= info['f'][1]:
+            continue
+
+        value = info['p_0'] + (info['p_1'] - info['p_0']) * get_bezier_point(info['f'][0] / info['f'][1], *info['b'])
+        if prop == 'x':
+            sprite.rect.x = value
+
+        elif prop == 'y':
+            sprite.rect.y = value
+
+        else:
+            sprite.image.set_alpha(value)
+
+        info['f'][0] += 1 * dt
+
+def create_frames(count):
+    from scripts.ui.frame import Frame
+
+    return [Frame((i % 40 * 30, i // 40 * 30), (255, 255, 255), (24, 24), 1) for i in range(count)]
+
+def start_tweens(frames, length):
+    from scripts.tools.bezier import presets
+
+    for frame in frames:
+        frame.set_x_bezier(frame.rect.x + 100, length, presets['ease_out'])
+        frame.set_y_bezier(frame.rect.y + 100, length, presets['ease_out'])
+        frame.set_alpha_bezier(0, length, [*presets['rest'], 0])
+
+def time_table(frames, length, backend):
+    from scripts.core_systems import tweens
+    from scripts.core_systems.tweens import Tweens
+
+    numpy = tweens.numpy
+    if backend == 'rows':
+        tweens.numpy = None
+
+    try:
+        Tweens.reset()
+        start_tweens(frames, length)
+
+        start = time.perf_counter_ns()
+        for _ in range(length):
+            Tweens.step(1, 1)
+
+        return (time.perf_counter_ns() - start) / length / 1e3
+
+    finally:
+        tweens.numpy = numpy
+        Tweens.reset()
+
+def time_per_sprite(frames, length):
+    from scripts.tools.bezier import presets
+
+    infos = []
+    for frame in frames:
+        infos.append([frame, 'x', {'p_0': frame.rect.x, 'p_1': frame.rect.x + 100, 'f': [0, length], 'b': presets['ease_out']}])
+        infos.append([frame, 'y', {'p_0': frame.rect.y, 'p_1': frame.rect.y + 100, 'f': [0, length], 'b': presets['ease_out']}])
+        infos.append([frame, 'alpha', {'p_0': 255, 'p_1': 0, 'f': [0, length], 'b': [*presets['rest'], 0]}])
+
+    start = time.perf_counter_ns()
+    for _ in range(length):
+        step_per_sprite(infos, 1)
+
+    return (time.perf_counter_ns() - start) / length / 1e3
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sprites', type=int, default=500)
+    parser.add_argument('--frames', type=int, default=60)
+    args = parser.parse_args()
+
+    init_pygame()
+
+    from scripts.core_systems import tweens
+
+    frames = create_frames(args.sprites)
+    print(f'[TWEENS] {args.sprites} sprites, {args.sprites * 3} tweens over {args.frames} frames')
+
+    print(f'[TWEENS] per sprite: {time_per_sprite(frames, args.frames):.1f} us per tick')
+    print(f'[TWEENS] table (rows): {time_table(frames, args.frames, "rows"):.1f} us per tick')
+
+    if tweens.numpy is not None:
+        print(f'[TWEENS] table (numpy): {time_table(frames, args.frames, "numpy"):.1f} us per tick')
+
+if __name__ == '__main__':
+    main()
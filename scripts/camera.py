@@ -1,9 +1,9 @@
 from scripts import SCREEN_DIMENSIONS
 
 from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.rng import Rng
 
 import pygame
-import random
 
 class CameraTemplate:
     def __init__(self, focus):
@@ -52,8 +52,8 @@ class BoxCamera(CameraTemplate):
             abs_prog = self.camera_shake_info['frames'] / self.camera_shake_info['max_frames']
             intensity = round((self.camera_shake_info['intensity']) * get_bezier_point(abs_prog, *presets['rest'], 0))
 
-            camera_shake[0] = random.randint(-intensity, intensity)
-            camera_shake[1] = random.randint(-intensity, intensity)
+            camera_shake[0] = Rng.randint(-intensity, intensity)
+            camera_shake[1] = Rng.randint(-intensity, intensity)
 
             self.camera_shake_info['frames'] -= 1 * dt
 
@@ -12,9 +12,10 @@ from scripts.ui.card import Card
 
 from scripts.tools import check_line_collision, check_pixel_collision, get_distance, get_sprite_colors
 from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.asset_loader import AssetLoader
+from scripts.tools.rng import Rng
 
 import pygame
-import random
 import inspect
 import math
 import sys
@@ -183,12 +184,12 @@ class PrimaryAttack(Ability):
 
         for color in get_sprite_colors(tile):
             color[3] = 255
-            cir = Circle(pos, color, random.randint(5, 8), 0)
+            cir = Circle(pos, color, Rng.randint(5, 8), 0)
             cir.set_goal(
                         60, 
                         position=(
-                            pos[0] + random.randint(-150, 150) + self.character.velocity[0] * 10, 
-                            pos[1] + random.randint(-25, 25) + self.character.velocity[1] * 10
+                            pos[0] + Rng.randint(-150, 150) + self.character.velocity[0] * 10, 
+                            pos[1] + Rng.randint(-25, 25) + self.character.velocity[1] * 10
                         ), 
                         radius=0, 
                         width=0
@@ -228,10 +229,10 @@ class PrimaryAttack(Ability):
         pos = overlap.center
         
         for _ in range(5):
-            cir = Circle(pos, self.ability_info['color'], random.randint(4, 8), 0)
+            cir = Circle(pos, self.ability_info['color'], Rng.randint(4, 8), 0)
             cir.set_goal(
                         75, 
-                        position=(pos[0] + random.randint(-250, 250), pos[1] + random.randint(-250, 250)), 
+                        position=(pos[0] + Rng.randint(-250, 250), pos[1] + Rng.randint(-250, 250)), 
                         radius=0, 
                         width=0
                     )
@@ -322,7 +323,7 @@ class PrimaryAttack(Ability):
             cir = Circle(pos, self.ability_info['color'], 6, 0)
             cir.set_goal(
                         50, 
-                        position=(pos[0] + random.randint(-100, 100), pos[1] + random.randint(-100, 100)), 
+                        position=(pos[0] + Rng.randint(-100, 100), pos[1] + Rng.randint(-100, 100)), 
                         radius=0, 
                         width=0
                     )
@@ -352,8 +353,8 @@ class PrimaryAttack(Ability):
             cir.set_goal(
                         125, 
                         position=(
-                            pos[0] + random.randint(-150, 150) + (self.character.velocity[0] * 10), 
-                            pos[1] + random.randint(-150, 150) + (self.character.velocity[1] * 10)
+                            pos[0] + Rng.randint(-150, 150) + (self.character.velocity[0] * 10), 
+                            pos[1] + Rng.randint(-150, 150) + (self.character.velocity[1] * 10)
                         ), 
                         radius=0, 
                         width=0
@@ -455,8 +456,8 @@ class PrimaryAttack(Ability):
                     cir.set_goal(
                                 125, 
                                 position=(
-                                    pos[0] + random.randint(-150, 150) + (self.character.velocity[0] * 10), 
-                                    pos[1] + random.randint(-150, 150) + (self.character.velocity[1] * 10)
+                                    pos[0] + Rng.randint(-150, 150) + (self.character.velocity[0] * 10), 
+                                    pos[1] + Rng.randint(-150, 150) + (self.character.velocity[1] * 10)
                                 ), 
                                 radius=0, 
                                 width=0
@@ -495,7 +496,7 @@ class PrimaryAttack(Ability):
                         75, 
                         position=(
                             pos[0] + (self.character.velocity[0] * 10), 
-                            pos[1] + random.randint(-150, 150) + (self.character.velocity[1] * 10)
+                            pos[1] + Rng.randint(-150, 150) + (self.character.velocity[1] * 10)
                         ), 
                         radius=0, 
                         width=0
@@ -534,7 +535,7 @@ class RainOfArrows(Ability):
         super().__init__(character)
 
         IMG_SCALE = 1.5
-        img = pygame.image.load(os.path.join('resources', 'images', 'entities', 'projectiles', 'rain-of-arrows.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'entities', 'projectiles', 'rain-of-arrows.png'))
         img.set_colorkey((0, 0, 0))
 
         self.ability_info['active'] = False
@@ -618,8 +619,8 @@ class RainOfArrows(Ability):
             self.ability_info['spawn_info']['rate'][0] = 0
 
             pos = self.ability_info['spawn_info']['position'].copy()
-            pos[0] += random.randint(-self.ability_info['spawn_info']['variation'][0], self.ability_info['spawn_info']['variation'][0])
-            pos[1] += random.randint(-self.ability_info['spawn_info']['variation'][1], self.ability_info['spawn_info']['variation'][1])
+            pos[0] += Rng.randint(-self.ability_info['spawn_info']['variation'][0], self.ability_info['spawn_info']['variation'][0])
+            pos[1] += Rng.randint(-self.ability_info['spawn_info']['variation'][1], self.ability_info['spawn_info']['variation'][1])
 
             projectile = ProjectileStandard(
                 pos,
@@ -701,10 +702,10 @@ class IntangibleShroud(Ability):
         particles = []
         pos = self.character.center_position
         for _ in range(6):
-            cir = Circle(pos, (255, 255, 255), random.randint(6, 8), 0)
+            cir = Circle(pos, (255, 255, 255), Rng.randint(6, 8), 0)
             cir.set_goal(
                         75, 
-                        position=(pos[0] + random.randint(-75, 75), pos[1] + random.randint(-75, 75)), 
+                        position=(pos[0] + Rng.randint(-75, 75), pos[1] + Rng.randint(-75, 75)), 
                         radius=0, 
                         width=0
                     )
@@ -735,10 +736,10 @@ class IntangibleShroud(Ability):
             particles = []
             pos = self.character.center_position
             for _ in range(3):
-                cir = Circle(pos, (255, 255, 255), random.randint(4, 6), 0)
+                cir = Circle(pos, (255, 255, 255), Rng.randint(4, 6), 0)
                 cir.set_goal(
                             60, 
-                            position=(pos[0] + random.randint(-50, 50), pos[1] + random.randint(-50, 50)), 
+                            position=(pos[0] + Rng.randint(-50, 50), pos[1] + Rng.randint(-50, 50)), 
                             radius=0, 
                             width=0
                         )
@@ -776,7 +777,7 @@ class HolyJavelin(Ability):
         super().__init__(character)
 
         IMG_SCALE = 2.5
-        img = pygame.image.load(os.path.join('resources', 'images', 'entities', 'projectiles', 'holy-javelin.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'entities', 'projectiles', 'holy-javelin.png'))
 
         self.ability_info['cooldown_timer'] = 4
 
@@ -849,8 +850,8 @@ class HolyJavelin(Ability):
             cir.set_goal(
                         round(self.ability_info['explosion_intensity'] * 3), 
                         position=(
-                            pos[0] + random.randint(-self.ability_info['explosion_range'], self.ability_info['explosion_range']), 
-                            pos[1] + random.randint(-self.ability_info['explosion_range'], self.ability_info['explosion_range'])
+                            pos[0] + Rng.randint(-self.ability_info['explosion_range'], self.ability_info['explosion_range']), 
+                            pos[1] + Rng.randint(-self.ability_info['explosion_range'], self.ability_info['explosion_range'])
                         ), 
 
                         radius=0, 
@@ -897,10 +898,12 @@ class HolyJavelin(Ability):
                     ]
                 ]
 
-            rotate_img = pygame.transform.rotate(img, self.ability_info['rotate_info'][0])
-            rotate_img.set_alpha(255 * get_bezier_point(percen, *presets['ease_out']))
+            if scene.render:
+                rotate_img = pygame.transform.rotate(img, self.ability_info['rotate_info'][0])
+                rotate_img.set_alpha(255 * get_bezier_point(percen, *presets['ease_out']))
+
+                scene.draw_list.blit('entity', rotate_img, rotate_img.get_rect(center=self.ability_info['rotate_info'][1]), motion=self.character.get_tick_motion(), owned=True)
 
-            scene.entity_surface.blit(rotate_img, rotate_img.get_rect(center=self.ability_info['rotate_info'][1]))
             return
         
         self.ability_info['countdown'][1] = 0
@@ -931,8 +934,8 @@ class HolyJavelin(Ability):
             cir.set_goal(
                         100, 
                         position=(
-                            pos[0] + random.randint(-150, 150) + (vel[0] * 10), 
-                            pos[1] + random.randint(-150, 150) + (vel[1] * 10)
+                            pos[0] + Rng.randint(-150, 150) + (vel[0] * 10), 
+                            pos[1] + Rng.randint(-150, 150) + (vel[1] * 10)
                         ), 
                         radius=0, 
                         width=0
@@ -0,0 +1,31 @@
+import pygame
+
+# Entities outside the active region around the camera are asleep and skip their display entirely
+class Activation:
+    enabled = True
+
+    margin = [128, 128]
+
+    region = pygame.Rect(0, 0, 0, 0)
+    target_position = [0, 0]
+
+    asleep = 0
+
+    def update(view, target_position):
+        Activation.region = view.inflate(Activation.margin[0] * 2, Activation.margin[1] * 2)
+        Activation.target_position = target_position
+        Activation.asleep = 0
+
+    def is_awake(sprite):
+        if not Activation.enabled or sprite.ALWAYS_AWAKE or Activation.region.colliderect(sprite.rect):
+            return True
+
+        if sprite.WAKE_RADIUS is not None:
+            dx = sprite.rect.centerx - Activation.target_position[0]
+            dy = sprite.rect.centery - Activation.target_position[1]
+
+            if dx * dx + dy * dy <= sprite.WAKE_RADIUS * sprite.WAKE_RADIUS:
+                return True
+
+        Activation.asleep += 1
+        return False
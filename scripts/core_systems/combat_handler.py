@@ -1,12 +1,140 @@
-import random
+from scripts.tools.rng import Rng
+
+import math
 
 DAMAGE_TYPES = ['contact', 'physical', 'magical', 'special']
 HEAL_TYPES = ['passive', 'status', 'special']
 
 DAMAGE_VARIATION_PERCENTAGE = .1
 
+class CombatTimers:
+    SLOTS = 512
+
+    time = 0
+    slots = [[] for _ in range(SLOTS)]
+
+    def reset():
+        CombatTimers.time = 0
+        CombatTimers.slots = [[] for _ in range(CombatTimers.SLOTS)]
+
+    def advance(dt):
+        start = math.floor(CombatTimers.time)
+        CombatTimers.time += dt
+
+        for tick in range(start + 1, math.floor(CombatTimers.time) + 1):
+            slot = CombatTimers.slots[tick % CombatTimers.SLOTS]
+            if not slot:
+                continue
+
+            due = [timer for timer in slot if timer[0] <= CombatTimers.time]
+            if not due:
+                continue
+
+            slot[:] = [timer for timer in slot if timer[0] > CombatTimers.time]
+            for _, group, name, entry in due:
+                group.expire(name, entry)
+
+    # The slot of the current tick has already been run, so anything due now waits for the next one
+    def schedule(frames, group, name, entry):
+        deadline = CombatTimers.time + frames
+        slot = max(math.ceil(deadline), math.floor(CombatTimers.time) + 1)
+
+        CombatTimers.slots[slot % CombatTimers.SLOTS].append([deadline, group, name, entry])
+
+# Timed immunities are stored as the time they run out, every way of reading one gives the frames left
+class Immunities(dict):
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if '&' in key:
+            return value
+
+        return max(value - CombatTimers.time, 0)
+
+    def __setitem__(self, key, value):
+        if '&' not in key:
+            value = CombatTimers.time + value
+
+        super().__setitem__(key, value)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    # The copy shares the deadlines, so it keeps counting down with the original
+    def copy(self):
+        immunities = Immunities()
+        dict.update(immunities, self)
+
+        return immunities
+
+class Mitigations(dict):
+    def __init__(self, timed):
+        super().__init__()
+
+        self.timed = timed
+        self.total = 0
+
+    def __setitem__(self, name, value):
+        super().__setitem__(name, value)
+        self.update_total()
+
+        if self.timed:
+            CombatTimers.schedule(value[1], self, name, value)
+
+    def __delitem__(self, name):
+        super().__delitem__(name)
+        self.update_total()
+
+    def update(self, *args, **kwargs):
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+
+        return self[name]
+
+    def pop(self, name, *default):
+        value = super().pop(name, *default)
+        self.update_total()
+
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.update_total()
+
+        return item
+
+    def clear(self):
+        super().clear()
+        self.update_total()
+
+    def expire(self, name, entry):
+        if self.get(name) is entry:
+            del self[name]
+
+    def update_total(self):
+        self.total = sum(value[0] for value in self.values()) if self.timed else sum(self.values())
+
 def get_immunity_dict():
-    immunity_list = {}
+    immunity_list = Immunities()
 
     for dmg_type in DAMAGE_TYPES:
         immunity_list[dmg_type] = 0
@@ -19,11 +147,11 @@ def get_mitigation_dict():
     mitigation_dict = {}
 
     for dmg_type in DAMAGE_TYPES:
-        mitigation_dict[dmg_type] = {}
-        mitigation_dict[dmg_type + '&'] = {}
+        mitigation_dict[dmg_type] = Mitigations(True)
+        mitigation_dict[dmg_type + '&'] = Mitigations(False)
 
-        mitigation_dict['all'] = {}
-        mitigation_dict['all&'] = {}
+        mitigation_dict['all'] = Mitigations(True)
+        mitigation_dict['all&'] = Mitigations(False)
 
     return mitigation_dict
 
@@ -45,7 +173,7 @@ def register_damage(scene, primary_sprite, secondary_sprite, info, flags={}):
     info['target'] = secondary_sprite
         
     if 'no_variation' not in flags:
-        info['amount'] = random.uniform(
+        info['amount'] = Rng.uniform(
             info['amount'] * (1 - DAMAGE_VARIATION_PERCENTAGE), 
             info['amount'] * (1 + DAMAGE_VARIATION_PERCENTAGE)
             )
@@ -54,23 +182,14 @@ def register_damage(scene, primary_sprite, secondary_sprite, info, flags={}):
 
     info['crit'] = False
     if 'cant_crit' not in flags:
-        if primary_sprite.combat_info['crit_strike_chance'] > 0 and round(random.uniform(0, 1), 2) <= primary_sprite.combat_info['crit_strike_chance']:
+        if primary_sprite.combat_info['crit_strike_chance'] > 0 and round(Rng.uniform(0, 1), 2) <= primary_sprite.combat_info['crit_strike_chance']:
             info['amount'] *= primary_sprite.combat_info['crit_strike_multiplier']
             info['crit'] = True
 
     mitigated_amount = 0
     if 'bypass_mitigation' not in flags:
-        for val in secondary_sprite.combat_info['mitigations'][info['type'] + '&'].values():
-            mitigated_amount += val
-
-        for val in secondary_sprite.combat_info['mitigations'][info['type']].values():
-            mitigated_amount += val[0]
-
-        for val in secondary_sprite.combat_info['mitigations']['all&'].values():
-            mitigated_amount += val
-
-        for val in secondary_sprite.combat_info['mitigations']['all'].values():
-            mitigated_amount += val[0]
+        mitigations = secondary_sprite.combat_info['mitigations']
+        mitigated_amount = mitigations[info['type'] + '&'].total + mitigations[info['type']].total + mitigations['all&'].total + mitigations['all'].total
 
         if mitigated_amount > 1:
             mitigated_amount = 1
@@ -1,52 +1,28 @@
-from scripts.tools import get_distance
+from scripts.tools.rng import Rng
 
-import pygame
-import random
+import itertools
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class AiTemplate:
     def __init__(self, ai_type, sprite):
         self.ai_type = ai_type
         self.sprite = sprite
 
-    def update(self, scene, dt, target):
-        ...
+    def get_destination(self, scene, dt, target_position):
+        return target_position
+
+    def get_movespeed(self, destination):
+        return self.sprite.movement_info['per_frame_movespeed']
 
 class FlyerAi(AiTemplate):
     def __init__(self, sprite):
         super().__init__('flyer', sprite)
 
-    def update(self, scene, dt, target):
-        destination = target.center_position
-        max_ms = self.sprite.movement_info['max_movespeed']
-        ms = self.sprite.movement_info['per_frame_movespeed']
-
-        if self.sprite.rect.x < destination[0]:
-            self.sprite.velocity[0] += ms if self.sprite.velocity[0] < max_ms else 0
-        elif self.sprite.rect.x > destination[0]:
-            self.sprite.velocity[0] -= ms if self.sprite.velocity[0] > -max_ms else 0
-
-        if self.sprite.rect.y <= destination[1]:
-            self.sprite.velocity[1] += ms if self.sprite.velocity[1] < max_ms else 0
-        elif self.sprite.rect.y > destination[1]:
-            self.sprite.velocity[1] -= ms if self.sprite.velocity[1] > -max_ms else 0
-
-        self.sprite.velocity[0] = round(self.sprite.velocity[0], 1)
-        self.sprite.velocity[1] = round(self.sprite.velocity[1], 1)
-
-        if self.sprite.velocity[0] > self.sprite.movement_info['max_movespeed']:
-            if (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed']) < self.sprite.movement_info['friction']:
-                self.sprite.velocity[0] -= (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed'])
-            else:
-                self.sprite.velocity[0] -= (self.sprite.movement_info['friction'])
-
-        elif self.sprite.velocity[0] < -(self.sprite.movement_info['max_movespeed']):
-            if (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed']) < self.sprite.movement_info['friction']:
-                self.sprite.velocity[0] += (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed'])
-
-            else:
-                self.sprite.velocity[0] += (self.sprite.movement_info['friction'])
-
 class FloaterAi(AiTemplate):
     def __init__(self, sprite):
         super().__init__('floater', sprite)
@@ -57,52 +33,33 @@ class FloaterAi(AiTemplate):
         self.destination_update_frames = [90, 90]
         self.destination = None
 
-    def update(self, scene, dt, target):
+    def get_destination(self, scene, dt, target_position):
         if self.destination_update_frames[0] >= self.destination_update_frames[1]:
-            a = (random.randint(self.destination_angle_range[0], self.destination_angle_range[1]) - 180) * math.pi / 180
+            a = (Rng.randint(self.destination_angle_range[0], self.destination_angle_range[1]) - 180) * math.pi / 180
             self.destination = [
-                target.center_position[0] + self.destination_angle_radius * math.cos(a), 
-                target.center_position[1] + self.destination_angle_radius * math.sin(a)
+                target_position[0] + self.destination_angle_radius * math.cos(a),
+                target_position[1] + self.destination_angle_radius * math.sin(a)
             ]
 
             self.destination_update_frames[0] = 0
 
         self.destination_update_frames[0] += 1 * dt
 
-        max_ms = self.sprite.movement_info['max_movespeed']
+        return self.destination
+
+    def get_movespeed(self, destination):
         ms = self.sprite.movement_info['per_frame_movespeed']
 
-        distance = get_distance(self.sprite.true_position, self.destination)
+        dx = destination[0] - self.sprite.rect.x
+        dy = destination[1] - self.sprite.rect.y
+
+        distance = math.sqrt(dx * dx + dy * dy)
         if distance <= 250:
             ms *= .5
         elif distance > 500:
             ms *= 2
 
-        if self.sprite.rect.x < self.destination[0]:
-            self.sprite.velocity[0] += ms if self.sprite.velocity[0] < max_ms else 0
-        elif self.sprite.rect.x > self.destination[0]:
-            self.sprite.velocity[0] -= ms if self.sprite.velocity[0] > -max_ms else 0
-
-        if self.sprite.rect.y <= self.destination[1]:
-            self.sprite.velocity[1] += ms if self.sprite.velocity[1] < max_ms else 0
-        elif self.sprite.rect.y > self.destination[1]:
-            self.sprite.velocity[1] -= ms if self.sprite.velocity[1] > -max_ms else 0
-
-        self.sprite.velocity[0] = round(self.sprite.velocity[0], 1)
-        self.sprite.velocity[1] = round(self.sprite.velocity[1], 1)
-
-        if self.sprite.velocity[0] > self.sprite.movement_info['max_movespeed']:
-            if (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed']) < self.sprite.movement_info['friction']:
-                self.sprite.velocity[0] -= (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed'])
-            else:
-                self.sprite.velocity[0] -= (self.sprite.movement_info['friction'])
-
-        elif self.sprite.velocity[0] < -(self.sprite.movement_info['max_movespeed']):
-            if (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed']) < self.sprite.movement_info['friction']:
-                self.sprite.velocity[0] += (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed'])
-
-            else:
-                self.sprite.velocity[0] += (self.sprite.movement_info['friction'])
+        return ms
 
 class EncircleAi(AiTemplate):
     def __init__(self, sprite):
@@ -120,43 +77,151 @@ class EncircleAi(AiTemplate):
         self.encircle_degrees_speed = 6
         self.encircle_count = 0
 
-    def update(self, scene, dt, target):
+    def get_destination(self, scene, dt, target_position):
         self.encircle_degrees += self.encircle_degrees_speed * dt
         self.encircle_count += 1 * dt
 
         self.encircle_radius = math.sin(self.encircle_count * .01) * 150
 
-        destination = target.center_position
         angle = (self.encircle_degrees - 90) * math.pi / 180
 
-        destination[0] += self.encircle_radius * math.cos(angle)
-        destination[1] += self.encircle_radius * math.sin(angle)
+        return [
+            target_position[0] + self.encircle_radius * math.cos(angle),
+            target_position[1] + self.encircle_radius * math.sin(angle)
+        ]
 
-        max_ms = self.sprite.movement_info['max_movespeed']
-        ms = self.sprite.movement_info['per_frame_movespeed']
+class AiLod:
+    TIERS = ['visible', 'near', 'far']
+    NEAR_INTERVAL = 4
+
+    FAR_INTERVAL = NEAR_INTERVAL * 4
 
-        if self.sprite.rect.x < destination[0]:
-            self.sprite.velocity[0] += ms if self.sprite.velocity[0] < max_ms else 0
-        elif self.sprite.rect.x > destination[0]:
-            self.sprite.velocity[0] -= ms if self.sprite.velocity[0] > -max_ms else 0
+    enabled = True
 
-        if self.sprite.rect.y <= destination[1]:
-            self.sprite.velocity[1] += ms if self.sprite.velocity[1] < max_ms else 0
-        elif self.sprite.rect.y > destination[1]:
-            self.sprite.velocity[1] -= ms if self.sprite.velocity[1] > -max_ms else 0
+    frame = 0
 
-        self.sprite.velocity[0] = round(self.sprite.velocity[0], 1)
-        self.sprite.velocity[1] = round(self.sprite.velocity[1], 1)
+    sequence = itertools.count()
+
+    def reset():
+        AiLod.frame = 0
+        AiLod.sequence = itertools.count()
+
+    def get_lod_info():
+        return {
+            'tier': 'visible',
+            'dt': 0,
+            'steps': 1,
+            'pending': [0, 0],
+            'offset': next(AiLod.sequence) % AiLod.FAR_INTERVAL
+        }
 
-        if self.sprite.velocity[0] > self.sprite.movement_info['max_movespeed']:
-            if (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed']) < self.sprite.movement_info['friction']:
-                self.sprite.velocity[0] -= (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed'])
+    def update(enemies, visible_view, near_view, dt):
+        AiLod.frame += 1
+
+        # Paused ticks move nothing, so there is nothing to catch up on for them
+        step = 1 if dt else 0
+
+        for enemy in enemies:
+            info = enemy.lod_info
+
+            if not AiLod.enabled or visible_view.colliderect(enemy.rect):
+                info['tier'] = 'visible'
+                interval = 1
+            elif near_view.colliderect(enemy.rect):
+                info['tier'] = 'near'
+                interval = AiLod.NEAR_INTERVAL
             else:
-                self.sprite.velocity[0] -= (self.sprite.movement_info['friction'])
+                info['tier'] = 'far'
+                interval = AiLod.FAR_INTERVAL
+
+            enemy.visible = info['tier'] == 'visible'
 
-        elif self.sprite.velocity[0] < -(self.sprite.movement_info['max_movespeed']):
-            if (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed']) < self.sprite.movement_info['friction']:
-                self.sprite.velocity[0] += (abs(self.sprite.velocity[0]) - self.sprite.movement_info['max_movespeed'])
+            if (AiLod.frame + info['offset']) % interval == 0:
+                info['dt'] = info['pending'][0] + dt
+                info['steps'] = info['pending'][1] + step
+                info['pending'] = [0, 0]
 
             else:
-                self.sprite.velocity[0] += (self.sprite.movement_info['friction'])
\ No newline at end of file
+                info['dt'] = None
+                info['pending'][0] += dt
+                info['pending'][1] += step
+
+    def get_counts(enemies):
+        counts = dict.fromkeys(AiLod.TIERS, 0)
+        for enemy in enemies:
+            counts[enemy.lod_info['tier']] += 1
+
+        return counts
+
+class AiSystem:
+    COLUMNS = 10
+
+    def update(scene, target):
+        groups = {}
+        for enemy in scene.get_sprites('enemy'):
+            if not enemy.active or enemy.ai is None or enemy.lod_info['dt'] is None:
+                continue
+
+            groups.setdefault(enemy.ai.ai_type, []).append(enemy.ai)
+
+        target_position = target.center_position
+        for ais in groups.values():
+            if numpy is None:
+                for ai in ais:
+                    destination = ai.get_destination(scene, ai.sprite.lod_info['dt'], target_position)
+                    AiSystem.steer(ai.sprite, destination, ai.get_movespeed(destination), ai.sprite.lod_info['steps'])
+
+            else:
+                AiSystem.steer_group(ais, scene, target_position)
+
+    # Velocities are rounded the way numpy.round does it, so both paths agree and replays stay in sync across them
+    def steer(sprite, destination, ms, steps):
+        velocity = sprite.velocity
+        max_ms = sprite.movement_info['max_movespeed']
+        friction = sprite.movement_info['friction']
+
+        direction = [
+            1 if sprite.rect.x < destination[0] else -1 if sprite.rect.x > destination[0] else 0,
+            1 if sprite.rect.y <= destination[1] else -1
+        ]
+
+        for i in range(2):
+            if direction[i] * velocity[i] < max_ms:
+                velocity[i] += direction[i] * ms * min(steps, math.ceil((max_ms - direction[i] * velocity[i]) / ms))
+
+            velocity[i] = round(velocity[i] * 10) / 10
+
+        excess = abs(velocity[0]) - max_ms
+        if excess > 0:
+            velocity[0] -= math.copysign(min(excess, friction * steps), velocity[0])
+
+    def steer_group(ais, scene, target_position):
+        values = []
+        for ai in ais:
+            sprite = ai.sprite
+            destination = ai.get_destination(scene, sprite.lod_info['dt'], target_position)
+
+            values.extend([
+                sprite.rect.x, sprite.rect.y, sprite.velocity[0], sprite.velocity[1], destination[0], destination[1],
+                ai.get_movespeed(destination), sprite.movement_info['max_movespeed'], sprite.movement_info['friction'], sprite.lod_info['steps']
+            ])
+
+        table = numpy.array(values, dtype=float).reshape(-1, AiSystem.COLUMNS)
+
+        positions = table[:, 0:2]
+        velocities = table[:, 2:4]
+        destinations = table[:, 4:6]
+        ms, max_ms, friction, steps = table[:, 6:7], table[:, 7:8], table[:, 8], table[:, 9:10]
+
+        direction = numpy.sign(destinations - positions)
+        direction[:, 1][direction[:, 1] == 0] = 1
+
+        headroom = max_ms - direction * velocities
+        accelerate = numpy.where(headroom > 0, numpy.minimum(steps, numpy.ceil(headroom / ms)), 0)
+        velocities = numpy.round(velocities + direction * ms * accelerate, 1)
+
+        excess = numpy.abs(velocities[:, 0]) - max_ms[:, 0]
+        velocities[:, 0] -= numpy.where(excess > 0, numpy.copysign(numpy.minimum(excess, friction * steps[:, 0]), velocities[:, 0]), 0)
+
+        for ai, velocity in zip(ais, velocities.tolist()):
+            ai.sprite.velocity[0], ai.sprite.velocity[1] = velocity
@@ -0,0 +1,88 @@
+from scripts.core_systems.navigation import NavGrid
+
+class LineOfSight:
+    OPAQUE = (NavGrid.BLOCK, NavGrid.PLATFORM, NavGrid.KILLBRICK)
+
+    BUDGET = 16
+
+    CACHE_LIMIT = 50000
+
+    cache = {}
+    budget = BUDGET
+
+    def reset():
+        LineOfSight.cache = {}
+        LineOfSight.budget = LineOfSight.BUDGET
+
+    def refill():
+        LineOfSight.budget = LineOfSight.BUDGET
+
+    def get_cell(position):
+        x = min(max(int(position[0] // NavGrid.cell_size), 0), NavGrid.width - 1)
+        y = min(max(int(position[1] // NavGrid.cell_size), 0), NavGrid.height - 1)
+
+        return y * NavGrid.width + x
+
+    # True when nothing opaque lies between the points, default when the answer is not cached and the tick's budget is spent
+    def check(start, end, default=None):
+        start_cell = LineOfSight.get_cell(start)
+        end_cell = LineOfSight.get_cell(end)
+
+        key = (start_cell, end_cell) if start_cell <= end_cell else (end_cell, start_cell)
+
+        clear = LineOfSight.cache.get(key)
+        if clear is not None:
+            return clear
+
+        if LineOfSight.budget <= 0:
+            return default
+
+        LineOfSight.budget -= 1
+
+        if len(LineOfSight.cache) >= LineOfSight.CACHE_LIMIT:
+            LineOfSight.cache = {}
+
+        clear = LineOfSight.trace(*key)
+        LineOfSight.cache[key] = clear
+
+        return clear
+
+    def trace(start_cell, end_cell):
+        width = NavGrid.width
+        cells = NavGrid.cells
+        opaque = LineOfSight.OPAQUE
+
+        x, y = start_cell % width, start_cell // width
+        end_x, end_y = end_cell % width, end_cell // width
+
+        nx, ny = abs(end_x - x), abs(end_y - y)
+        sx, sy = 1 if end_x > x else -1, 1 if end_y > y else -1
+
+        if cells[start_cell] in opaque:
+            return False
+
+        ix = iy = 0
+        while ix < nx or iy < ny:
+            decision = (1 + 2 * ix) * ny - (1 + 2 * iy) * nx
+
+            if decision == 0:
+                if cells[y * width + x + sx] in opaque or cells[(y + sy) * width + x] in opaque:
+                    return False
+
+                x += sx
+                y += sy
+                ix += 1
+                iy += 1
+
+            elif decision < 0:
+                x += sx
+                ix += 1
+
+            else:
+                y += sy
+                iy += 1
+
+            if cells[y * width + x] in opaque:
+                return False
+
+        return True
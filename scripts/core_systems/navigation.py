@@ -0,0 +1,39 @@
+class NavGrid:
+    EMPTY, BLOCK, RAMP, PLATFORM, KILLBRICK = 0, 1, 2, 3, 4
+    SOLIDS = {'block': BLOCK, 'ramp': RAMP, 'platform': PLATFORM, 'killbrick': KILLBRICK}
+
+    cell_size = 64
+    width = 0
+    height = 0
+    cells = bytearray()
+
+    def reset():
+        NavGrid.width = 0
+        NavGrid.height = 0
+        NavGrid.cells = bytearray()
+
+    def load(tiles, dimensions, cell_size):
+        NavGrid.reset()
+
+        NavGrid.cell_size = cell_size
+        NavGrid.width = -(-dimensions[0] // cell_size)
+        NavGrid.height = -(-dimensions[1] // cell_size)
+        NavGrid.cells = bytearray(NavGrid.width * NavGrid.height)
+
+        for tile in tiles:
+            kind = NavGrid.SOLIDS.get(getattr(tile, 'secondary_sprite_id', None))
+            if tile.sprite_id != 'tile' or kind is None:
+                continue
+
+            for y in range(max(tile.rect.top // cell_size, 0), min((tile.rect.bottom - 1) // cell_size + 1, NavGrid.height)):
+                for x in range(max(tile.rect.left // cell_size, 0), min((tile.rect.right - 1) // cell_size + 1, NavGrid.width)):
+                    NavGrid.cells[y * NavGrid.width + x] = kind
+
+    def get_cell(position):
+        x = int(position[0] // NavGrid.cell_size)
+        y = int(position[1] // NavGrid.cell_size)
+
+        if not (0 <= x < NavGrid.width and 0 <= y < NavGrid.height):
+            return None
+
+        return y * NavGrid.width + x
@@ -0,0 +1,80 @@
+import itertools
+import heapq
+
+class Timer:
+    __slots__ = ['due', 'fn', 'args', 'owner', 'cancelled']
+
+    def __init__(self, due, fn, args, owner):
+        self.due = due
+        self.fn = fn
+        self.args = args
+        self.owner = owner
+        self.cancelled = False
+
+class Scheduler:
+    CLOCKS = ['scene', 'entity']
+
+    clocks = dict.fromkeys(CLOCKS, 0)
+    queues = {clock: [] for clock in CLOCKS}
+
+    owners = {}
+
+    sequence = itertools.count()
+
+    def reset():
+        Scheduler.clocks = dict.fromkeys(Scheduler.CLOCKS, 0)
+        Scheduler.queues = {clock: [] for clock in Scheduler.CLOCKS}
+        Scheduler.owners = {}
+
+    def schedule(frames, fn, args=[], clock='scene', owner=None):
+        timer = Timer(Scheduler.clocks[clock] + frames, fn, args, owner)
+        heapq.heappush(Scheduler.queues[clock], (timer.due, next(Scheduler.sequence), timer))
+
+        if owner is not None:
+            Scheduler.owners.setdefault(owner, set()).add(timer)
+
+        return timer
+
+    def cancel(timer):
+        timer.cancelled = True
+        Scheduler.release(timer)
+
+    def cancel_owner(owner):
+        timers = Scheduler.owners.pop(owner, None)
+        if not timers:
+            return
+
+        for timer in timers:
+            timer.cancelled = True
+
+    def release(timer):
+        if timer.owner is None:
+            return
+
+        timers = Scheduler.owners.get(timer.owner)
+        if timers is None:
+            return
+
+        timers.discard(timer)
+        if not timers:
+            del Scheduler.owners[timer.owner]
+
+    # A reset from inside a fired call leaves the queue being drained to finish on its own
+    def advance(clock, dt):
+        Scheduler.clocks[clock] += dt
+
+        time = Scheduler.clocks[clock]
+        queue = Scheduler.queues[clock]
+
+        while queue and queue[0][0] <= time:
+            timer = heapq.heappop(queue)[2]
+            if timer.cancelled:
+                continue
+
+            Scheduler.release(timer)
+
+            if timer.fn:
+                timer.fn(*timer.args)
+
+    def get_counts():
+        return {clock: len(queue) for clock, queue in Scheduler.queues.items()}
@@ -0,0 +1,66 @@
+from scripts.core_systems.navigation import NavGrid
+
+import collections
+
+class Spawner:
+    BUDGET = 3
+
+    bucket_size = 500
+    buckets = {}
+
+    pending = collections.deque()
+
+    def reset():
+        Spawner.buckets = {}
+        Spawner.pending = collections.deque()
+
+    def load(spawns, bucket_size):
+        Spawner.reset()
+        Spawner.bucket_size = bucket_size
+
+        for index, spawn in enumerate(spawns):
+            key = (int(spawn['position'][0] // bucket_size), int(spawn['position'][1] // bucket_size))
+            Spawner.buckets.setdefault(key, []).append((index, spawn))
+
+    # Ties go the way they always have, to the lowest position and then the first one listed on the floor
+    def get_spawn(position, distance):
+        size = Spawner.bucket_size
+        reach = int(-(-distance // size))
+
+        x = int(position[0] // size)
+        y = int(position[1] // size)
+
+        chosen = None
+        for bx in range(x - reach, x + reach + 1):
+            for by in range(y - reach, y + reach + 1):
+                for index, spawn in Spawner.buckets.get((bx, by), []):
+                    if spawn['count'][0] >= spawn['count'][1]:
+                        continue
+
+                    dx = spawn['position'][0] - position[0]
+                    dy = spawn['position'][1] - position[1]
+                    if dx * dx + dy * dy > distance * distance:
+                        continue
+
+                    if chosen is None or (spawn['position'], index) < (chosen[1]['position'], chosen[0]):
+                        chosen = (index, spawn)
+
+        return None if chosen is None else chosen[1]
+
+    def get_free_position(position, lift):
+        position = list(position)
+
+        cell = NavGrid.get_cell(position)
+        while cell is not None and NavGrid.cells[cell] != NavGrid.EMPTY:
+            position[1] -= NavGrid.cell_size * lift
+            cell = NavGrid.get_cell(position)
+
+        return position
+
+    def queue(fn, args=[]):
+        Spawner.pending.append((fn, args))
+
+    def advance():
+        for _ in range(min(Spawner.BUDGET, len(Spawner.pending))):
+            fn, args = Spawner.pending.popleft()
+            fn(*args)
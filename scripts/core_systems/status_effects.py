@@ -1,9 +1,9 @@
 from scripts.core_systems.combat_handler import register_damage
 
 from scripts.visual_fx.particle import Circle
+from scripts.tools.rng import Rng
 
 import pygame
-import random
 
 def get_buff(entity, signature):
     buff_list = []
@@ -111,11 +111,11 @@ class OnFire(Debuff):
             self.particle_rate[0] = 0
 
             pos = self.entity.center_position
-            pos[0] += random.randint(-5, 5)
-            pos[1] += random.randint(-15, 0)
+            pos[0] += Rng.randint(-5, 5)
+            pos[1] += Rng.randint(-15, 0)
 
             particle = Circle(pos, self.particle_color, self.particle_size, 0)
-            particle.set_goal(60, position=[pos[0] + random.randint(-50, 50), pos[1] + random.randint(-75, 0)], radius=0, width=0)
+            particle.set_goal(60, position=[pos[0] + Rng.randint(-50, 50), pos[1] + Rng.randint(-75, 0)], radius=0, width=0)
 
             particle.glow['active'] = True
             particle.glow['size'] = 1.5
@@ -12,10 +12,11 @@ from scripts.ui.text_box import TextBox
 
 from scripts.tools import get_distance, get_closest_sprite, check_line_collision, create_outline_full
 from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.asset_loader import AssetLoader
+from scripts.tools.rng import Rng
 
 import pygame
 import inspect
-import random
 import sys
 import math
 import os
@@ -37,14 +38,43 @@ def get_talent(player, talent_id):
 
 		return talent
 	
+def add_talent(player, talent):
+	player.talents.append(talent)
+
+	for call in talent.TALENT_CALLS:
+		player.talent_calls.setdefault(call, []).append(talent)
+
+	return talent
+
 def call_talents(scene, player, calls):
 	for call, info in calls.items():
-		for talent in player.talents:
-			if call not in talent.TALENT_CALLS:
-				continue
-				
+		subscribers = player.talent_calls.get(call)
+		TalentCalls.add(call, subscribers)
+
+		if not subscribers:
+			continue
+
+		for talent in subscribers:
 			talent.call(call, scene, info)
 
+class TalentCalls:
+	counts = {}
+
+	def add(call, subscribers):
+		count = TalentCalls.counts.get(call)
+		if count is None:
+			count = TalentCalls.counts[call] = [0, 0]
+
+		count[0] += 1
+		if subscribers:
+			count[1] += len(subscribers)
+
+	def reset():
+		TalentCalls.counts = {}
+
+	def get_report():
+		return {call: count for call, count in sorted(TalentCalls.counts.items(), key=lambda c: -c[1][0])}
+
 def reset_talents(player):
 	for talent in player.talents:
 		talent.reset()
@@ -301,8 +331,10 @@ class Marksman(Talent):
 
 class Temperance(Talent):
 	class TemperanceHalo(Entity):
+		ALWAYS_AWAKE = True
+
 		def __init__(self, strata):
-			img = pygame.image.load(os.path.join('resources', 'images', 'entities', 'visuals', 'temperance.png')).convert_alpha()
+			img = AssetLoader.load_image(os.path.join('resources', 'images', 'entities', 'visuals', 'temperance.png'))
 			img_scale = 1.5
 
 			img = pygame.transform.scale(img, (img.get_width() * img_scale, img.get_height() * img_scale)).convert_alpha()
@@ -418,7 +450,7 @@ class WheelOfFortune(Talent):
 		self.talent_info['buff_signature'] = 'wheel_of_fortune'
 		self.talent_info['cooldown_timer'] = 360
 
-		self.talent_info['image'] = pygame.image.load(os.path.join('resources', 'images', 'entities', 'visuals', 'wheel-of-fortune.png')).convert_alpha()
+		self.talent_info['image'] = AssetLoader.load_image(os.path.join('resources', 'images', 'entities', 'visuals', 'wheel-of-fortune.png'))
 		self.talent_info['image'] = pygame.transform.scale(self.talent_info['image'], (self.talent_info['image'].get_width() * 2.5, self.talent_info['image'].get_height() * 2.5))
 
 		self.talent_info['tick_info'] = {
@@ -452,7 +484,7 @@ class WheelOfFortune(Talent):
 		particle.set_beziers(alpha=presets['ease_in'])
 		particle.set_goal(
 			60, 
-			position=(self.player.rect.centerx, particle.rect.centery + random.randint(-100, -50)),
+			position=(self.player.rect.centerx, particle.rect.centery + Rng.randint(-100, -50)),
 			alpha=0,
 			dimensions=(img.get_width(), img.get_height())
 		)
@@ -492,6 +524,10 @@ class WheelOfFortune(Talent):
 		self.sin_info['count'] += 1 * dt
 
 	def set_visual(self, scene, dt):
+		self.set_position(dt)
+		if not scene.render:
+			return
+
 		a = (self.talent_info['tick_info']['angle'] - 90) * math.pi / 180
 		x = self.talent_info['tick_info']['radius'] * math.cos(a)
 		y = self.talent_info['tick_info']['radius'] * math.sin(a)
@@ -508,9 +544,8 @@ class WheelOfFortune(Talent):
 		pygame.draw.line(visual, self.talent_info['tick_info']['color'], visual.get_rect().center, pos, 4)
 
 		visual.set_alpha(200 - 155 * (self.talent_info['cooldown'] / self.talent_info['cooldown_timer']))
-		self.set_position(dt)
 
-		scene.entity_surface.blit(visual, visual.get_rect(center=self.talent_info['tick_info']['position']))
+		scene.draw_list.blit('entity', visual, visual.get_rect(center=self.talent_info['tick_info']['position']), copy=True, motion=self.player.get_tick_motion())
 
 	def update(self, scene, dt):
 		super().update(scene, dt)
@@ -525,14 +560,14 @@ class WheelOfFortune(Talent):
 
 		has_temperance = get_talent(self.player, 'temperance')
 
-		stat = random.choice(list(self.talent_info['stats'].keys()))
+		stat = Rng.choice(list(self.talent_info['stats'].keys()))
 
 		while stat == self.talent_info['current_stat']:
-			stat = random.choice(list(self.talent_info['stats'].keys()))
+			stat = Rng.choice(list(self.talent_info['stats'].keys()))
 
 		if has_temperance:
 			while stat in ['crit_strike_chance', 'crit_strike_multiplier']:
-				stat = random.choice(list(self.talent_info['stats'].keys()))
+				stat = Rng.choice(list(self.talent_info['stats'].keys()))
 
 		health_proportion = self.player.get_stat('health') / self.player.get_stat('max_health')
 
@@ -554,10 +589,10 @@ class WheelOfFortune(Talent):
 		particles = []
 		pos = self.talent_info['tick_info']['position']
 		for _ in range(4):
-			cir = Circle(pos, PLAYER_COLOR, random.randint(8, 9), 0)
+			cir = Circle(pos, PLAYER_COLOR, Rng.randint(8, 9), 0)
 			cir.set_goal(
 						60, 
-						position=(pos[0] + random.randint(-50, 50), pos[1] + random.randint(-50, 50)), 
+						position=(pos[0] + Rng.randint(-50, 50), pos[1] + Rng.randint(-50, 50)), 
 						radius=0, 
 						width=0
 					)
@@ -677,8 +712,10 @@ class Holdfast(Talent):
 		if not self.talent_info['type']:
 			return
 		
-		create_outline_full(self.player, self.talent_info['type_colors'][self.talent_info['type']], scene.entity_surface, 2)
-		if self.player.combat_info['mitigations'][self.talent_info['type']][self.TALENT_ID][1] <= 0:
+		if scene.render:
+			create_outline_full(self.player, self.talent_info['type_colors'][self.talent_info['type']], scene.draw_list.layers['entity'], 2, self.player.get_tick_motion())
+
+		if self.TALENT_ID not in self.player.combat_info['mitigations'][self.talent_info['type']]:
 			self.talent_info['type'] = None
 			return
 
@@ -920,7 +957,7 @@ class RunItBack(Talent):
 		if info.ABILITY_ID[0] == '@':
 			return
 
-		if self.player.combat_info['crit_strike_chance'] <= 0 or round(random.uniform(0, 1), 2) > self.player.combat_info['crit_strike_chance']:
+		if self.player.combat_info['crit_strike_chance'] <= 0 or round(Rng.uniform(0, 1), 2) > self.player.combat_info['crit_strike_chance']:
 			return
 
 		super().call(call, scene, info)
@@ -992,7 +1029,7 @@ class LingeringShroud(Talent):
 			cir = Circle(pos, (255, 255, 255), 6, 0)
 			cir.set_goal(
 						60, 
-						position=(pos[0] + random.randint(-25, 25), pos[1] + random.randint(-100, -25)), 
+						position=(pos[0] + Rng.randint(-25, 25), pos[1] + Rng.randint(-100, -25)), 
 						radius=0, 
 						width=0
 					)
@@ -1086,6 +1123,8 @@ class EvasiveManeuvers(Talent):
 
 class Reprisal(Talent):
 	class ReprisalFamiliar(Entity):
+		ALWAYS_AWAKE = True
+
 		def __init__(self, player):
 			self.color = (255, 75, 75)
 
@@ -1143,8 +1182,8 @@ class Reprisal(Talent):
 				cir.set_goal(
 							75, 
 							position=(
-								pos[0] + random.randint(-75, 75) + (projectile.velocity[0] * 10), 
-								pos[1] + random.randint(-75, 75) + (projectile.velocity[1] * 10)
+								pos[0] + Rng.randint(-75, 75) + (projectile.velocity[0] * 10), 
+								pos[1] + Rng.randint(-75, 75) + (projectile.velocity[1] * 10)
 							), 
 							radius=0, 
 							width=0
@@ -1208,6 +1247,7 @@ class Reprisal(Talent):
 
 		def display(self, scene, dt):
 			self.set_position(dt)
+			self.set_tick_motion(self.player.get_tick_motion())
 
 			enemies = [e for e in scene.get_sprites('enemy') if get_distance(self.player, e) <= self.combat_info['max_distance']]
 			enemy = None
@@ -1362,7 +1402,7 @@ class ChaosTheory(Talent):
 
 		ability = [a for a in self.player.abilities.values() if a and a.ABILITY_ID[0] != '@' and a != info]
 
-		if ability and round(random.uniform(0, 1), 2) <= self.talent_info['chance']:
+		if ability and round(Rng.uniform(0, 1), 2) <= self.talent_info['chance']:
 			ability[0].call(scene, ignore_cooldown=True)
 
 class Shadowstep(Talent):
@@ -1556,7 +1596,7 @@ class FromTheShadows(Talent):
 		
 		super().call(call, scene, info)
 
-		enemies = [*set([e[0] for e in collision])]
+		enemies = [*dict.fromkeys([e[0] for e in collision])]
 		
 		if enemies:
 			scene.set_dt_multiplier(.5, 10)
@@ -1572,10 +1612,10 @@ class FromTheShadows(Talent):
 
 			pos = enemy.center_position
 			for _ in range(4):
-				cir = Circle(pos, self.talent_info['damage_color'], random.randint(6, 8), 0)
+				cir = Circle(pos, self.talent_info['damage_color'], Rng.randint(6, 8), 0)
 				cir.set_goal(
 							75, 
-							position=(pos[0] + random.randint(-75, 75), pos[1] + random.randint(-75, 75)), 
+							position=(pos[0] + Rng.randint(-75, 75), pos[1] + Rng.randint(-75, 75)), 
 							radius=0, 
 							width=0
 						)
@@ -1675,7 +1715,7 @@ class Afterstrike(Talent):
 
 				amount = queue[1]['amount'] * self.talent_info['damage_multiplier']
 				vel = [queue[1]['velocity'][0] * .5, queue[1]['velocity'][1] * .5]
-				self.player.delay_timers.append([3, register_damage, [scene, self.player, queue[1]['target'], {'type': 'physical', 'amount': amount, 'velocity': vel}]])
+				self.player.add_delay_timer(3, register_damage, [scene, self.player, queue[1]['target'], {'type': 'physical', 'amount': amount, 'velocity': vel}])
 
 				value = queue[1]['target'].movement_info['max_movespeed'] * self.talent_info['slowed_percentage']
 				debuff = Slowed(queue[1]['target'], self.talent_info['signature'], value, self.talent_info['duration'])
@@ -1684,7 +1724,7 @@ class Afterstrike(Talent):
 				if has_debuff:
 					has_debuff.duration = self.talent_info['duration']
 				else:
-					self.player.delay_timers.append([3, queue[1]['target'].debuffs.append, [debuff]])
+					self.player.add_delay_timer(3, queue[1]['target'].debuffs.append, [debuff])
 
 				center = queue[1]['target'].center_position
 				direction = [
@@ -0,0 +1,154 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Table rows are [start, end, frame, frames, c_0, c_1, c_2, c_3, clock], c_n being the used component of each control point
+class Tweens:
+    PROPERTIES = ['x', 'y', 'alpha']
+    CLOCKS = ['scene', 'entity']
+
+    START, END, FRAME, FRAMES, CURVE, CLOCK = 0, 1, 2, 3, 4, 8
+    COLUMNS = 9
+
+    CAPACITY = 64
+
+    data = numpy.zeros((CAPACITY, COLUMNS)) if numpy is not None else []
+    count = 0
+
+    keys = []
+    rows = {}
+
+    def reset():
+        Tweens.data = numpy.zeros((Tweens.CAPACITY, Tweens.COLUMNS)) if numpy is not None else []
+        Tweens.count = 0
+
+        Tweens.keys = []
+        Tweens.rows = {}
+
+    def add(sprite, prop, start, end, frames, bezier):
+        key = (sprite, prop)
+        if frames <= 0:
+            Tweens.cancel(key)
+            return
+
+        p_0, p_1, p_2, p_3 = bezier[:4]
+        i = bezier[4] if len(bezier) > 4 else 0
+
+        row = [start, end, 0, frames, p_0[i], p_1[i], p_2[i], p_3[i], Tweens.CLOCKS.index(sprite.DELAY_CLOCK)]
+
+        index = Tweens.rows.get(key)
+        if index is None:
+            index = Tweens.count
+            Tweens.count += 1
+
+            Tweens.keys.append(key)
+            Tweens.rows[key] = index
+
+            if numpy is None:
+                Tweens.data.append(row)
+                return
+
+            if index == len(Tweens.data):
+                Tweens.data = numpy.concatenate([Tweens.data, numpy.zeros_like(Tweens.data)])
+
+        Tweens.data[index] = row
+
+    def cancel(key):
+        index = Tweens.rows.pop(key, None)
+        if index is None:
+            return
+
+        last = Tweens.count - 1
+        if index != last:
+            Tweens.data[index] = Tweens.data[last]
+            Tweens.keys[index] = Tweens.keys[last]
+            Tweens.rows[Tweens.keys[index]] = index
+
+        Tweens.keys.pop()
+        if numpy is None:
+            Tweens.data.pop()
+
+        Tweens.count = last
+
+    def cancel_owner(sprite):
+        if not Tweens.count:
+            return
+
+        for prop in Tweens.PROPERTIES:
+            Tweens.cancel((sprite, prop))
+
+    # A tween is applied at its current frame and then advanced, so it finishes one step short of its end value as before
+    def step(dt, entity_dt):
+        if not Tweens.count:
+            return
+
+        if numpy is None:
+            values, done = Tweens.step_rows(dt, entity_dt)
+
+        else:
+            values, done = Tweens.step_table(dt, entity_dt)
+
+        for (sprite, prop), value in zip(Tweens.keys, values):
+            if prop == 'x':
+                sprite.rect.x = value
+
+            elif prop == 'y':
+                sprite.rect.y = value
+
+            else:
+                sprite.image.set_alpha(value)
+
+        if done:
+            Tweens.drop_done()
+
+    def step_table(dt, entity_dt):
+        table = Tweens.data[:Tweens.count]
+
+        t = table[:, Tweens.FRAME] / table[:, Tweens.FRAMES]
+        u = 1 - t
+
+        curve = table[:, Tweens.CURVE:Tweens.CURVE + 4]
+        points = u * u * u * curve[:, 0] + 3 * t * u * u * curve[:, 1] + 3 * t * t * u * curve[:, 2] + t * t * t * curve[:, 3]
+
+        values = table[:, Tweens.START] + (table[:, Tweens.END] - table[:, Tweens.START]) * points
+        table[:, Tweens.FRAME] += numpy.where(table[:, Tweens.CLOCK] == 1, entity_dt, dt)
+
+        return values.tolist(), bool((table[:, Tweens.FRAME] >= table[:, Tweens.FRAMES]).any())
+
+    def step_rows(dt, entity_dt):
+        values = []
+        done = False
+
+        for row in Tweens.data:
+            t = row[Tweens.FRAME] / row[Tweens.FRAMES]
+            u = 1 - t
+
+            c_0, c_1, c_2, c_3 = row[Tweens.CURVE:Tweens.CURVE + 4]
+            points = u * u * u * c_0 + 3 * t * u * u * c_1 + 3 * t * t * u * c_2 + t * t * t * c_3
+
+            values.append(row[Tweens.START] + (row[Tweens.END] - row[Tweens.START]) * points)
+
+            row[Tweens.FRAME] += entity_dt if row[Tweens.CLOCK] == 1 else dt
+            if row[Tweens.FRAME] >= row[Tweens.FRAMES]:
+                done = True
+
+        return values, done
+
+    def drop_done():
+        table = Tweens.data[:Tweens.count]
+
+        if numpy is None:
+            keep = [row[Tweens.FRAME] < row[Tweens.FRAMES] for row in table]
+            Tweens.data = [row for row, k in zip(table, keep) if k]
+
+        else:
+            keep = table[:, Tweens.FRAME] < table[:, Tweens.FRAMES]
+            kept = table[keep]
+
+            Tweens.data[:len(kept)] = kept
+            keep = keep.tolist()
+
+        Tweens.keys = [key for key, k in zip(Tweens.keys, keep) if k]
+        Tweens.rows = {key: i for i, key in enumerate(Tweens.keys)}
+        Tweens.count = len(Tweens.keys)
@@ -2,12 +2,12 @@ from scripts.entities.entity import Entity
 
 from scripts.tools.spritesheet_loader import load_spritesheet
 from scripts.tools import get_sprite_colors
+from scripts.tools.rng import Rng
 
 from scripts.visual_fx.particle import Circle
 
 import pygame
 import inspect
-import random
 import sys
 import os
 
@@ -20,6 +20,7 @@ class Decoration(Entity):
     def __init__(self, position, img, dimensions, strata=None, alpha=None):
         super().__init__(position, img, dimensions, strata, alpha)
         self.sprite_id = 'decoration'
+        self.static_image = True
 
     def display(self, scene, dt):
         super().display(scene, dt)
@@ -47,7 +48,7 @@ class DecorationTorch(Decoration):
         self.image_frames = load_spritesheet(os.path.join('resources', 'images', 'entities', 'decoration', 'torch-flame.png'), scale=2)
         self.image_offset = [0, 35]
 
-        self.frame = random.randint(0, len(self.image_frames) - 1)
+        self.frame = Rng.randint(0, len(self.image_frames) - 1)
         self.pace = .3
 
         self.particle_count = [0, 25]
@@ -59,11 +60,12 @@ class DecorationTorch(Decoration):
         img = self.image_frames[round(self.frame)]
         pos = [self.center_position[0] + self.image_offset[0], self.center_position[1] + self.image_offset[1]]
 
-        glow_img = pygame.transform.scale(img, (img.get_width() * 1.4, img.get_height() * 1.4))
-        glow_img.set_alpha(img.get_alpha() * .2)
+        if scene.render:
+            glow_img = pygame.transform.scale(img, (img.get_width() * 1.4, img.get_height() * 1.4))
+            glow_img.set_alpha(img.get_alpha() * .2)
 
-        scene.entity_surface.blit(glow_img, glow_img.get_rect(center=pos))
-        scene.entity_surface.blit(img, img.get_rect(center=pos))
+            scene.draw_list.blit('entity', glow_img, glow_img.get_rect(center=pos))
+            scene.draw_list.blit('entity', img, img.get_rect(center=pos))
 
         self.frame += 1 * self.pace * dt
         self.particle_count[0] += 1 * dt
@@ -71,10 +73,10 @@ class DecorationTorch(Decoration):
         if self.particle_count[0] >= self.particle_count[1]:
             self.particle_count[0] = 0
 
-            cir = Circle(pos, get_sprite_colors(img)[0], random.randint(3, 5), 0)
+            cir = Circle(pos, get_sprite_colors(img)[0], Rng.randint(3, 5), 0)
             cir.strata = self.strata - 1
 
-            cir.set_goal(90, position=[pos[0] + random.randint(-50, 50), pos[1] + random.randint(-125, -75)], radius=0)
+            cir.set_goal(90, position=[pos[0] + Rng.randint(-50, 50), pos[1] + Rng.randint(-125, -75)], radius=0)
             cir.set_gravity(2)
             cir.glow['active'] = True
             cir.glow['size'] = 2
@@ -92,7 +94,7 @@ class DecorationCamp(Decoration):
         self.image_frames = load_spritesheet(os.path.join('resources', 'images', 'entities', 'decoration', 'camp-flame.png'), scale=3)
         self.image_offset = [0, 26]
 
-        self.frame = random.randint(0, len(self.image_frames) - 1)
+        self.frame = Rng.randint(0, len(self.image_frames) - 1)
         self.pace = .275
 
         self.particle_count = [0, 35]
@@ -104,11 +106,12 @@ class DecorationCamp(Decoration):
         img = self.image_frames[round(self.frame)]
         pos = [self.center_position[0] + self.image_offset[0], self.center_position[1] + self.image_offset[1]]
 
-        glow_img = pygame.transform.scale(img, (img.get_width() * 1.2, img.get_height() * 1.2))
-        glow_img.set_alpha(img.get_alpha() * .2)
+        if scene.render:
+            glow_img = pygame.transform.scale(img, (img.get_width() * 1.2, img.get_height() * 1.2))
+            glow_img.set_alpha(img.get_alpha() * .2)
 
-        scene.entity_surface.blit(glow_img, glow_img.get_rect(center=pos))
-        scene.entity_surface.blit(img, img.get_rect(center=pos))
+            scene.draw_list.blit('entity', glow_img, glow_img.get_rect(center=pos))
+            scene.draw_list.blit('entity', img, img.get_rect(center=pos))
 
         self.frame += 1 * self.pace * dt
         self.particle_count[0] += 1 * dt
@@ -116,10 +119,10 @@ class DecorationCamp(Decoration):
         if self.particle_count[0] >= self.particle_count[1]:
             self.particle_count[0] = 0
 
-            cir = Circle(pos, get_sprite_colors(img)[0], random.randint(5, 7), 0)
+            cir = Circle(pos, get_sprite_colors(img)[0], Rng.randint(5, 7), 0)
             cir.strata = self.strata - 1
 
-            cir.set_goal(90, position=[pos[0] + random.randint(-50, 50), pos[1] + random.randint(-35, -20)], radius=0)
+            cir.set_goal(90, position=[pos[0] + Rng.randint(-50, 50), pos[1] + Rng.randint(-35, -20)], radius=0)
             cir.set_gravity(-1)
             cir.glow['active'] = True
             cir.glow['size'] = 2
@@ -2,7 +2,8 @@ from scripts import ENEMY_COLOR, CRIT_COLOR
 
 from scripts.core_systems.abilities import Ability
 from scripts.core_systems.combat_handler import get_immunity_dict, get_mitigation_dict, register_damage
-from scripts.core_systems.enemy_ai import FlyerAi, FloaterAi, EncircleAi
+from scripts.core_systems.enemy_ai import FlyerAi, FloaterAi, EncircleAi, AiLod
+from scripts.core_systems.line_of_sight import LineOfSight
 from scripts.core_systems.status_effects import OnFire, get_debuff
 
 from scripts.entities.physics_entity import PhysicsEntity
@@ -10,26 +11,31 @@ from scripts.visual_fx.particle import Circle, Image
 from scripts.entities.projectile import ProjectileStandard
 
 from scripts.tools.spritesheet_loader import load_spritesheet
+from scripts.tools.asset_loader import AssetLoader
 
 from scripts.ui.info_bar import EnemyBar
 from scripts.ui.text_box import TextBox
 
-from scripts.tools import get_sprite_colors, check_pixel_collision, check_line_collision
+from scripts.tools import get_sprite_colors, check_pixel_collision
 from scripts.tools.bezier import presets
+from scripts.tools.rng import Rng
 
 import pygame
-import random
 import math
 import os
 
 class Enemy(PhysicsEntity):
     ENEMY_FLAGS = {}
 
+    ALWAYS_AWAKE = True
+
     def __init__(self, position, img, dimensions, strata, alpha):
         super().__init__(position, img, dimensions, strata, alpha)
         self.sprite_id = 'enemy'
 
         self.ai = None
+        self.lod_info = AiLod.get_lod_info()
+
         self.swarm = False
         self.healthbar = EnemyBar(self)
 
@@ -64,12 +70,12 @@ class Enemy(PhysicsEntity):
         pos = self.center_position
         particles = []
         for color in get_sprite_colors(self, .5):
-            radius = round(((self.image.get_width() + self.image.get_height()) / 2) * round(random.uniform(.06, .11), 2))
+            radius = round(((self.image.get_width() + self.image.get_height()) / 2) * round(Rng.uniform(.06, .11), 2))
 
             cir = Circle(pos, color, radius, 0)
             cir.set_goal(
                         120, 
-                        position=(pos[0] + random.randint(-450, 450), pos[1] + random.randint(-350, -250)), 
+                        position=(pos[0] + Rng.randint(-450, 450), pos[1] + Rng.randint(-350, -250)), 
                         radius=0, 
                         width=0
                     )
@@ -104,12 +110,12 @@ class Enemy(PhysicsEntity):
             particles = []
 
             for color in get_sprite_colors(self, .35):
-                radius = round(((self.image.get_width() + self.image.get_height()) / 2) * round(random.uniform(.05, .1), 2))
+                radius = round(((self.image.get_width() + self.image.get_height()) / 2) * round(Rng.uniform(.05, .1), 2))
 
                 cir = Circle(pos, color, radius, 0)
                 cir.set_goal(
                             100, 
-                            position=(pos[0] + random.randint(-350, 350), pos[1] + random.randint(-350, 350)), 
+                            position=(pos[0] + Rng.randint(-350, 350), pos[1] + Rng.randint(-350, 350)), 
                             radius=0, 
                             width=0
                         )
@@ -140,7 +146,7 @@ class Enemy(PhysicsEntity):
     
         particle.set_goal(
             30, 
-            position=(self.rect.centerx + random.randint(-50, 50), particle.rect.centery + random.randint(-50, 50)),
+            position=(self.rect.centerx + Rng.randint(-50, 50), particle.rect.centery + Rng.randint(-50, 50)),
             alpha=0,
             dimensions=(img.get_width(), img.get_height())
         )
@@ -157,22 +163,25 @@ class Enemy(PhysicsEntity):
         self.combat_info['health'] = self.combat_info['max_health']
 
     def display(self, scene, dt):
-        if self.combat_info['health'] < self.combat_info['max_health']:
-            self.healthbar.display(scene, dt)
+        if self.visible:
+            if self.combat_info['health'] < self.combat_info['max_health']:
+                self.healthbar.display(scene, dt)
 
-        if check_pixel_collision(self, scene.player):
-            self.on_contact(scene, dt)
+            if check_pixel_collision(self, scene.player):
+                self.on_contact(scene, dt)
 
         super().display(scene, dt)       
         
         if self.img_info['damage_frames'] > 0:
-            img = self.mask.to_surface(
-                setcolor=ENEMY_COLOR,
-                unsetcolor=(0, 0, 0, 0)
-            )
+            if self.visible and scene.render:
+                img = self.mask.to_surface(
+                    setcolor=ENEMY_COLOR,
+                    unsetcolor=(0, 0, 0, 0)
+                )
+
+                img.set_alpha(255 * (self.img_info['damage_frames'] / self.img_info['damage_frames_max'])) 
 
-            img.set_alpha(255 * (self.img_info['damage_frames'] / self.img_info['damage_frames_max'])) 
-            scene.entity_surface.blit(img, (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]))
+                scene.draw_list.blit('entity', img, (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]), motion=self.get_tick_motion(), owned=True)
 
             self.img_info['damage_frames'] -= 1 * dt
 
@@ -294,8 +303,6 @@ class Sentry(Enemy):
 
     def display(self, scene, dt):
         if not scene.paused:
-            self.ai.update(scene, dt, scene.player)
-
             if abs(self.velocity[0]) < self.movement_info['per_frame_movespeed']:
                 self.velocity[0] = 0
 
@@ -307,8 +314,10 @@ class Sentry(Enemy):
             self.rect.x += round(self.velocity[0] * dt)
             self.rect.y += round(self.velocity[1] * dt)
 
-        self.set_images(scene, dt)
-        self.apply_afterimages(scene, dt)
+        if self.visible:
+            self.set_images(scene, dt)
+            self.apply_afterimages(scene, dt)
+
         super().display(scene, dt)
 
 class Sentinel(Enemy):
@@ -379,7 +388,7 @@ class Sentinel(Enemy):
             'base_img': []
         }
 
-        img = pygame.image.load(os.path.join('resources', 'images', 'entities', 'enemies', 'sentinel', 'sentinel.png'))
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'entities', 'enemies', 'sentinel', 'sentinel.png'))
         self.img_info['base_img'] = pygame.transform.scale(img, (img.get_width() * self.img_info['scale'], img.get_height() * self.img_info['scale']))
 
     def set_images(self, scene, dt):
@@ -421,16 +430,16 @@ class Sentinel(Enemy):
 
     def display(self, scene, dt):
         if not scene.paused:
-            self.ai.update(scene, dt, scene.player)
-
             if abs(self.velocity[0]) < self.movement_info['per_frame_movespeed']:
                 self.velocity[0] = 0
 
             self.rect.x += round(self.velocity[0] * dt)
             self.rect.y += round(self.velocity[1] * dt)
 
-        self.set_images(scene, dt)
-        self.apply_afterimages(scene, dt)
+        if self.visible:
+            self.set_images(scene, dt)
+            self.apply_afterimages(scene, dt)
+
         super().display(scene, dt)
 
 class Elemental(Enemy):
@@ -459,8 +468,8 @@ class Elemental(Enemy):
                 cir.set_goal(
                             75, 
                             position=(
-                                pos[0] + random.randint(-75, 75) + (projectile.velocity[0] * 10), 
-                                pos[1] + random.randint(-75, 75) + (projectile.velocity[1] * 10)
+                                pos[0] + Rng.randint(-75, 75) + (projectile.velocity[0] * 10), 
+                                pos[1] + Rng.randint(-75, 75) + (projectile.velocity[1] * 10)
                             ), 
                             radius=0, 
                             width=0
@@ -501,12 +510,12 @@ class Elemental(Enemy):
             self.ability_info['particle_rate'][0] = 0
 
             pos = projectile.center_position
-            pos[0] += random.randint(-20, 20)
-            pos[1] += random.randint(-10, 0)
+            pos[0] += Rng.randint(-20, 20)
+            pos[1] += Rng.randint(-10, 0)
 
             particle = Circle(pos, self.character.img_info['tertiary_color'], 5, 0)
             particle.strata = projectile.strata - 1
-            particle.set_goal(30, position=[pos[0] + random.randint(-25, 25), pos[1] + random.randint(-25, 0)], radius=0, width=0)
+            particle.set_goal(30, position=[pos[0] + Rng.randint(-25, 25), pos[1] + Rng.randint(-25, 0)], radius=0, width=0)
 
             particle.glow['active'] = True
             particle.glow['size'] = 2
@@ -573,8 +582,8 @@ class Elemental(Enemy):
                 cir.set_goal(
                             50, 
                             position=(
-                                self.character.rect.center[0] + random.randint(-50, 50) + (vel[0] * 15), 
-                                self.character.rect.center[1] + random.randint(-50, 50) + (vel[1] * 15)
+                                self.character.rect.center[0] + Rng.randint(-50, 50) + (vel[0] * 15), 
+                                self.character.rect.center[1] + Rng.randint(-50, 50) + (vel[1] * 15)
                             ), 
                             radius=0, 
                             width=0
@@ -666,7 +675,9 @@ class Elemental(Enemy):
 
         self.ability_info = {
             'activation_frames': [0, 75],
-            'activation_cancel': False
+            'activation_cancel': False,
+
+            'line_of_sight': True
         }
 
         self.abilities.append(self.Blast(self))
@@ -674,7 +685,7 @@ class Elemental(Enemy):
     def on_damaged(self, scene, info):
         super().on_damaged(scene, info)
 
-        self.ability_info['activation_frames'][0] = random.randint(0, 5)
+        self.ability_info['activation_frames'][0] = Rng.randint(0, 5)
         self.ability_info['activation_cancel'] = True
 
     def set_images(self, scene, dt):
@@ -707,12 +718,12 @@ class Elemental(Enemy):
         self.img_info['particle_rate'][0] = 0
 
         pos = self.center_position
-        pos[0] += random.randint(-20, 20)
-        pos[1] += random.randint(-20, -10)
+        pos[0] += Rng.randint(-20, 20)
+        pos[1] += Rng.randint(-20, -10)
 
         particle = Circle(pos, get_sprite_colors(self)[0], 7, 0)
         particle.strata = self.strata - 1
-        particle.set_goal(60, position=[pos[0] + random.randint(-50, 50), pos[1] + random.randint(-75, 0)], radius=0, width=0)
+        particle.set_goal(60, position=[pos[0] + Rng.randint(-50, 50), pos[1] + Rng.randint(-75, 0)], radius=0, width=0)
 
         particle.glow['active'] = True
         particle.glow['size'] = 2
@@ -722,21 +733,22 @@ class Elemental(Enemy):
 
     def display(self, scene, dt):
         if scene.paused:
-            self.set_images(scene, dt)
+            if self.visible:
+                self.set_images(scene, dt)
+
             super().display(scene, dt)
             return
 
-        if check_line_collision(scene.player.rect.center, self.rect.center, scene.get_sprites('tile', exclude='ramp')):
-            self.ability_info['activation_frames'][0] = random.randint(0, 5)
+        self.ability_info['line_of_sight'] = LineOfSight.check(scene.player.rect.center, self.rect.center, self.ability_info['line_of_sight'])
+        if not self.ability_info['line_of_sight']:
+            self.ability_info['activation_frames'][0] = Rng.randint(0, 5)
         
         self.ability_info['activation_frames'][0] += 1 * dt
 
         if self.ability_info['activation_frames'][0] >= self.ability_info['activation_frames'][1]:
             self.ability_info['activation_cancel'] = False
             self.ability_info['activation_frames'][0] = 0
-            self.delay_timers.append([30, random.choice(self.abilities).call, [scene]])
-
-        self.ai.update(scene, dt, scene.player)
+            self.add_delay_timer(30, Rng.choice(self.abilities).call, [scene])
 
         if abs(self.velocity[0]) < self.movement_info['per_frame_movespeed']:
             self.velocity[0] = 0
@@ -744,7 +756,9 @@ class Elemental(Enemy):
         self.rect.x += round(self.velocity[0] * dt)
         self.rect.y += round(self.velocity[1] * dt)
 
-        self.set_images(scene, dt)
+        if self.visible:
+            self.set_images(scene, dt)
+
         super().display(scene, dt)
 
 
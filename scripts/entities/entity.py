@@ -1,6 +1,11 @@
 from scripts.sprite import Sprite
 
 class Entity(Sprite):
+    DELAY_CLOCK = 'entity'
+
+    ALWAYS_AWAKE = False
+    WAKE_RADIUS = None
+
     def __init__(self, position, img, dimensions, strata, alpha=None):
         super().__init__(position, img, dimensions, strata, alpha)
 
@@ -11,14 +16,14 @@ class Entity(Sprite):
     def display(self, scene, dt):
         super().display(scene, dt)
 
-        if self.uses_ui_surface:
-            scene.ui_surface.blit(
-                self.image, 
-                (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]),
-            )
-            
-        else:
-            scene.entity_surface.blit(
-                self.image, 
-                (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]),
-            )
\ No newline at end of file
+        if not scene.render or not self.visible:
+            return
+
+        scene.draw_list.blit(
+            'ui' if self.uses_ui_surface else 'entity',
+            self.image,
+            (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]),
+            copy=not self.static_image,
+            static=self.static_image,
+            motion=self.get_tick_motion()
+        )
\ No newline at end of file
@@ -7,9 +7,9 @@ from scripts.tools.spritesheet_loader import load_spritesheet
 
 from scripts.tools.bezier import presets
 from scripts.tools import get_sprite_colors
+from scripts.tools.rng import Rng
 
 import pygame
-import random
 import inspect
 import math
 import sys
@@ -62,7 +62,7 @@ class StandardCardInteractable(Interactable):
 
         self.sin_count = 0
 
-        self.delay_timers.append([30, self.set_interactable, []])
+        self.add_delay_timer(30, self.set_interactable)
 
     def on_interact(self, scene, sprite):
         cards, text, discard = scene.generate_standard_cards()
@@ -147,8 +147,8 @@ class NextFloorInteractable(Interactable):
         if self.particle_count[0] >= self.particle_count[1]:
             self.particle_count[0] = 0
 
-            cir = Circle(self.rect.center, get_sprite_colors(self)[0], random.randint(5, 7), 0)
-            cir.set_goal(90, position=[self.rect.centerx - random.randint(-50, 50), self.rect.centery - random.randint(-100, 100)], radius=0)
+            cir = Circle(self.rect.center, get_sprite_colors(self)[0], Rng.randint(5, 7), 0)
+            cir.set_goal(90, position=[self.rect.centerx - Rng.randint(-50, 50), self.rect.centery - Rng.randint(-100, 100)], radius=0)
             cir.set_beziers(position=[[0, 0], [-1.5, 1.5], [1, 2], [1, 0], 0])
             cir.glow['active'] = True
             cir.glow['size'] = 2
@@ -364,31 +364,6 @@ class PhysicsEntity(Entity):
             self.combat_info['health'] = self.combat_info['max_health']
 
         self.combat_info['crit_strike_chance'] = round(self.combat_info['crit_strike_chance'], 2)
-        
-        for immunity in self.combat_info['immunities'].keys():
-            if '&' in immunity or self.combat_info['immunities'][immunity] == 0:
-                continue
-
-            if self.combat_info['immunities'][immunity] < 0:
-                self.combat_info['immunities'][immunity] = 0
-                continue
-
-            self.combat_info['immunities'][immunity] -= 1 * dt
-
-        del_list = []
-        for mitigation in self.combat_info['mitigations']:
-            if '&' in mitigation:
-                continue
-        
-            for name, values in self.combat_info['mitigations'][mitigation].items():
-                if values[1] <= 0:
-                    del_list.append([mitigation, name])
-                    continue
-
-                self.combat_info['mitigations'][mitigation][name][1] -= 1 * dt
-
-        for item in del_list:
-            del self.combat_info['mitigations'][item[0]][item[1]]
 
         super().display(scene, dt)
         
\ No newline at end of file
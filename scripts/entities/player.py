@@ -2,6 +2,7 @@ from scripts import ENEMY_COLOR, HEAL_COLOR, UI_HEALTH_COLOR, SCREEN_DIMENSIONS
 
 from scripts.core_systems.abilities import Dash, PrimaryAttack
 from scripts.core_systems.talents import call_talents
+from scripts.core_systems.scheduler import Scheduler
 
 from scripts.entities.entity import Entity
 from scripts.entities.physics_entity import PhysicsEntity
@@ -9,6 +10,7 @@ from scripts.visual_fx.particle import Circle, Image
 
 from scripts.tools.spritesheet_loader import load_spritesheet
 from scripts.tools.sfx_manager import Sfx
+from scripts.tools.asset_loader import AssetLoader
 
 from scripts.ui.text_box import TextBox
 from scripts.ui.info_bar import HealthBar
@@ -16,17 +18,21 @@ from scripts.ui.hotbar import Hotbar
 
 from scripts.tools.inputs import Inputs
 from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.rng import Rng
 
 
 import pygame
-import random
 import math
 import os
 
 class Player(PhysicsEntity):
+    ALWAYS_AWAKE = True
+
     class Halo(Entity):
+        ALWAYS_AWAKE = True
+
         def __init__(self, strata):
-            img = pygame.image.load(os.path.join('resources', 'images', 'entities', 'player', 'halo.png')).convert_alpha()
+            img = AssetLoader.load_image(os.path.join('resources', 'images', 'entities', 'player', 'halo.png'))
             img_scale = 1.5
             img = pygame.transform.scale(img, (img.get_width() * img_scale, img.get_height() * img_scale)).convert_alpha()
             img.set_colorkey((0, 0, 0))
@@ -47,6 +53,7 @@ class Player(PhysicsEntity):
             self.rect.centery = player.rect.top - 5 - round((self.sin_amplifier * math.sin(self.sin_frequency * (self.sin_count))))
             
             self.sin_count += 1 * dt
+            self.set_tick_motion(player.get_tick_motion())
 
             primary_ability = player.abilities['primary']
             if primary_ability.ability_info['cooldown'] > 0:
@@ -114,6 +121,7 @@ class Player(PhysicsEntity):
         }
 
         self.talents = []
+        self.talent_calls = {}
         self.talent_info = {}
 
     def get_ui_elements(self):
@@ -212,7 +220,7 @@ class Player(PhysicsEntity):
         scene.scene_fx['entity_zoom']['frames'][1] = 30
         scene.scene_fx['entity_zoom']['amount'] = 1.0
 
-        scene.delay_timers.append([30, scene.on_player_death, []])
+        Scheduler.schedule(30, scene.on_player_death)
 
     def on_attack(self, scene, info):
         if info:
@@ -235,7 +243,7 @@ class Player(PhysicsEntity):
         particle.set_beziers(radius=presets['ease_in'])
         particle.set_goal(
             45, 
-            position=(self.rect.centerx + random.randint(-50, 50), particle.rect.centery + random.randint(-50, 50)),
+            position=(self.rect.centerx + Rng.randint(-50, 50), particle.rect.centery + Rng.randint(-50, 50)),
             alpha=0,
             dimensions=(img.get_width(), img.get_height())
         )
@@ -249,7 +257,7 @@ class Player(PhysicsEntity):
             particle.set_beziers(radius=presets['ease_in'])
             particle.set_goal(
                 45, 
-                position=(self.rect.centerx + random.randint(-50, 50), particle.rect.centery + random.randint(-50, 50)),
+                position=(self.rect.centerx + Rng.randint(-50, 50), particle.rect.centery + Rng.randint(-50, 50)),
                 alpha=0,
                 dimensions=(img.get_width(), img.get_height())
             )
@@ -288,7 +296,7 @@ class Player(PhysicsEntity):
         particle.set_beziers(radius=presets['ease_in'])
         particle.set_goal(
             45, 
-            position=(self.rect.centerx + random.randint(-50, 50), particle.rect.centery + random.randint(-50, 50)),
+            position=(self.rect.centerx + Rng.randint(-50, 50), particle.rect.centery + Rng.randint(-50, 50)),
             alpha=0,
             dimensions=(img.get_width(), img.get_height())
         )
@@ -518,12 +526,14 @@ class Player(PhysicsEntity):
 
         super().display(scene, dt)
         if self.img_info['pulse_frames'] > 0:
-            img = self.mask.to_surface(
-                setcolor=self.img_info['pulse_frame_color'],
-                unsetcolor=(0, 0, 0, 0)
-            )
+            if scene.render:
+                img = self.mask.to_surface(
+                    setcolor=self.img_info['pulse_frame_color'],
+                    unsetcolor=(0, 0, 0, 0)
+                )
+
+                img.set_alpha(255 * get_bezier_point((self.img_info['pulse_frames'] / self.img_info['pulse_frames_max']), *self.img_info['pulse_frame_bezier'])) 
 
-            img.set_alpha(255 * get_bezier_point((self.img_info['pulse_frames'] / self.img_info['pulse_frames_max']), *self.img_info['pulse_frame_bezier'])) 
-            scene.entity_surface.blit(img, (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]))
+                scene.draw_list.blit('entity', img, (self.rect.x - self.rect_offset[0], self.rect.y - self.rect_offset[1]), motion=self.get_tick_motion(), owned=True)
 
             self.img_info['pulse_frames'] -= 1 * dt
\ No newline at end of file
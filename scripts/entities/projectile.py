@@ -9,6 +9,8 @@ import pygame
 import math
 
 class Projectile(Entity):
+    ALWAYS_AWAKE = True
+
     def __init__(self, position, img, dimensions, strata, info, alpha=None, velocity=[0, 0], duration=0, settings={}):
         if isinstance(img, tuple):
             self.radius = dimensions
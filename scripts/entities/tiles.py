@@ -16,6 +16,7 @@ class Tile(Entity):
     def __init__(self, position, img, dimensions, strata=None, alpha=None):
         super().__init__(position, img, dimensions, strata, alpha)
         self.sprite_id = 'tile'
+        self.static_image = True
 
     def display(self, scene, dt):
         super().display(scene, dt)
@@ -3,8 +3,16 @@ from scripts.camera import BoxCamera
 from scripts.tilemap_loader import load_tilemap
 from scripts.scene import Scene
 
-from scripts.core_systems.talents import get_all_talents, get_talent
+from scripts.core_systems.talents import get_all_talents, get_talent, add_talent
 from scripts.core_systems.abilities import get_all_abilities
+from scripts.core_systems.activation import Activation
+from scripts.core_systems.combat_handler import CombatTimers
+from scripts.core_systems.enemy_ai import AiSystem, AiLod
+from scripts.core_systems.line_of_sight import LineOfSight
+from scripts.core_systems.navigation import NavGrid
+from scripts.core_systems.scheduler import Scheduler
+from scripts.core_systems.spawner import Spawner
+from scripts.core_systems.tweens import Tweens
 
 from scripts.entities.enemy import ENEMIES
 from scripts.entities.entity import Entity
@@ -14,6 +22,12 @@ from scripts.entities.interactables import StandardCardInteractable
 
 from scripts.tools import get_sprite_colors, get_distance
 from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.asset_loader import AssetLoader
+from scripts.tools.inputs import Inputs
+from scripts.tools.rng import Rng
+from scripts.tools.frame_profiler import FrameProfiler
+from scripts.tools.memory_report import MemoryReport
+from scripts.tools.tracer import traced
 
 from scripts.ui.button import Button
 from scripts.ui.card import StandardCard, StatCard
@@ -22,20 +36,24 @@ from scripts.ui.text_box import TextBox
 from scripts.visual_fx.particle import Circle
 
 import pygame
-import random
 import math
+import time
 import os
 
 class GameLoop(Scene):
     def __init__(self, scene_handler, mouse, sprites=None):
+        Scheduler.reset()
+        Tweens.reset()
+        AiLod.reset()
+        Spawner.reset()
+        CombatTimers.reset()
+
         super().__init__(scene_handler, mouse, sprites)
 
         self.background_surface = pygame.Surface(SCREEN_DIMENSIONS, pygame.SRCALPHA).convert_alpha()
         self.entity_surface = None
         self.ui_surface = pygame.Surface((2000, 2000), pygame.SRCALPHA).convert_alpha()
 
-        self.delay_timers = []
-
         self.scene_fx = {
             '&dim': {
                 'type': None, 
@@ -62,6 +80,7 @@ class GameLoop(Scene):
 
         self.camera = BoxCamera(self.player)
         self.camera_offset = [0, 0]
+        self.previous_camera_offset = [0, 0]
 
         self.ui_elements = []
         self.ui_elements.extend(self.player.get_ui_elements())
@@ -148,7 +167,7 @@ class GameLoop(Scene):
         if self.paused or self.player.overrides['inactive-all']:
             return
         
-        if not pygame.key.get_mods() & pygame.KMOD_ALT:
+        if not Inputs.mods & pygame.KMOD_ALT:
             return
 
         if event.key == pygame.K_3:
@@ -168,7 +187,7 @@ class GameLoop(Scene):
         self.scene_fx['&dim']['frames'][1] = 60
         self.scene_fx['&dim']['threshold'] = 0
 
-        self.delay_timers.append([150, self.scene_handler.set_new_scene, [self.__class__, {}]])
+        Scheduler.schedule(150, self.scene_handler.set_new_scene, [self.__class__, {}])
 
     def on_enemy_spawn(self):
         self.enemy_info['max_enemies'][0] += 1
@@ -182,25 +201,19 @@ class GameLoop(Scene):
             return
 
         spawn_card = round(math.pow(self.enemy_info['card_death_counter'] - self.enemy_info['count'], 4) + 24)
-        if spawn_card < random.randint(1, 100):
+        if spawn_card < Rng.randint(1, 100):
             return
         
         self.enemy_info['card_death_counter'] = 0
 
         position = [
-            enemy.center_position[0] + random.randint(-100, 100) * 2,
-            enemy.center_position[1] - random.randint(25, 50)
+            enemy.center_position[0] + Rng.randint(-100, 100) * 2,
+            enemy.center_position[1] - Rng.randint(25, 50)
         ]
 
         card = StandardCardInteractable(enemy.center_position, None, None, 9, 0)
 
-        collide_tiles = True
-        while collide_tiles:
-            collide_tiles = []
-            for tile in self.get_sprites('tile'):
-                if tile.rect.collidepoint(position):
-                    position[1] -= tile.rect.height * 2
-                    collide_tiles.append(tile)
+        position = Spawner.get_free_position(position, 2)
 
         card.set_x_bezier(position[0], 75, [[0, 0], [.5, 1.5], [1, 0], [1, 0], 0])
         card.set_y_bezier(position[1], 75, [[0, 0], [2.65, 0.6], [1.1, 0.45], [1, 0], 0])
@@ -209,7 +222,7 @@ class GameLoop(Scene):
         self.add_sprites(card)
 
     def on_player_death(self):
-        self.delay_timers.append([90, self.on_scene_end, []])
+        Scheduler.schedule(90, self.on_scene_end)
 
         self.player.overrides['death'] = True
 
@@ -224,10 +237,10 @@ class GameLoop(Scene):
         particles = []
 
         for color in get_sprite_colors(self.player, 2):
-            cir = Circle(pos, color, random.randint(6, 10), 0)
+            cir = Circle(pos, color, Rng.randint(6, 10), 0)
             cir.set_goal(
                         150, 
-                        position=(pos[0] + random.randint(-450, 450), pos[1] + random.randint(-350, -250)), 
+                        position=(pos[0] + Rng.randint(-450, 450), pos[1] + Rng.randint(-350, -250)), 
                         radius=0, 
                         width=0
                     )
@@ -240,7 +253,7 @@ class GameLoop(Scene):
             cir = Circle(pos, PLAYER_COLOR, 9, 0)
             cir.set_goal(
                         150, 
-                        position=(pos[0] + random.randint(-250, 250), pos[1] + random.randint(-250, 250)), 
+                        position=(pos[0] + Rng.randint(-250, 250), pos[1] + Rng.randint(-250, 250)), 
                         radius=0, 
                         width=0
                     )
@@ -263,10 +276,10 @@ class GameLoop(Scene):
         particles = []
         pos = self.player.center_position
         for _ in range(6):
-            cir = Circle(pos, PLAYER_COLOR, random.randint(5, 7), 0)
+            cir = Circle(pos, PLAYER_COLOR, Rng.randint(5, 7), 0)
             cir.set_goal(
                         75, 
-                        position=(pos[0] + random.randint(-75, 75), pos[1] + random.randint(-75, 75)), 
+                        position=(pos[0] + Rng.randint(-75, 75), pos[1] + Rng.randint(-75, 75)), 
                         radius=0, 
                         width=0
                     )
@@ -300,8 +313,8 @@ class GameLoop(Scene):
         self.level_info['floor'] += incr
         self.level_info['pattern'][0] = max(1, min(self.level_info['pattern'][0] + incr, 4))
 
-        self.delay_timers.append([120, self.load_tilemap, [], True])
-        self.delay_timers.append([120, self.load_intro, [], True])
+        Scheduler.schedule(120, self.load_tilemap, clock='entity')
+        Scheduler.schedule(120, self.load_intro, clock='entity')
 
     def register_enemy_flags(self, dt):
         for enemy in self.get_sprites('enemy'):
@@ -309,6 +322,9 @@ class GameLoop(Scene):
                 self.del_sprites(enemy)
                 self.enemy_info['max_enemies'][0] -= 1
 
+        if dt:
+            Spawner.advance()
+
         if not self.enemy_info['spawns']:
             return
 
@@ -321,35 +337,17 @@ class GameLoop(Scene):
         if self.enemy_info['spawn_cooldown'][0] > 0:
             return
 
-        elgible_spawns = []
-        for spawn in self.enemy_info['spawns']:
-            if get_distance(self.player.center_position, spawn['position']) > self.enemy_info['spawn_distance']:
-                continue
-        
-            if spawn['count'][0] >= spawn['count'][1]:
-                continue
-
-            elgible_spawns.append(spawn)
-
-        if not elgible_spawns:
+        spawn = Spawner.get_spawn(self.player.center_position, self.enemy_info['spawn_distance'])
+        if spawn is None:
             return
-        
-        spawn = [s for s in elgible_spawns if s['position'] == min([p['position'] for p in elgible_spawns])][0]
 
         self.enemy_info['spawn_cooldown'][0] = self.enemy_info['spawn_cooldown'][1]
-        self.enemy_info['spawns'][self.enemy_info['spawns'].index(spawn)]['count'][0] += 1
+        spawn['count'][0] += 1
 
         selected_enemy = ENEMIES[1][spawn['enemy'] - 1]
 
         def spawn_enemy(swarm=False):
-            enemy_position = [spawn['position'][0] + random.randint(-250, 250), spawn['position'][1] + random.randint(-250, 250)]
-            collide_tiles = True
-            while collide_tiles:
-                collide_tiles = []
-                for tile in self.get_sprites('tile'):
-                    if tile.rect.collidepoint(enemy_position):
-                        enemy_position[1] -= tile.rect.height * 4
-                        collide_tiles.append(tile)
+            enemy_position = Spawner.get_free_position([spawn['position'][0] + Rng.randint(-250, 250), spawn['position'][1] + Rng.randint(-250, 250)], 4)
 
             enemy = selected_enemy(enemy_position, 6, level=self.level_info['floor'])
             enemy.img_info['damage_frames'] = 15
@@ -362,10 +360,10 @@ class GameLoop(Scene):
 
             particles = []
             for _ in range(6):
-                cir = Circle(particle_position, ENEMY_COLOR, random.randint(8, 10), 0)
+                cir = Circle(particle_position, ENEMY_COLOR, Rng.randint(8, 10), 0)
                 cir.set_goal(
                             75, 
-                            position=(particle_position[0] + random.randint(-75, 75), particle_position[1] + random.randint(-75, 75)), 
+                            position=(particle_position[0] + Rng.randint(-75, 75), particle_position[1] + Rng.randint(-75, 75)), 
                             radius=0, 
                             width=0
                         )
@@ -377,13 +375,13 @@ class GameLoop(Scene):
             if not swarm:
                 self.on_enemy_spawn()
 
-            self.delay_timers.append([30, self.add_sprites, [enemy], 1])
-            self.delay_timers.append([30, self.add_sprites, [particles], 1])
+            Scheduler.schedule(30, self.add_sprites, [enemy], clock='entity')
+            Scheduler.schedule(30, self.add_sprites, [particles], clock='entity')
 
         if 'swarm' in selected_enemy.ENEMY_FLAGS:
             spawn_enemy()
             for _ in range(selected_enemy.ENEMY_FLAGS['swarm'] - 1):
-                spawn_enemy(swarm=True)
+                Spawner.queue(spawn_enemy, [True])
 
         else:
             spawn_enemy()
@@ -414,12 +412,18 @@ class GameLoop(Scene):
         if self.tiles:
             self.del_sprites(self.tiles)
 
-        tilemap = load_tilemap(self.level_info['area'][0], f'floor-{self.level_info["pattern"][0]}')
+        map_name = f'floor-{self.level_info["pattern"][0]}'
+        tilemap = load_tilemap(self.level_info['area'][0], map_name)
 
         self.entity_surface = tilemap['surface']
         self.tiles = tilemap['tiles']
         self.flags = tilemap['flags']
 
+        NavGrid.load(self.tiles, self.entity_surface.get_size(), tilemap['tile_dimensions'][0])
+
+        # Tiles only change here, so this is the one place cached sight lines go stale
+        LineOfSight.reset()
+
         self.player.overrides['inactive-all'] = True
         self.player.rect.x, self.player.rect.y = tilemap['flags']['player_spawn'][0]
 
@@ -438,8 +442,13 @@ class GameLoop(Scene):
                         'enemy': int(flag.split('_')[2])
                     })
 
+        Spawner.load(self.enemy_info['spawns'], self.enemy_info['spawn_distance'])
+
         self.add_sprites(self.tiles)
 
+        if MemoryReport.enabled:
+            MemoryReport.on_floor(self, f'{self.level_info["area"][0]}/{map_name}')
+
     def load_intro(self):
         for frame in self.ui_elements:
             frame.image.set_alpha(0)
@@ -447,10 +456,10 @@ class GameLoop(Scene):
         particles = []
         pos = self.player.center_position
         for _ in range(6):
-            cir = Circle(pos, PLAYER_COLOR, random.randint(5, 7), 0)
+            cir = Circle(pos, PLAYER_COLOR, Rng.randint(5, 7), 0)
             cir.set_goal(
                         75, 
-                        position=(pos[0] + random.randint(-75, 75), pos[1] + random.randint(-75, 75)), 
+                        position=(pos[0] + Rng.randint(-75, 75), pos[1] + Rng.randint(-75, 75)), 
                         radius=0, 
                         width=0
                     )
@@ -480,19 +489,19 @@ class GameLoop(Scene):
         floor_text_sub.rect.x = (SCREEN_DIMENSIONS[0] / 2) - (floor_text_sub.image.get_width() / 2)
         floor_text_sub.rect.y = 140
 
-        self.delay_timers.append([10, self.add_sprites, [player_particle], True])
-        self.delay_timers.append([70, self.add_sprites, [particles], True])
+        Scheduler.schedule(10, self.add_sprites, [player_particle], clock='entity')
+        Scheduler.schedule(70, self.add_sprites, [particles], clock='entity')
 
-        self.delay_timers.append([90, floor_text.set_alpha_bezier, [0, 45, presets['ease_out']], True])
-        self.delay_timers.append([90, floor_text.set_y_bezier, [floor_text.rect.y - 50, 45, presets['ease_out']], True])
+        Scheduler.schedule(90, floor_text.set_alpha_bezier, [0, 45, presets['ease_out']], clock='entity')
+        Scheduler.schedule(90, floor_text.set_y_bezier, [floor_text.rect.y - 50, 45, presets['ease_out']], clock='entity')
 
-        self.delay_timers.append([90, floor_text_sub.set_alpha_bezier, [0, 45, presets['ease_out']], True])
-        self.delay_timers.append([90, floor_text_sub.set_y_bezier, [floor_text_sub.rect.y - 50, 45, presets['ease_out']], True])
+        Scheduler.schedule(90, floor_text_sub.set_alpha_bezier, [0, 45, presets['ease_out']], clock='entity')
+        Scheduler.schedule(90, floor_text_sub.set_y_bezier, [floor_text_sub.rect.y - 50, 45, presets['ease_out']], clock='entity')
 
-        self.delay_timers.append([70, self.player.set_override, ['inactive-all', False], True])
+        Scheduler.schedule(70, self.player.set_override, ['inactive-all', False], clock='entity')
 
         for frame in self.ui_elements:
-            self.delay_timers.append([90, frame.set_alpha_bezier, [255, 60, presets['ease_out']], True]) 
+            Scheduler.schedule(90, frame.set_alpha_bezier, [255, 60, presets['ease_out']], clock='entity')
 
         self.scene_fx['&dim']['type'] = 'out'
         self.scene_fx['&dim']['bezier'] = presets['ease_out']
@@ -536,7 +545,7 @@ class GameLoop(Scene):
         discard.set_y_bezier(0 - discard.rect.height * 1.1, 20, presets['ease_out'])
         discard.set_alpha_bezier(0, 20, presets['ease_out'])
 
-        self.delay_timers.append([20, self.del_sprites, [discard]])
+        Scheduler.schedule(20, self.del_sprites, [discard])
 
         flavor_text.set_y_bezier(0, 30, presets['ease_out'])
         flavor_text.set_alpha_bezier(0, 25, [*presets['rest'], 0])
@@ -572,10 +581,11 @@ class GameLoop(Scene):
         # print(f'discarded card options')
         self.remove_cards(None, cards, flavor_text, discard)
 
+    @traced('generate_standard_cards')
     def generate_standard_cards(self, count=3):
         def on_select(selected_card, cards, flavor_text):
             if selected_card.draw.DRAW_TYPE == 'TALENT':
-                self.player.talents.append(selected_card.draw(self, self.player))
+                add_talent(self.player, selected_card.draw(self, self.player))
                 # print(f'selected talent card: {selected_card.draw.DESCRIPTION["name"]}')
                     
             elif selected_card.draw.DRAW_TYPE == 'ABILITY':
@@ -633,7 +643,9 @@ class GameLoop(Scene):
 
             drawables.append(ability)
 
-        draws = random.sample(drawables, k=draw_count)
+        StandardCard.prewarm(drawables)
+
+        draws = Rng.sample(drawables, k=draw_count)
         cards = []
 
         x = (SCREEN_DIMENSIONS[0] * .5) - 80
@@ -658,14 +670,14 @@ class GameLoop(Scene):
         flavor_text.set_y_bezier(y - 150, 30, presets['ease_out'])
         flavor_text.set_alpha_bezier(255, 45, [*presets['rest'], 0])
 
-        img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'discard.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'ui', 'card', 'discard.png'))
         img = pygame.transform.scale(img, (img.get_width() * 3, img.get_height() * 3))
         
         discard = Button([cards[-1].rect.right + img.get_width() * 1.5, 0], img, 3, 0)
         discard.flag = 'init'
         discard.hover_info['color'] = cards[-1].hover_info['color']
         
-        discard.delay_timers.append([30, discard.set_flag, [None]])
+        discard.add_delay_timer(30, discard.set_flag, [None])
         discard.set_alpha_bezier(255, 30, presets['ease_out'])
         discard.set_y_bezier(225, 30, presets['ease_out'])
 
@@ -678,6 +690,7 @@ class GameLoop(Scene):
 
         return cards, flavor_text, discard
 
+    @traced('generate_ability_fail_cards')
     def generate_ability_fail_cards(self, previous_selected_card):
         def on_select(selected_card, cards, flavor_text):
             for inp in self.player.abilities.keys():
@@ -720,14 +733,14 @@ class GameLoop(Scene):
         flavor_text.set_y_bezier(y - 150, 30, presets['ease_out'])
         flavor_text.set_alpha_bezier(255, 45, [*presets['rest'], 0])
 
-        img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'discard.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'ui', 'card', 'discard.png'))
         img = pygame.transform.scale(img, (img.get_width() * 3, img.get_height() * 3))
         
         discard = Button([cards[-1].rect.right + img.get_width() * 1.5, 0], img, 3, 0)
         discard.flag = 'init'
         discard.hover_info['color'] = cards[-1].hover_info['color']
         
-        discard.delay_timers.append([30, discard.set_flag, [None]])
+        discard.add_delay_timer(30, discard.set_flag, [None])
         discard.set_alpha_bezier(255, 30, presets['ease_out'])
         discard.set_y_bezier(225, 30, presets['ease_out'])
 
@@ -740,6 +753,7 @@ class GameLoop(Scene):
 
         return cards, flavor_text, discard
 
+    @traced('generate_stat_cards')
     def generate_stat_cards(self):
         def on_select(selected_card, cards, flavor_text):
             # print(f'selected stat card: {selected_card.stat["name"]}')
@@ -780,14 +794,14 @@ class GameLoop(Scene):
         flavor_text.set_y_bezier(y - 150, 30, presets['ease_out'])
         flavor_text.set_alpha_bezier(255, 45, [*presets['rest'], 0])
 
-        img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'discard.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'ui', 'card', 'discard.png'))
         img = pygame.transform.scale(img, (img.get_width() * 3, img.get_height() * 3))
 
         discard = Button([cards[-1].rect.right + img.get_width() * 1.5, 0], img, 3, 0)
         discard.flag = 'init'
         discard.hover_info['color'] = cards[-1].hover_info['color']
         
-        discard.delay_timers.append([30, discard.set_flag, [None]])
+        discard.add_delay_timer(30, discard.set_flag, [None])
         discard.set_alpha_bezier(255, 30, presets['ease_out'])
         discard.set_y_bezier(225, 30, presets['ease_out'])
 
@@ -800,15 +814,12 @@ class GameLoop(Scene):
 
         return cards, flavor_text, discard
 
-    def apply_scene_fx(self, dt):
-        entity_display = pygame.Surface(SCREEN_DIMENSIONS).convert_alpha()
-        entity_display.fill((0, 0, 0, 0))
-
-        entity_display.blit(self.entity_surface, (-self.camera_offset[0], -self.camera_offset[1]))
+    def update_scene_fx(self):
+        zoom = 1.0
+        dim_alpha = None
 
         if self.scene_fx['entity_zoom']['type']:
             abs_prog = self.scene_fx['entity_zoom']['frames'][0] / self.scene_fx['entity_zoom']['frames'][1]
-            zoom = 1.0
             
             if self.scene_fx['entity_zoom']['type'] == 'in':
                 zoom += self.scene_fx['entity_zoom']['amount'] * get_bezier_point(abs_prog, *self.scene_fx['entity_zoom']['bezier'])
@@ -822,30 +833,28 @@ class GameLoop(Scene):
                 else:
                     self.scene_fx['entity_zoom']['type'] = None
 
-            entity_display = pygame.transform.scale(entity_display, (entity_display.get_width() * zoom, entity_display.get_height() * zoom)).convert_alpha()
-
-        dim_display = None
-
         if self.scene_fx['&dim']['type']:
             abs_prog = self.scene_fx['&dim']['frames'][0] / self.scene_fx['&dim']['frames'][1]
-            dim_display = pygame.Surface(SCREEN_DIMENSIONS)
-            dim_display.fill((0, 0, 0))
 
             if self.scene_fx['&dim']['type'] == 'in':
-                dim_display.set_alpha(255 * (self.scene_fx['&dim']['amount'] * get_bezier_point(abs_prog, *self.scene_fx['&dim']['bezier'])))
+                dim_alpha = 255 * (self.scene_fx['&dim']['amount'] * get_bezier_point(abs_prog, *self.scene_fx['&dim']['bezier']))
                 if self.scene_fx['&dim']['frames'][0] < self.scene_fx['&dim']['frames'][1]:
                     self.scene_fx['&dim']['frames'][0] += 1
 
             elif self.scene_fx['&dim']['type'] == 'out':
-                dim_display.set_alpha(255 * (self.scene_fx['&dim']['amount'] * get_bezier_point(abs_prog, *self.scene_fx['&dim']['bezier'])))
+                dim_alpha = 255 * (self.scene_fx['&dim']['amount'] * get_bezier_point(abs_prog, *self.scene_fx['&dim']['bezier']))
                 if self.scene_fx['&dim']['frames'][0] > 0:
                     self.scene_fx['&dim']['frames'][0] -= 1
                 else:
                     self.scene_fx['&dim']['type'] = None
 
-        return [None, entity_display, None, dim_display]
+        return zoom, dim_alpha
 
     def display(self, screen, clock, dt):
+        profiling = FrameProfiler.enabled
+        if profiling:
+            lap = time.perf_counter_ns()
+
         if self.dt_info['frames'] > 0:
             dt *= self.dt_info['multiplier']
             self.dt_info['frames'] -= 1
@@ -856,17 +865,54 @@ class GameLoop(Scene):
         entity_dt = dt
         if self.paused:
             entity_dt = 0
+
+        CombatTimers.advance(entity_dt)
+
+        for sprite in self.sprite_list:
+            sprite.tick_position = [sprite.rect.x, sprite.rect.y]
+
+        # Applied before any sprite displays, so outlines and draws see this tick's tweened values
+        Tweens.step(dt, entity_dt)
+
+        LineOfSight.refill()
+
+        if profiling:
+            lap = FrameProfiler.lap('timers', lap)
         
         entity_view = pygame.Rect(
             self.camera_offset[0] - self.view.width * .25, self.camera_offset[1] - self.view.height * .25, 
             self.view.width * 1.5, self.view.height * 1.5
         )
 
-        self.background_surface.fill((0, 0, 0, 255), entity_view)
-        self.entity_surface.fill((0, 0, 0, 0), entity_view)
-        self.ui_surface.fill((0, 0, 0, 0), self.view)
+        Activation.update(entity_view, self.player.center_position)
+
+        visible_view = self.view.move(self.camera_offset)
+        near_view = visible_view.inflate(self.view.width * 2, self.view.height * 2)
+        AiLod.update(self.get_sprites('enemy'), visible_view, near_view, entity_dt)
+
+        # Enemies are steered toward where the player ended the last tick, all before any of them move
+        if not self.paused:
+            AiSystem.update(self, self.player)
+
+        if profiling:
+            lap = FrameProfiler.lap('ai', lap)
+
+        if self.render:
+            self.draw_list.targets = {
+                'background': self.background_surface,
+                'entity': self.entity_surface,
+                'ui': self.ui_surface
+            }
+
+            self.draw_list.fill('background', (0, 0, 0, 255), entity_view)
+            self.draw_list.fill('entity', (0, 0, 0, 0), entity_view)
+            self.draw_list.fill('ui', (0, 0, 0, 0), self.view)
 
         display_order = self.sort_sprites(self.sprite_list)
+
+        if profiling:
+            lap = FrameProfiler.lap('sort', lap)
+
         for _, v in sorted(display_order.items()):
             for sprite in v: 
                 if not sprite.active:
@@ -874,57 +920,73 @@ class GameLoop(Scene):
 
                 if isinstance(sprite, Entity):
                     if isinstance(sprite, Tile):
-                        if not entity_view.colliderect(sprite.rect):
+                        if not self.render or not entity_view.colliderect(sprite.rect):
                             continue
 
-                    sprite.display(self, entity_dt)
+                    elif not Activation.is_awake(sprite):
+                        continue
+
+                    sprite_dt = entity_dt
+                    if sprite.sprite_id == 'enemy':
+                        sprite_dt = sprite.lod_info['dt']
+                        if sprite_dt is None:
+                            continue
+
+                    sprite.display(self, sprite_dt)
+
+                    if profiling:
+                        start, lap = lap, FrameProfiler.lap('entities', lap)
+                        FrameProfiler.add_class(sprite.__class__.__name__, start, lap)
+
                     continue
 
                 sprite.display(self, dt)
 
-        remove_list = []
-        for i in range(len(self.delay_timers)):
-            if self.delay_timers[i][0] > 0:
-                if len(self.delay_timers[i]) == 4:
-                    if self.delay_timers[i][3] == 1:
-                        self.delay_timers[i][0] -= 1 * entity_dt
-                else:
-                    self.delay_timers[i][0] -= 1
+                if profiling:
+                    lap = FrameProfiler.lap('ui', lap)
 
-                if self.delay_timers[i][0] <= 0 and self.delay_timers[i][1]:
-                    self.delay_timers[i][1](*self.delay_timers[i][2])
-                    remove_list.append(self.delay_timers[i])
+        Scheduler.advance('scene', 1)
+        Scheduler.advance('entity', entity_dt)
 
-        for element in remove_list:
-            self.delay_timers.remove(element)
+        if profiling:
+            lap = FrameProfiler.lap('timers', lap)
 
         self.register_enemy_flags(entity_dt)
         self.register_player_flags()
 
+        if profiling:
+            lap = FrameProfiler.lap('spawning', lap)
+
+        self.previous_camera_offset = self.camera_offset
         self.camera_offset = self.camera.update(dt)
 
-        display_list = self.apply_scene_fx(dt)
-        screen.blit(self.background_surface, (0, 0))
-        if display_list[3] and self.scene_fx['&dim']['threshold'] == 2:
-            screen.blit(display_list[3], (0, 0))
+        if profiling:
+            lap = FrameProfiler.lap('camera', lap)
+
+        zoom, dim_alpha = self.update_scene_fx()
+
+        if self.render:
+            self.draw_list.composite = {
+                'camera_offset': self.camera_offset,
+                'camera_motion': [
+                    self.camera_offset[0] - self.previous_camera_offset[0],
+                    self.camera_offset[1] - self.previous_camera_offset[1]
+                ],
+                'zoom': zoom,
+                'dim_alpha': dim_alpha,
+                'dim_threshold': self.scene_fx['&dim']['threshold'],
+                'player_dim': self.scene_fx['player_dim']['amount']
+            }
+
+        if profiling:
+            lap = FrameProfiler.lap('fx', lap)
 
-        screen.blit(display_list[1], (display_list[1].get_rect(center=screen.get_rect().center)))
-        if display_list[3] and self.scene_fx['&dim']['threshold'] == 1:
-            screen.blit(display_list[3], (0, 0))
-            
-        player_dim = pygame.Surface(SCREEN_DIMENSIONS)
-        player_dim.fill((0, 0, 0))
-        player_dim.set_alpha(255 * (self.scene_fx['player_dim']['amount']))                          
-        screen.blit(player_dim, (0, 0))
-
-        screen.blit(self.ui_surface, (0, 0))
-        if display_list[3] and self.scene_fx['&dim']['threshold'] == 0:
-            screen.blit(display_list[3], (0, 0))
-    
         self.mouse.display(self, screen)
 
+        if profiling:
+            FrameProfiler.lap('mouse', lap)
+
         self.frame_count_raw += 1 * dt
         self.frame_count = round(self.frame_count_raw)
 
         super().display(screen, clock, dt)
-    
\ No newline at end of file
@@ -0,0 +1,76 @@
+from scripts import SCREEN_DIMENSIONS
+
+from scripts.tools.input_source import ScriptedInput, wander_script
+
+import pygame
+import time
+import os
+
+# Boots pygame on the SDL dummy drivers, must run before anything touches the display
+def init_headless():
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    pygame.init()
+    pygame.mixer.init()
+
+    return pygame.display.set_mode(SCREEN_DIMENSIONS), pygame.time.Clock()
+
+def create_scene_handler(screen, clock, input_source=None, render=True, renderer=None):
+    from scripts.scene_handler import SceneHandler
+    from scripts.renderer import Renderer
+
+    from scripts.tools.sfx_manager import Sfx
+    from scripts.tools.fonts import Fonts
+    from scripts.tools.inputs import Inputs
+
+    Fonts.init()
+    Inputs.init()
+    Sfx.init()
+
+    if input_source is None:
+        input_source = ScriptedInput(wander_script)
+
+    return SceneHandler(screen, clock, input_source, render, renderer if renderer else Renderer(flip=False))
+
+def run_headless(scene_handler, frames=None, floors=None, dt=1, on_frame=None):
+    frame = 0
+    floors_cleared = 0
+
+    scene = scene_handler.current_scene
+    floor = scene.level_info['floor']
+
+    start = time.perf_counter()
+    while True:
+        if frames is not None and frame >= frames:
+            break
+
+        if floors is not None and floors_cleared >= floors:
+            break
+
+        if scene_handler.update(dt):
+            break
+
+        frame += 1
+
+        if scene_handler.current_scene is not scene:
+            scene = scene_handler.current_scene
+            floor = scene.level_info['floor']
+
+        elif scene.level_info['floor'] != floor:
+            floors_cleared += scene.level_info['floor'] - floor
+            floor = scene.level_info['floor']
+
+        if on_frame:
+            on_frame(scene_handler, frame)
+
+    scene_handler.renderer.wait()
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        'frames': frame,
+        'floors': floors_cleared,
+        'seconds': round(elapsed, 3),
+        'fps': round(frame / elapsed, 1) if elapsed else 0
+    }
@@ -0,0 +1,409 @@
+from scripts import SCREEN_DIMENSIONS, FRAME_RATE
+
+from scripts.tools.frame_profiler import FrameProfiler
+from scripts.tools.tracer import Tracer
+
+import threading
+import weakref
+import pygame
+import math
+import time
+
+class DrawLayer:
+    def __init__(self, copy_all=False):
+        self.copy_all = copy_all
+
+        self.fills = []
+        self.commands = []
+
+        self.moving = []
+
+        self.static = set()
+
+    # copy_all snapshots every source, a surface the simulation reads can still be locked underneath a blit on another thread
+    # static and owned=True sources are never copied, nothing touches their pixels once they are queued
+    def blit(self, surface, dest, area=None, special_flags=0, copy=False, static=False, motion=None, owned=False):
+        if isinstance(dest, pygame.Rect):
+            dest = dest.topleft
+
+        if not owned and (copy or self.copy_all and not static):
+            surface = surface.copy()
+
+        if static:
+            self.static.add(id(surface))
+
+        if motion and (motion[0] or motion[1]):
+            self.moving.append((len(self.commands), motion))
+
+        self.commands.append((
+            surface,
+            (dest[0], dest[1]),
+            pygame.Rect(area) if area else None,
+            special_flags
+        ))
+
+    def fill(self, color, rect=None):
+        self.fills.append((color, pygame.Rect(rect) if rect else None))
+
+    def get_commands(self, interpolation):
+        if not self.moving or interpolation == 1:
+            return self.commands
+
+        t = 1 - interpolation
+
+        commands = self.commands.copy()
+        for index, motion in self.moving:
+            surface, dest, area, special_flags = commands[index]
+            commands[index] = (surface, (dest[0] - motion[0] * t, dest[1] - motion[1] * t), area, special_flags)
+
+        return commands
+
+class DrawList:
+    LAYERS = ['background', 'entity', 'ui', 'screen']
+
+    def __init__(self, copy_all=False):
+        self.layers = {layer: DrawLayer(copy_all) for layer in DrawList.LAYERS}
+
+        self.targets = {}
+        self.composite = None
+
+        self.scale = 1.0
+
+        self.interpolation = 1.0
+
+    def blit(self, layer, surface, dest, area=None, special_flags=0, copy=False, static=False, motion=None, owned=False):
+        self.layers[layer].blit(surface, dest, area, special_flags, copy, static, motion, owned)
+
+    def fill(self, layer, color, rect=None):
+        self.layers[layer].fill(color, rect)
+
+# With a thread the screen shows frame N while frame N+1 simulates, at the cost of a frame of latency
+class Renderer:
+    SCALES = [1.0, .75, .5]
+
+    RENDER_SHARE = .5
+    SMOOTHING = .1
+    RAISE_RATIO = .7
+    HOLD_FRAMES = 30
+
+    surfaces = {}
+
+    scaled = weakref.WeakKeyDictionary()
+
+    def __init__(self, threaded=False, flip=True, scale=1.0, budget_ms=None):
+        self.threaded = threaded
+        self.flip = flip
+
+        self.auto_scale = scale == 'auto'
+        self.scale = 1.0 if self.auto_scale else scale
+
+        self.budget_ms = budget_ms if budget_ms else 1000 / FRAME_RATE
+        self.render_average_ms = None
+        self.hold = Renderer.HOLD_FRAMES
+
+        self.thread = None
+        self.pending = False
+
+        self.submitted = threading.Event()
+        self.done = threading.Event()
+        self.done.set()
+
+        self.draw_list = None
+        self.screen = None
+        self.error = None
+
+        self.render_ms = 0
+
+        if threaded:
+            self.thread = threading.Thread(target=self.run, name='renderer', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        named = False
+
+        while True:
+            self.submitted.wait()
+            self.submitted.clear()
+
+            if self.draw_list is None:
+                return
+
+            if Tracer.enabled and not named:
+                Tracer.name_thread('renderer')
+                named = True
+
+            start = time.perf_counter_ns()
+
+            try:
+                Renderer.render(self.draw_list, self.screen)
+
+            except Exception as e:
+                self.error = e
+
+            end = time.perf_counter_ns()
+            self.render_ms = (end - start) / 1e6
+
+            Tracer.complete('Renderer.render', start, end, 'render', tid=threading.get_ident())
+
+            self.done.set()
+
+    def wait(self):
+        if not self.pending:
+            return
+
+        profiling = FrameProfiler.enabled
+        if profiling:
+            lap = time.perf_counter_ns()
+
+        self.done.wait()
+        self.pending = False
+
+        if self.error:
+            error, self.error = self.error, None
+            raise error
+
+        self.update_scale(self.render_ms)
+
+        if profiling:
+            lap = FrameProfiler.lap('render', lap)
+
+        if self.flip:
+            pygame.display.flip()
+
+            if profiling:
+                FrameProfiler.lap('flip', lap)
+
+    def submit(self, draw_list, screen, interpolation=1.0):
+        if not self.threaded:
+            draw_list.scale = self.scale
+            draw_list.interpolation = interpolation
+
+            profiling = FrameProfiler.enabled
+            if profiling:
+                lap = time.perf_counter_ns()
+
+            start = time.perf_counter_ns()
+            Renderer.render(draw_list, screen)
+            self.update_scale((time.perf_counter_ns() - start) / 1e6)
+
+            if profiling:
+                lap = FrameProfiler.lap('render', lap)
+
+            if self.flip:
+                pygame.display.flip()
+
+                if profiling:
+                    FrameProfiler.lap('flip', lap)
+
+            return
+
+        self.wait()
+
+        draw_list.scale = self.scale
+        draw_list.interpolation = interpolation
+
+        self.draw_list = draw_list
+        self.screen = screen
+
+        self.pending = True
+        self.done.clear()
+        self.submitted.set()
+
+    def cycle_scale(self):
+        modes = Renderer.SCALES + ['auto']
+        mode = 'auto' if self.auto_scale else self.scale
+
+        mode = modes[(modes.index(mode) + 1) % len(modes)]
+
+        self.auto_scale = mode == 'auto'
+        self.scale = 1.0 if self.auto_scale else mode
+
+        self.render_average_ms = None
+        self.hold = Renderer.HOLD_FRAMES
+
+    def update_scale(self, render_ms):
+        if not self.auto_scale:
+            return
+
+        if self.render_average_ms is None:
+            self.render_average_ms = render_ms
+
+        else:
+            self.render_average_ms += (render_ms - self.render_average_ms) * Renderer.SMOOTHING
+
+        if self.hold > 0:
+            self.hold -= 1
+            return
+
+        budget_ms = self.budget_ms * Renderer.RENDER_SHARE
+
+        index = Renderer.SCALES.index(self.scale)
+        if self.render_average_ms > budget_ms and index < len(Renderer.SCALES) - 1:
+            index += 1
+
+        elif self.render_average_ms < budget_ms * Renderer.RAISE_RATIO and index > 0:
+            index -= 1
+
+        else:
+            return
+
+        self.scale = Renderer.SCALES[index]
+        self.hold = Renderer.HOLD_FRAMES
+
+    def stop(self):
+        self.wait()
+
+        if self.thread:
+            self.draw_list = None
+            self.submitted.set()
+            self.thread.join()
+
+            self.thread = None
+
+    @staticmethod
+    def draw_layer(target, layer, interpolation):
+        for color, rect in layer.fills:
+            target.fill(color, rect)
+
+        if layer.commands:
+            target.blits(layer.get_commands(interpolation), doreturn=False)
+
+    @staticmethod
+    def render(draw_list, screen):
+        screen_layer = draw_list.layers['screen']
+        for color, rect in screen_layer.fills:
+            screen.fill(color, rect)
+
+        scaled = draw_list.scale != 1.0 and draw_list.composite
+
+        for layer in ['background', 'entity', 'ui']:
+            if layer in draw_list.targets and not (scaled and layer == 'entity'):
+                Renderer.draw_layer(draw_list.targets[layer], draw_list.layers[layer], draw_list.interpolation)
+
+        if draw_list.composite:
+            Renderer.draw_composite(draw_list, screen)
+
+        if screen_layer.commands:
+            screen.blits(screen_layer.get_commands(draw_list.interpolation), doreturn=False)
+
+    @staticmethod
+    def get_surface(name, size, alpha=False):
+        key = (name, size)
+
+        surface = Renderer.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha() if alpha else pygame.Surface(size).convert()
+            Renderer.surfaces[key] = surface
+
+        return surface
+
+    @staticmethod
+    def get_dim(size, alpha):
+        dim = Renderer.get_surface('dim', size)
+        dim.set_alpha(alpha)
+
+        return dim
+
+    @staticmethod
+    def draw_composite(draw_list, screen):
+        composite = draw_list.composite
+        targets = draw_list.targets
+
+        t = 1 - draw_list.interpolation
+        camera_offset = [
+            composite['camera_offset'][0] - composite['camera_motion'][0] * t,
+            composite['camera_offset'][1] - composite['camera_motion'][1] * t
+        ]
+
+        scale = draw_list.scale
+        if scale == 1.0:
+            world = screen
+            Renderer.draw_world(composite, targets, camera_offset, screen)
+
+        else:
+            world = Renderer.draw_world_scaled(composite, targets, draw_list.layers['entity'], draw_list.interpolation, camera_offset, scale)
+
+        if composite['player_dim']:
+            world.blit(Renderer.get_dim(world.get_size(), 255 * composite['player_dim']), (0, 0))
+
+        if world is not screen:
+            pygame.transform.scale(world, screen.get_size(), screen)
+
+        screen.blit(targets['ui'], (0, 0))
+        if composite['dim_alpha'] is not None and composite['dim_threshold'] == 0:
+            screen.blit(Renderer.get_dim(SCREEN_DIMENSIONS, composite['dim_alpha']), (0, 0))
+
+    @staticmethod
+    def draw_world(composite, targets, camera_offset, screen):
+        entity_display = Renderer.get_surface('entity', SCREEN_DIMENSIONS, True)
+        entity_display.fill((0, 0, 0, 0))
+
+        entity_display.blit(targets['entity'], (-camera_offset[0], -camera_offset[1]))
+
+        zoom = composite['zoom']
+        if zoom != 1.0:
+            entity_display = pygame.transform.scale(entity_display, (entity_display.get_width() * zoom, entity_display.get_height() * zoom)).convert_alpha()
+
+        dim_alpha = composite['dim_alpha']
+        threshold = composite['dim_threshold']
+
+        screen.blit(targets['background'], (0, 0))
+        if dim_alpha is not None and threshold == 2:
+            screen.blit(Renderer.get_dim(SCREEN_DIMENSIONS, dim_alpha), (0, 0))
+
+        screen.blit(entity_display, entity_display.get_rect(center=screen.get_rect().center))
+        if dim_alpha is not None and threshold == 1:
+            screen.blit(Renderer.get_dim(SCREEN_DIMENSIONS, dim_alpha), (0, 0))
+
+    @staticmethod
+    def get_scaled(surface, factor, static):
+        size = (math.ceil(surface.get_width() * factor), math.ceil(surface.get_height() * factor))
+        if not static:
+            return pygame.transform.scale(surface, size)
+
+        entry = Renderer.scaled.get(surface)
+        if entry is None or entry[0] != factor:
+            entry = [factor, pygame.transform.scale(surface, size)]
+            Renderer.scaled[surface] = entry
+
+        entry[1].set_alpha(surface.get_alpha())
+
+        return entry[1]
+
+    @staticmethod
+    def draw_world_scaled(composite, targets, layer, interpolation, camera_offset, scale):
+        size = (round(SCREEN_DIMENSIONS[0] * scale), round(SCREEN_DIMENSIONS[1] * scale))
+
+        world = Renderer.get_surface('world', size)
+        entity_display = Renderer.get_surface('entity', size, True)
+        entity_display.fill((0, 0, 0, 0))
+
+        center = [camera_offset[0] + SCREEN_DIMENSIONS[0] * .5, camera_offset[1] + SCREEN_DIMENSIONS[1] * .5]
+
+        factor = composite['zoom'] * scale
+        bounds = entity_display.get_rect()
+
+        for surface, dest, area, special_flags in layer.get_commands(interpolation):
+            if area:
+                surface = surface.subsurface(area.clip(surface.get_rect()))
+
+            x = (dest[0] - center[0]) * factor + size[0] * .5
+            y = (dest[1] - center[1]) * factor + size[1] * .5
+            if not bounds.colliderect((x, y, surface.get_width() * factor + 1, surface.get_height() * factor + 1)):
+                continue
+
+            static = area is None and id(surface) in layer.static
+            entity_display.blit(Renderer.get_scaled(surface, factor, static), (x, y), None, special_flags)
+
+        dim_alpha = composite['dim_alpha']
+        threshold = composite['dim_threshold']
+
+        pygame.transform.scale(targets['background'], size, world)
+        if dim_alpha is not None and threshold == 2:
+            world.blit(Renderer.get_dim(size, dim_alpha), (0, 0))
+
+        world.blit(entity_display, (0, 0))
+        if dim_alpha is not None and threshold == 1:
+            world.blit(Renderer.get_dim(size, dim_alpha), (0, 0))
+
+        return world
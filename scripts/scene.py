@@ -2,8 +2,15 @@ from scripts import SCREEN_DIMENSIONS
 
 from scripts.visual_fx.particle import Particle
 
+from scripts.renderer import DrawList
+
+from scripts.core_systems.scheduler import Scheduler
+from scripts.core_systems.tweens import Tweens
+
 from scripts.ui.text_box import TextBox
 
+from scripts.tools.frame_profiler import FrameProfiler
+
 import pygame
 
 class Scene:
@@ -11,6 +18,10 @@ class Scene:
         self.scene_handler = scene_handler
         self.mouse = mouse
 
+        self.render = scene_handler.render
+
+        self.draw_list = DrawList()
+
         self.view = pygame.Surface(SCREEN_DIMENSIONS).get_rect()
 
         self.dt_info = {
@@ -79,10 +90,18 @@ class Scene:
         return display_order
         
     def display(self, screen, clock, dt):
+        if not self.render:
+            return
+
+        if FrameProfiler.show_overlay:
+            overlay, position = FrameProfiler.draw()
+            self.draw_list.blit('screen', overlay, position)
+            return
+
         fps_surface = TextBox.create_text_line('default', round(clock.get_fps()))
         fps_position = [SCREEN_DIMENSIONS[0] - 5, 5]
 
-        screen.blit(fps_surface, fps_surface.get_rect(topright=fps_position))
+        self.draw_list.blit('screen', fps_surface, fps_surface.get_rect(topright=fps_position))
 
     def on_mouse_down(self, event):
         for sprite in self.sprite_list:
@@ -209,4 +228,7 @@ class Scene:
                     del self.sprites[sprite_id][secondary_sprite_id]
 
                 if len([i for s in [v for v in self.sprites[sprite_id].values()] for i in s]) == 0:
-                    del self.sprites[sprite_id]
\ No newline at end of file
+                    del self.sprites[sprite_id]
+
+            Scheduler.cancel_owner(sprite)
+            Tweens.cancel_owner(sprite)
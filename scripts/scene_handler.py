@@ -5,21 +5,42 @@ from scripts import (
 )
 
 from scripts.game_loop import GameLoop
+from scripts.renderer import Renderer, DrawList
+
+from scripts.core_systems.activation import Activation
+from scripts.core_systems.enemy_ai import AiLod
 
 from scripts.ui.card import Card
 from scripts.ui.mouse import Mouse
 
 from scripts.tools.inputs import Inputs
+from scripts.tools.sfx_manager import Sfx
+from scripts.tools.input_source import LiveInput
+from scripts.tools.frame_profiler import FrameProfiler
+from scripts.tools.hot_path_counters import HotPathCounters
+from scripts.tools.tracer import Tracer
 
 import pygame
 import time
 
 class SceneHandler:
-    def __init__(self, screen, clock):
+    STEP = 1
+
+    # Time past this many ticks in one frame is dropped, so a long stall slows the game down instead of snowballing
+    MAX_TICKS = 3
+
+    # Timer jitter this close to a whole tick is snapped away, so rendering at FRAME_RATE never alternates zero and two ticks
+    SNAP = .05
+
+    def __init__(self, screen, clock, input_source=None, render=True, renderer=None):
         self.screen = screen
         self.clock = clock
         self.fullscreen = False
 
+        self.input_source = input_source if input_source else LiveInput()
+        self.render = render
+        self.renderer = renderer if renderer else Renderer()
+
         self.mouse = Mouse()
 
         self.current_scene = GameLoop(self, self.mouse)
@@ -27,23 +48,52 @@ class SceneHandler:
 
         self.last_time = time.time()
 
+        self.accumulator = 0
+        self.dropped_time = 0
+
+        self.last_draw_list = None
+
         Card.init()
 
     def set_new_scene(self, scene, info):
         self.current_scene = scene(self, self.mouse)
+        self.last_draw_list = None
+
+    def update(self, dt=None):
+        update_start = time.perf_counter_ns()
 
-    def update(self):
-        delta_time = (time.time() - self.last_time) * FRAME_RATE
+        profiling = FrameProfiler.enabled
+        if profiling:
+            FrameProfiler.next_frame()
+            lap = frame_start = update_start
+
+        if HotPathCounters.enabled:
+            HotPathCounters.next_frame()
+
+        delta_time = (time.time() - self.last_time) * FRAME_RATE if dt is None else dt
         self.last_time = time.time()
 
-        for event in pygame.event.get():
+        delta_time, events, keys, Inputs.mouse_pos, Inputs.mods = self.input_source.get_frame(delta_time)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return True
 
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_0:
+                if event.key == pygame.K_9:
+                    FrameProfiler.toggle()
+
+                elif event.key == pygame.K_8:
+                    HotPathCounters.toggle()
+
+                elif event.key == pygame.K_7:
+                    self.renderer.cycle_scale()
+
+                elif event.key == pygame.K_0:
                     self.fullscreen = not self.fullscreen
 
+                    self.renderer.wait()
+
                     if self.fullscreen:
                         self.screen = pygame.display.set_mode(SCREEN_DIMENSIONS, pygame.FULLSCREEN|pygame.SCALED)
                     
@@ -62,9 +112,65 @@ class SceneHandler:
             if event.type == pygame.MOUSEBUTTONUP: 
                 self.current_scene.on_mouse_up(event)
 
-        Inputs.get_keys_pressed()
+        Inputs.get_keys_pressed(keys)
+
+        if profiling:
+            lap = FrameProfiler.lap('events', lap)
 
-        self.screen.fill(SCREEN_COLOR)
-        self.current_scene.display(self.screen, self.clock, delta_time)
+        self.accumulator += delta_time
+        if abs(self.accumulator - round(self.accumulator / SceneHandler.STEP) * SceneHandler.STEP) < SceneHandler.SNAP:
+            self.accumulator = round(self.accumulator / SceneHandler.STEP) * SceneHandler.STEP
+
+        if self.accumulator > SceneHandler.MAX_TICKS * SceneHandler.STEP:
+            self.dropped_time += self.accumulator - SceneHandler.MAX_TICKS * SceneHandler.STEP
+            self.accumulator = SceneHandler.MAX_TICKS * SceneHandler.STEP
+
+        ticks = int(self.accumulator // SceneHandler.STEP)
+        self.accumulator -= ticks * SceneHandler.STEP
+
+        draw_list = None
+        for tick in range(ticks):
+            scene = self.current_scene
+
+            scene.render = self.render and tick == ticks - 1
+            scene.draw_list = DrawList(self.renderer.threaded)
+
+            if scene.render:
+                draw_list = scene.draw_list
+                draw_list.fill('screen', SCREEN_COLOR)
+
+            scene.display(self.screen, self.clock, SceneHandler.STEP)
+
+        if profiling and Tracer.enabled:
+            Tracer.complete(f'{self.current_scene.__class__.__name__}.display', lap, time.perf_counter_ns())
+
+        if draw_list:
+            self.last_draw_list = draw_list
+
+        elif self.render and ticks == 0:
+            draw_list = self.last_draw_list
+
+        if draw_list:
+            self.renderer.submit(draw_list, self.screen, self.accumulator / SceneHandler.STEP)
+
+        Sfx.update()
+
+        if profiling and Tracer.enabled:
+            Tracer.complete('SceneHandler.update', frame_start, time.perf_counter_ns(), args={'frame': FrameProfiler.frame})
+
+            self.trace_counters()
 
         return False
+
+    def trace_counters(self):
+        scene = self.current_scene
+
+        Tracer.counter('sprites', {'count': len(scene.sprite_list)})
+        Tracer.counter('particles', {'count': len(scene.get_sprites('particle'))})
+        Tracer.counter('enemies', {'count': len(scene.get_sprites('enemy'))})
+        Tracer.counter('enemy_lod', AiLod.get_counts(scene.get_sprites('enemy')))
+        Tracer.counter('asleep', {'count': Activation.asleep})
+        Tracer.counter('resolution_scale', {'scale': self.renderer.scale})
+
+        if HotPathCounters.enabled:
+            Tracer.counter('hot_paths', {o: c[0] for o, c in HotPathCounters.get_totals().items()})
@@ -1,4 +1,6 @@
 from scripts.tools.spritesheet_loader import load_spritesheet
+from scripts.tools.asset_loader import AssetLoader
+from scripts.tools.tracer import traced
 
 from scripts.entities.tiles import Block, Ramp, get_all_tiles
 from scripts.entities.interactables import get_all_interactables
@@ -10,6 +12,7 @@ import os
 
 TILEMAP_FOLDER_PATH = os.path.join('resources', 'data', 'tilemap_editor')
 
+@traced('load_tilemap')
 def load_tilemap(area, name):
     path = os.path.join(TILEMAP_FOLDER_PATH, area, name)
     
@@ -25,10 +28,16 @@ def load_tilemap(area, name):
     tiles = []
     flags = {}
 
+    image_paths = {}
+    for image in data['config']['images']:
+        image_paths[image] = os.path.join(path, *data['config']['images'][image]['path'].replace('\\', '/').split('/'))
+
+    AssetLoader.preload(image_paths.values())
+
     images = {}
     for image in data['config']['images']:
         images[image] = {}
-        images[image]['imgs'] = load_spritesheet(os.path.join(path, data['config']['images'][image]['path']), scale=2)
+        images[image]['imgs'] = load_spritesheet(image_paths[image], scale=2)
         images[image]['tiles'] = data['config']['images'][image]['tiles']
     
     tile_classes = {}
@@ -139,5 +148,6 @@ def load_tilemap(area, name):
     return {
         'surface': surface,
         'tiles': tiles,
-        'flags': flags
+        'flags': flags,
+        'tile_dimensions': data['config']['tile']['dimensions']
     }
@@ -0,0 +1,160 @@
+import pygame
+import hashlib
+import json
+import zlib
+import os
+
+config = json.load(open(os.path.join('resources', 'data', 'config.json')))
+
+class AssetCache:
+    VERSION = 1
+
+    CACHE_PATH = os.path.join('.cache', 'assets')
+
+    enabled = config.get('asset_cache', False)
+
+    source_hashes = {}
+
+    prefixes = None
+
+    stats = {
+        'hits': 0,
+        'misses': 0,
+        'stale': 0
+    }
+
+    def init(enabled=None, path=None):
+        if enabled is not None:
+            AssetCache.enabled = enabled
+
+        if path is not None:
+            AssetCache.CACHE_PATH = path
+            AssetCache.prefixes = None
+
+        if AssetCache.enabled:
+            os.makedirs(AssetCache.CACHE_PATH, exist_ok=True)
+
+    def clear():
+        if not os.path.isdir(AssetCache.CACHE_PATH):
+            return
+
+        for file in os.listdir(AssetCache.CACHE_PATH):
+            os.remove(os.path.join(AssetCache.CACHE_PATH, file))
+
+        AssetCache.source_hashes.clear()
+        AssetCache.prefixes = None
+
+    def get_source_hash(path):
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        if path in AssetCache.source_hashes and AssetCache.source_hashes[path][0] == stamp:
+            return AssetCache.source_hashes[path][1]
+
+        with open(path, 'rb') as f:
+            source_hash = hashlib.sha1(f.read()).hexdigest()
+
+        AssetCache.source_hashes[path] = [stamp, source_hash]
+        return source_hash
+
+    def get_path_prefix(path):
+        return hashlib.sha1(os.path.normpath(path).encode()).hexdigest()[:20]
+
+    def get_entry_path(path, params):
+        key = json.dumps([os.path.normpath(path), params], sort_keys=True)
+        return os.path.join(AssetCache.CACHE_PATH, f'{AssetCache.get_path_prefix(path)}-{hashlib.sha1(key.encode()).hexdigest()[:20]}.bin')
+
+    def has_entries(path):
+        if not AssetCache.enabled or not os.path.isdir(AssetCache.CACHE_PATH):
+            return False
+
+        if AssetCache.prefixes is None:
+            AssetCache.prefixes = {file.split('-')[0] for file in os.listdir(AssetCache.CACHE_PATH)}
+
+        return AssetCache.get_path_prefix(path) in AssetCache.prefixes
+
+    def read(entry_path, source_hash, convert=True):
+        if not os.path.isfile(entry_path):
+            return None
+
+        with open(entry_path, 'rb') as f:
+            header = json.loads(f.readline())
+            data = f.read()
+
+        if header['version'] != AssetCache.VERSION or header['source'] != source_hash:
+            AssetCache.stats['stale'] += 1
+            return None
+
+        buffer = zlib.decompress(data)
+
+        imgs = []
+        offset = 0
+        for info in header['imgs']:
+            size = info['size'][0] * info['size'][1] * 4
+
+            img = pygame.image.frombuffer(buffer[offset:offset + size], info['size'], 'RGBA')
+            if convert:
+                img = img.convert_alpha()
+
+            if info['colorkey'] is not None:
+                img.set_colorkey(info['colorkey'])
+
+            imgs.append(img)
+            offset += size
+
+        return imgs
+
+    def write(entry_path, source_hash, imgs):
+        header = {
+            'version': AssetCache.VERSION,
+            'source': source_hash,
+            'imgs': []
+        }
+
+        buffers = []
+        for img in imgs:
+            colorkey = img.get_colorkey()
+
+            header['imgs'].append({
+                'size': list(img.get_size()),
+                'colorkey': list(colorkey) if colorkey else None
+            })
+
+            buffers.append(pygame.image.tobytes(img, 'RGBA'))
+
+        with open(entry_path, 'wb') as f:
+            f.write(json.dumps(header).encode() + b'\n')
+            f.write(zlib.compress(b''.join(buffers), 1))
+
+        if AssetCache.prefixes is not None:
+            AssetCache.prefixes.add(os.path.basename(entry_path).split('-')[0])
+
+    # convert=False skips convert_alpha so entries can be read off the main thread
+    def load(path, params, build, convert=True):
+        if not AssetCache.enabled:
+            return build()
+
+        source_hash = AssetCache.get_source_hash(path)
+        entry_path = AssetCache.get_entry_path(path, params)
+
+        try:
+            imgs = AssetCache.read(entry_path, source_hash, convert)
+
+        except (OSError, ValueError, zlib.error):
+            imgs = None
+
+        if imgs is not None:
+            AssetCache.stats['hits'] += 1
+            return imgs
+
+        AssetCache.stats['misses'] += 1
+        imgs = build()
+
+        try:
+            os.makedirs(AssetCache.CACHE_PATH, exist_ok=True)
+            AssetCache.write(entry_path, source_hash, imgs)
+
+        except OSError as e:
+            print(f'[ASSET_CACHE] Could not write cache entry for "{path}": {e}')
+
+        return imgs
@@ -0,0 +1,122 @@
+from scripts.tools.asset_cache import AssetCache
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+import os
+
+class AssetLoader:
+    MAX_WORKERS = 4
+
+    IMAGE_EXTENSIONS = ('.png',)
+    SOUND_EXTENSIONS = ('.ogg', '.wav')
+
+    STARTUP_FOLDERS = [
+        [os.path.join('resources', 'sound_fx'), False],
+        [os.path.join('resources', 'images', 'ui'), False],
+        [os.path.join('resources', 'images', 'ui', 'fonts'), False],
+        [os.path.join('resources', 'images', 'ui', 'player'), False],
+        [os.path.join('resources', 'images', 'ui', 'hotbar'), False],
+        [os.path.join('resources', 'images', 'ui', 'enemies'), False],
+        [os.path.join('resources', 'images', 'ui', 'card'), False],
+        [os.path.join('resources', 'images', 'entities'), True]
+    ]
+
+    images = {}
+    sounds = {}
+
+    def get_key(path):
+        return os.path.normpath(path)
+
+    def get_files(folder, recursive=False):
+        files = []
+        if not os.path.isdir(folder):
+            return files
+
+        for root, dirs, names in os.walk(folder):
+            for name in sorted(names):
+                if name.lower().endswith(AssetLoader.IMAGE_EXTENSIONS + AssetLoader.SOUND_EXTENSIONS):
+                    files.append(os.path.join(root, name))
+
+            if not recursive:
+                break
+
+        return files
+
+    def get_startup_paths():
+        paths = []
+        for folder, recursive in AssetLoader.STARTUP_FOLDERS:
+            paths.extend(AssetLoader.get_files(folder, recursive))
+
+        return paths
+
+    # Runs on a worker thread, so nothing here may touch the display
+    def decode(path):
+        if path.lower().endswith(AssetLoader.SOUND_EXTENSIONS):
+            return pygame.mixer.Sound(path)
+
+        return pygame.image.load(path)
+
+    def preload(paths, progress=None, workers=None):
+        queued = []
+        for path in paths:
+            key = AssetLoader.get_key(path)
+            if key in AssetLoader.images or key in AssetLoader.sounds or key in queued:
+                continue
+
+            if key.lower().endswith(AssetLoader.IMAGE_EXTENSIONS) and AssetCache.has_entries(key):
+                continue
+
+            queued.append(key)
+
+        if not queued:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=workers or AssetLoader.MAX_WORKERS) as executor:
+            futures = {executor.submit(AssetLoader.decode, path): path for path in queued}
+
+            for done, future in enumerate(as_completed(futures), 1):
+                path = futures[future]
+
+                try:
+                    asset = future.result()
+
+                except (pygame.error, OSError) as e:
+                    print(f'[ASSET_LOADER] Could not decode "{path}": {e}')
+                    asset = None
+
+                if isinstance(asset, pygame.Surface):
+                    AssetLoader.images[path] = asset.convert_alpha()
+
+                elif asset is not None:
+                    AssetLoader.sounds[path] = asset
+
+                if progress:
+                    progress(done, len(queued), path)
+
+        return len(queued)
+
+    def clear():
+        AssetLoader.images.clear()
+        AssetLoader.sounds.clear()
+
+    def load_image(path):
+        key = AssetLoader.get_key(path)
+        if key in AssetLoader.images:
+            return AssetLoader.images[key].copy()
+
+        return pygame.image.load(path).convert_alpha()
+
+    def take_image(path):
+        image = AssetLoader.images.pop(AssetLoader.get_key(path), None)
+        if image is not None:
+            return image
+
+        return pygame.image.load(path).convert_alpha()
+
+    def load_sound(path):
+        key = AssetLoader.get_key(path)
+        if key in AssetLoader.sounds:
+            return AssetLoader.sounds[key]
+
+        return pygame.mixer.Sound(path)
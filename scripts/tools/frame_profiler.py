@@ -0,0 +1,240 @@
+from scripts import FRAME_RATE, SCREEN_DIMENSIONS
+
+from scripts.tools.hot_path_counters import HotPathCounters
+from scripts.tools.tracer import Tracer
+
+from collections import deque
+
+import pygame
+import time
+
+class FrameProfiler:
+    HISTORY = 180
+    WORST_FRAMES = 5
+
+    TEXT_REFRESH = 15
+
+    BUDGET_NS = 1e9 / FRAME_RATE
+
+    PHASES = ['events', 'ai', 'sort', 'entities', 'ui', 'timers', 'spawning', 'camera', 'fx', 'mouse', 'render', 'flip']
+    COLORS = {
+        'events': (120, 120, 120),
+        'ai': (255, 110, 200),
+        'sort': (242, 59, 76),
+        'entities': (251, 204, 97),
+        'ui': (166, 255, 136),
+        'timers': (97, 175, 251),
+        'spawning': (225, 105, 116),
+        'camera': (190, 130, 250),
+        'fx': (255, 160, 60),
+        'mouse': (90, 220, 220),
+        'render': (140, 140, 255),
+        'flip': (255, 255, 255)
+    }
+
+    enabled = False
+    show_overlay = False
+
+    frame = 0
+    phases = dict.fromkeys(PHASES, 0)
+    classes = {}
+
+    trace_info = {
+        'phase': None,
+        'class': None
+    }
+
+    history = deque(maxlen=HISTORY)
+    worst = []
+
+    overlay_info = {
+        'panel': None,
+        'text': [],
+        'refresh': 0
+    }
+
+    def toggle():
+        FrameProfiler.show_overlay = not FrameProfiler.show_overlay
+        FrameProfiler.enabled = FrameProfiler.show_overlay or Tracer.enabled
+        FrameProfiler.reset()
+
+    def start_trace(path):
+        Tracer.start(path)
+        FrameProfiler.enabled = True
+
+    def stop_trace():
+        FrameProfiler.flush_trace()
+        Tracer.stop()
+        FrameProfiler.enabled = FrameProfiler.show_overlay
+
+    def reset():
+        FrameProfiler.frame = 0
+        FrameProfiler.phases = dict.fromkeys(FrameProfiler.PHASES, 0)
+        FrameProfiler.classes = {}
+
+        FrameProfiler.history.clear()
+        FrameProfiler.worst = []
+
+        FrameProfiler.overlay_info['text'] = []
+        FrameProfiler.overlay_info['refresh'] = 0
+
+    def lap(phase, start):
+        now = time.perf_counter_ns()
+        FrameProfiler.phases[phase] += now - start
+
+        if Tracer.enabled:
+            FrameProfiler.trace(FrameProfiler.trace_info, 'phase', phase, start, now)
+
+        return now
+
+    def add_class(name, start, end):
+        FrameProfiler.classes[name] = FrameProfiler.classes.get(name, 0) + end - start
+
+        if Tracer.enabled:
+            FrameProfiler.trace(FrameProfiler.trace_info, 'class', name, start, end)
+
+    def trace(info, key, name, start, end):
+        span = info[key]
+        if span and span[0] == name and span[2] == start:
+            span[2] = end
+            return
+
+        if span:
+            Tracer.complete(span[0], span[1], span[2], 'entity' if key == 'class' else 'phase')
+
+        info[key] = [name, start, end]
+
+    def flush_trace():
+        for key, span in FrameProfiler.trace_info.items():
+            if span:
+                Tracer.complete(span[0], span[1], span[2], 'entity' if key == 'class' else 'phase')
+
+            FrameProfiler.trace_info[key] = None
+
+    def next_frame():
+        if Tracer.enabled:
+            FrameProfiler.flush_trace()
+
+        total = sum(FrameProfiler.phases.values())
+
+        if total:
+            record = [FrameProfiler.frame, total, FrameProfiler.phases, FrameProfiler.classes]
+            FrameProfiler.history.append(record)
+
+            if len(FrameProfiler.worst) < FrameProfiler.WORST_FRAMES or total > FrameProfiler.worst[-1][1]:
+                FrameProfiler.worst.append(record)
+                FrameProfiler.worst.sort(key=lambda r: -r[1])
+                del FrameProfiler.worst[FrameProfiler.WORST_FRAMES:]
+
+        FrameProfiler.frame += 1
+        FrameProfiler.phases = dict.fromkeys(FrameProfiler.PHASES, 0)
+        FrameProfiler.classes = {}
+
+    def get_averages():
+        phases = dict.fromkeys(FrameProfiler.PHASES, 0)
+        classes = {}
+
+        count = len(FrameProfiler.history)
+        if not count:
+            return phases, classes
+
+        for _, _, frame_phases, frame_classes in FrameProfiler.history:
+            for phase, ns in frame_phases.items():
+                phases[phase] += ns / count
+
+            for name, ns in frame_classes.items():
+                classes[name] = classes.get(name, 0) + ns / count
+
+        return phases, classes
+
+    def get_report():
+        phases, classes = FrameProfiler.get_averages()
+
+        return {
+            'frames': len(FrameProfiler.history),
+            'phases_ms': {k: round(v / 1e6, 3) for k, v in phases.items()},
+            'classes_ms': {k: round(v / 1e6, 3) for k, v in sorted(classes.items(), key=lambda c: -c[1])},
+            'worst_ms': [[r[0], round(r[1] / 1e6, 3), max(r[2], key=r[2].get)] for r in FrameProfiler.worst]
+        }
+
+    def create_text(text, color=(255, 255, 255)):
+        from scripts.ui.text_box import TextBox
+
+        return TextBox.create_text_line('default', text, size=.35, color=color)
+
+    def refresh_text():
+        phases, classes = FrameProfiler.get_averages()
+        total = sum(phases.values())
+
+        lines = [FrameProfiler.create_text(f'frame {total / 1e6:.2f} ms')]
+        for phase in FrameProfiler.PHASES:
+            lines.append(FrameProfiler.create_text(f'{phase} {phases[phase] / 1e6:.2f}', FrameProfiler.COLORS[phase]))
+
+        for name, ns in sorted(classes.items(), key=lambda c: -c[1])[:4]:
+            lines.append(FrameProfiler.create_text(f'{name[:14]} {ns / 1e6:.2f}', FrameProfiler.COLORS['entities']))
+
+        if HotPathCounters.enabled:
+            totals = HotPathCounters.get_totals()
+            lines.append(FrameProfiler.create_text(' '.join(f'{o[0]}{c[0]}' for o, c in totals.items())))
+
+            counters = sorted(HotPathCounters.get_counters().items(), key=lambda m: -sum(c[1] for c in m[1].values()))
+            for module, operations in counters[:3]:
+                lines.append(FrameProfiler.create_text(f'{module[:12].replace("_", "-")} ' + ' '.join(f'{o[0]}{c[0]}' for o, c in operations.items() if c[0])))
+
+        lines.append(FrameProfiler.create_text('worst'))
+        for frame, ns, frame_phases, _ in FrameProfiler.worst:
+            lines.append(FrameProfiler.create_text(f'{frame}: {ns / 1e6:.1f} {max(frame_phases, key=frame_phases.get)}'))
+
+        FrameProfiler.overlay_info['text'] = lines
+
+    # Draws into a fresh surface every time so the renderer never reads one that is being redrawn, returns it with its position
+    def draw():
+        info = FrameProfiler.overlay_info
+        width, height = 360, 380
+        graph_height = 100
+
+        if info['panel'] is None:
+            info['panel'] = pygame.Surface((width, height))
+            info['panel'].fill((0, 0, 0))
+            info['panel'].set_alpha(180)
+
+        if info['refresh'] <= 0:
+            FrameProfiler.refresh_text()
+            info['refresh'] = FrameProfiler.TEXT_REFRESH
+
+        info['refresh'] -= 1
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        x, y = 0, 0
+
+        surface.blit(info['panel'], (x, y))
+
+        scale = (graph_height * .5) / FrameProfiler.BUDGET_NS
+        bar_width = width / FrameProfiler.HISTORY
+        bottom = y + graph_height + 5
+
+        for i, (_, _, phases, _) in enumerate(FrameProfiler.history):
+            bar_bottom = bottom
+            for phase in FrameProfiler.PHASES:
+                bar_height = phases[phase] * scale
+                if bar_height < 1:
+                    continue
+
+                bar_height = min(bar_height, bar_bottom - y)
+                bar_bottom -= bar_height
+
+                pygame.draw.rect(surface, FrameProfiler.COLORS[phase], (x + i * bar_width, bar_bottom, max(bar_width, 1), bar_height))
+
+        pygame.draw.line(surface, (255, 255, 255), (x, bottom - graph_height * .5), (x + width, bottom - graph_height * .5))
+
+        text_y = bottom + 5
+        column = 0
+        for line in info['text']:
+            if text_y + line.get_height() > y + height:
+                text_y = bottom + 5
+                column += 1
+
+            surface.blit(line, (x + 5 + column * width * .5, text_y))
+            text_y += line.get_height() + 2
+
+        return surface, (SCREEN_DIMENSIONS[0] - width - 5, 5)
@@ -0,0 +1,159 @@
+import pygame
+import time
+import sys
+import os
+
+BaseSurface = pygame.Surface
+
+# Opt-in, the profile hook slows every call down so frame profiler timings read high while it is on
+class HotPathCounters:
+    OPERATIONS = ['surface', 'transform', 'mask', 'blit']
+
+    FUNCTIONS = {
+        pygame.transform.scale: 'transform',
+        pygame.transform.smoothscale: 'transform',
+        pygame.transform.rotate: 'transform',
+        pygame.transform.rotozoom: 'transform',
+        pygame.transform.flip: 'transform',
+        pygame.mask.from_surface: 'mask'
+    }
+
+    METHODS = {
+        'blit': 'blit',
+        'blits': 'blit',
+        'copy': 'surface',
+        'convert': 'surface',
+        'convert_alpha': 'surface'
+    }
+
+    enabled = False
+
+    frame = {}
+    last_frame = {}
+
+    run = {}
+    run_frames = 0
+
+    pending = None
+    modules = {}
+
+    previous_profile = None
+
+    def enable():
+        if HotPathCounters.enabled:
+            return
+
+        HotPathCounters.enabled = True
+        HotPathCounters.frame = {}
+        HotPathCounters.last_frame = {}
+
+        HotPathCounters.run = {}
+        HotPathCounters.run_frames = 0
+
+        pygame.Surface = CountingSurface
+
+        HotPathCounters.previous_profile = sys.getprofile()
+        sys.setprofile(HotPathCounters.on_profile)
+
+    def disable():
+        if not HotPathCounters.enabled:
+            return
+
+        HotPathCounters.enabled = False
+        HotPathCounters.pending = None
+
+        sys.setprofile(HotPathCounters.previous_profile)
+        HotPathCounters.previous_profile = None
+
+        pygame.Surface = BaseSurface
+
+    def toggle():
+        if HotPathCounters.enabled:
+            HotPathCounters.disable()
+
+        else:
+            HotPathCounters.enable()
+
+    def get_module(frame):
+        filename = frame.f_code.co_filename
+
+        module = HotPathCounters.modules.get(filename)
+        if module is None:
+            module = os.path.splitext(os.path.basename(filename))[0]
+            HotPathCounters.modules[filename] = module
+
+        return module
+
+    def add(operation, module, ns):
+        counters = HotPathCounters.frame.get(module)
+        if counters is None:
+            counters = {o: [0, 0] for o in HotPathCounters.OPERATIONS}
+            HotPathCounters.frame[module] = counters
+
+        counters[operation][0] += 1
+        counters[operation][1] += ns
+
+    def on_profile(frame, event, arg):
+        if event == 'c_call':
+            operation = HotPathCounters.FUNCTIONS.get(arg)
+            if operation is None:
+                operation = HotPathCounters.METHODS.get(arg.__name__)
+                if operation is None or not isinstance(getattr(arg, '__self__', None), BaseSurface):
+                    return
+
+            HotPathCounters.pending = [operation, HotPathCounters.get_module(frame), time.perf_counter_ns()]
+
+        elif event in ['c_return', 'c_exception'] and HotPathCounters.pending:
+            operation, module, start = HotPathCounters.pending
+            HotPathCounters.pending = None
+
+            HotPathCounters.add(operation, module, time.perf_counter_ns() - start)
+
+    def next_frame():
+        for module, counters in HotPathCounters.frame.items():
+            run = HotPathCounters.run.setdefault(module, {o: [0, 0] for o in HotPathCounters.OPERATIONS})
+            for operation, (count, ns) in counters.items():
+                run[operation][0] += count
+                run[operation][1] += ns
+
+        HotPathCounters.run_frames += 1
+
+        HotPathCounters.last_frame = HotPathCounters.frame
+        HotPathCounters.frame = {}
+
+    def get_counters():
+        return HotPathCounters.last_frame
+
+    def get_totals():
+        totals = {o: [0, 0] for o in HotPathCounters.OPERATIONS}
+
+        for counters in HotPathCounters.last_frame.values():
+            for operation, (count, ns) in counters.items():
+                totals[operation][0] += count
+                totals[operation][1] += ns
+
+        return totals
+
+    def get_report():
+        frames = max(HotPathCounters.run_frames, 1)
+
+        return {
+            module: {o: [round(count / frames, 2), round(ns / frames / 1e6, 3)] for o, (count, ns) in counters.items() if count}
+            for module, counters in sorted(HotPathCounters.run.items(), key=lambda m: -sum(c[1] for c in m[1].values()))
+        }
+
+# Calling a type does not reach the profile hook, so surfaces made through pygame.Surface(...) are counted here instead
+class CountingSurfaceType(type):
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, BaseSurface)
+
+    def __subclasscheck__(cls, subclass):
+        return issubclass(subclass, BaseSurface)
+
+class CountingSurface(BaseSurface, metaclass=CountingSurfaceType):
+    def __init__(self, *args, **kwargs):
+        start = time.perf_counter_ns()
+        super().__init__(*args, **kwargs)
+
+        if HotPathCounters.enabled:
+            HotPathCounters.add('surface', HotPathCounters.get_module(sys._getframe(1)), time.perf_counter_ns() - start)
@@ -0,0 +1,57 @@
+from scripts import SCREEN_DIMENSIONS
+
+import pygame
+
+# Input sources return [dt, events, keys, mouse position, mods] for every frame, given the measured dt
+class LiveInput:
+    def get_frame(self, dt):
+        return dt, pygame.event.get(), pygame.key.get_pressed(), pygame.mouse.get_pos(), pygame.key.get_mods()
+
+class KeyState:
+    def __init__(self, keys):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+class ScriptedInput:
+    def __init__(self, script, mouse_pos=None):
+        self.script = script
+        self.mouse_pos = mouse_pos if mouse_pos else (SCREEN_DIMENSIONS[0] * .75, SCREEN_DIMENSIONS[1] * .5)
+
+        self.frame = 0
+        self.held = set()
+
+    def get_frame(self, dt):
+        pygame.event.pump()
+
+        held, clicks = self.script(self.frame)
+        held = set(held)
+
+        events = []
+        for key in sorted(held - self.held):
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0))
+
+        for key in sorted(self.held - held):
+            events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0))
+
+        for button in clicks:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=self.mouse_pos))
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=button, pos=self.mouse_pos))
+
+        self.held = held
+        self.frame += 1
+
+        return dt, events, KeyState(held), self.mouse_pos, 0
+
+def wander_script(frame):
+    held = [pygame.K_d] if frame % 240 < 120 else [pygame.K_a]
+    if frame % 45 < 8:
+        held.append(pygame.K_w)
+
+    if frame % 150 < 2:
+        held.append(pygame.K_1)
+
+    clicks = [1] if frame % 20 == 0 else []
+
+    return held, clicks
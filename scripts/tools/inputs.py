@@ -15,6 +15,9 @@ class Inputs:
 
     pressed = {}
 
+    mouse_pos = (0, 0)
+    mods = 0
+
     def init():
         for keybind in Inputs.KEYBINDS.keys():
             Inputs.pressed[keybind] = False
@@ -26,8 +29,9 @@ class Inputs:
             
         return False
 
-    def get_keys_pressed():
-        keys = pygame.key.get_pressed()
+    def get_keys_pressed(keys=None):
+        if keys is None:
+            keys = pygame.key.get_pressed()
 
         for action in Inputs.pressed.keys():
             Inputs.pressed[action] = False
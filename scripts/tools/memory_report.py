@@ -0,0 +1,176 @@
+from scripts.ui.frame import Frame
+from scripts.ui.card import Card
+
+from scripts.tools.asset_loader import AssetLoader
+from scripts.tools.fonts import Fonts
+
+import tracemalloc
+import pygame
+import gc
+
+# Surface pixels live in SDL allocations that tracemalloc never sees, so surfaces are totalled by walking their owners
+class MemoryReport:
+    CATEGORIES = ['entity_surface', 'scene', 'tiles', 'particles', 'ui', 'entities', 'caches']
+
+    WINDOW = 3
+
+    SLOPE_KB = 32
+
+    enabled = False
+    threshold_kb = 1024
+
+    floors = []
+    flags = []
+
+    first_snapshot = None
+    last_snapshot = None
+
+    def start(threshold_kb=None):
+        MemoryReport.enabled = True
+        if threshold_kb is not None:
+            MemoryReport.threshold_kb = threshold_kb
+
+        MemoryReport.floors = []
+        MemoryReport.flags = []
+
+        MemoryReport.first_snapshot = None
+        MemoryReport.last_snapshot = None
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop():
+        MemoryReport.enabled = False
+        tracemalloc.stop()
+
+    def get_surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    # Objects holding their surfaces behind lookups, like the card icon registries, hand them over through get_surfaces()
+    def add_object(totals, seen, category, value, depth=2):
+        if isinstance(value, pygame.Surface):
+            if id(value) not in seen:
+                seen.add(id(value))
+                totals[category] += MemoryReport.get_surface_bytes(value)
+
+        elif isinstance(value, pygame.mask.Mask):
+            if id(value) not in seen:
+                seen.add(id(value))
+                totals[category] += value.get_size()[0] * value.get_size()[1] // 8
+
+        elif depth <= 0:
+            return
+
+        elif hasattr(value, 'get_surfaces'):
+            for v in value.get_surfaces():
+                MemoryReport.add_object(totals, seen, category, v, depth - 1)
+
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                MemoryReport.add_object(totals, seen, category, v, depth - 1)
+
+        elif isinstance(value, dict):
+            for v in value.values():
+                MemoryReport.add_object(totals, seen, category, v, depth - 1)
+
+    def get_category(sprite):
+        if sprite.sprite_id == 'tile':
+            return 'tiles'
+
+        if sprite.sprite_id == 'particle':
+            return 'particles'
+
+        if isinstance(sprite, Frame):
+            return 'ui'
+
+        return 'entities'
+
+    def get_caches():
+        return [AssetLoader.images, Fonts.fonts, Card.BASE, Card.ICONS, Card.SYMBOLS]
+
+    def get_surface_totals(scene):
+        totals = dict.fromkeys(MemoryReport.CATEGORIES, 0)
+        seen = set()
+
+        MemoryReport.add_object(totals, seen, 'entity_surface', scene.entity_surface)
+        MemoryReport.add_object(totals, seen, 'scene', [scene.background_surface, scene.ui_surface])
+
+        for sprite in scene.sprite_list:
+            category = MemoryReport.get_category(sprite)
+            for value in vars(sprite).values():
+                MemoryReport.add_object(totals, seen, category, value)
+
+        MemoryReport.add_object(totals, seen, 'caches', MemoryReport.get_caches(), 4)
+
+        return totals
+
+    def on_floor(scene, map_name):
+        gc.collect()
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>')
+        ])
+
+        if MemoryReport.first_snapshot is None:
+            MemoryReport.first_snapshot = snapshot
+
+        MemoryReport.last_snapshot = snapshot
+
+        surfaces = MemoryReport.get_surface_totals(scene)
+        entry = {
+            'floor': scene.level_info['floor'],
+            'map': map_name,
+            'surfaces_kb': {k: round(v / 1024) for k, v in surfaces.items()},
+            'surface_total_kb': round(sum(surfaces.values()) / 1024),
+            'traced_kb': round(sum(stat.size for stat in snapshot.statistics('filename')) / 1024),
+            'sprites': len(scene.sprite_list)
+        }
+
+        MemoryReport.floors.append(entry)
+        print(f'[MEMORY] floor {entry["floor"]} {map_name}: surfaces {entry["surface_total_kb"]} kb {entry["surfaces_kb"]}, traced {entry["traced_kb"]} kb, {entry["sprites"]} sprites')
+
+        MemoryReport.check_growth()
+
+    def check_growth():
+        entry = MemoryReport.floors[-1]
+
+        floors = [e for e in MemoryReport.floors if e['map'] == entry['map']]
+        if len(floors) < 2:
+            return
+
+        baseline = floors[0]
+        previous = floors[-2]
+        for key in ['surface_total_kb', 'traced_kb']:
+            growth = entry[key] - baseline[key]
+            if growth > MemoryReport.threshold_kb >= previous[key] - baseline[key]:
+                MemoryReport.flags.append([entry['floor'], key, baseline[key], entry[key]])
+                print(f'[MEMORY] {key} grew {growth} kb from floor {baseline["floor"]} to floor {entry["floor"]}, over the {MemoryReport.threshold_kb} kb threshold.')
+
+            climb = 0
+            for before, after in zip(reversed(floors[:-1]), reversed(floors)):
+                if after[key] - before[key] < MemoryReport.SLOPE_KB:
+                    break
+
+                climb += 1
+
+            if climb == MemoryReport.WINDOW:
+                start = floors[-1 - climb]
+                slope = round((entry[key] - start[key]) / climb)
+
+                MemoryReport.flags.append([entry['floor'], key, start[key], entry[key]])
+                print(f'[MEMORY] {key} grew on each of the last {climb} floors of {entry["map"]}, {slope} kb per floor since floor {start["floor"]}.')
+
+    def get_top_growth(limit=10):
+        if MemoryReport.first_snapshot is None:
+            return []
+
+        stats = MemoryReport.last_snapshot.compare_to(MemoryReport.first_snapshot, 'lineno')
+        return [[str(stat.traceback[0]), round(stat.size_diff / 1024, 1)] for stat in stats[:limit] if stat.size_diff > 0]
+
+    def get_report():
+        return {
+            'floors': MemoryReport.floors,
+            'flags': MemoryReport.flags,
+            'top_growth_kb': MemoryReport.get_top_growth()
+        }
@@ -1,5 +1,6 @@
+from scripts.tools.rng import Rng
+
 import pygame
-import random
 import math
 
 def check_pixel_collision(primary_sprite, secondary_sprite):
@@ -86,8 +87,8 @@ def get_sprite_colors(primary_sprite, multiplier=1):
         y = 0
 
         while not found_pixel:
-            x = random.randint(0, image.get_width() - 1)
-            y = random.randint(0, image.get_height() - 1)
+            x = Rng.randint(0, image.get_width() - 1)
+            y = Rng.randint(0, image.get_height() - 1)
 
             found_pixel = image.get_at((x, y)) != ((0, 0, 0, 0))
                 
@@ -95,26 +96,26 @@ def get_sprite_colors(primary_sprite, multiplier=1):
 
     return colors
 
-def create_outline_edge(sprite, color, display, size=1):
+def create_outline_edge(sprite, color, display, size=1, motion=None):
     surface = pygame.Surface(sprite.image.get_size())
     surface.set_colorkey((0, 0, 0))
     for point in sprite.mask.outline():
         surface.set_at(point, color)
 
     for i in range(size):
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] - i, sprite.rect.y + sprite.rect_offset[1]))
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] + i, sprite.rect.y + sprite.rect_offset[1]))
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] - i, sprite.rect.y + sprite.rect_offset[1]), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] + i, sprite.rect.y + sprite.rect_offset[1]), motion=motion, owned=True)
 
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0], sprite.rect.y + sprite.rect_offset[1] - i))
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0], sprite.rect.y + sprite.rect_offset[1] + i))
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0], sprite.rect.y + sprite.rect_offset[1] - i), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0], sprite.rect.y + sprite.rect_offset[1] + i), motion=motion, owned=True)
 
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] - i, sprite.rect.y + sprite.rect_offset[1] - i))
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] + i, sprite.rect.y + sprite.rect_offset[1] + i))
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] - i, sprite.rect.y + sprite.rect_offset[1] - i), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] + i, sprite.rect.y + sprite.rect_offset[1] + i), motion=motion, owned=True)
 
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] - i, sprite.rect.y + sprite.rect_offset[1] + i))
-        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] + i, sprite.rect.y + sprite.rect_offset[1] - i))  
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] - i, sprite.rect.y + sprite.rect_offset[1] + i), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x + sprite.rect_offset[0] + i, sprite.rect.y + sprite.rect_offset[1] - i), motion=motion, owned=True)  
 
-def create_outline_full(sprite, color, display, size=1):
+def create_outline_full(sprite, color, display, size=1, motion=None):
     surface = sprite.mask.to_surface(
         setcolor=color, 
         unsetcolor=(0, 0, 0, 0)
@@ -122,14 +123,14 @@ def create_outline_full(sprite, color, display, size=1):
     surface.set_colorkey((0, 0, 0))
 
     for i in range(size):
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] - i, sprite.rect.y - sprite.rect_offset[1]))
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] + i, sprite.rect.y - sprite.rect_offset[1]))
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] - i, sprite.rect.y - sprite.rect_offset[1]), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] + i, sprite.rect.y - sprite.rect_offset[1]), motion=motion, owned=True)
 
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0], sprite.rect.y - sprite.rect_offset[1] - i))
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0], sprite.rect.y - sprite.rect_offset[1] + i))
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0], sprite.rect.y - sprite.rect_offset[1] - i), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0], sprite.rect.y - sprite.rect_offset[1] + i), motion=motion, owned=True)
 
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] - i, sprite.rect.y - sprite.rect_offset[1] - i))
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] + i, sprite.rect.y - sprite.rect_offset[1] + i))
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] - i, sprite.rect.y - sprite.rect_offset[1] - i), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] + i, sprite.rect.y - sprite.rect_offset[1] + i), motion=motion, owned=True)
 
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] - i, sprite.rect.y - sprite.rect_offset[1] + i))
-        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] + i, sprite.rect.y - sprite.rect_offset[1] - i))  
\ No newline at end of file
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] - i, sprite.rect.y - sprite.rect_offset[1] + i), motion=motion, owned=True)
+        display.blit(surface, (sprite.rect.x - sprite.rect_offset[0] + i, sprite.rect.y - sprite.rect_offset[1] - i), motion=motion, owned=True)  
\ No newline at end of file
@@ -0,0 +1,148 @@
+from scripts import VERSION
+
+from scripts.tools.input_source import KeyState
+from scripts.tools.inputs import Inputs
+from scripts.tools.rng import Rng
+
+import pygame
+import json
+import zlib
+
+REPLAY_VERSION = 1
+
+RECORDED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP]
+
+# Only keys that Inputs reads every frame need their held state stored, everything else arrives as events
+def get_recorded_keys():
+    keys = set()
+    for keybinds in Inputs.KEYBINDS.values():
+        keys.update(keybinds if isinstance(keybinds, list) else [keybinds])
+
+    return sorted(keys)
+
+def get_checksum(scene):
+    state = [round(scene.frame_count_raw, 3), Rng.generator.getstate()[1]]
+
+    player = getattr(scene, 'player', None)
+    if player:
+        state.append([player.rect.topleft, player.combat_info['health']])
+
+    for enemy in scene.get_sprites('enemy'):
+        state.append([enemy.rect.topleft, enemy.combat_info['health']])
+
+    return zlib.crc32(repr(state).encode())
+
+def encode_event(event):
+    if event.type in [pygame.KEYDOWN, pygame.KEYUP]:
+        return [event.type, event.key, event.mod]
+
+    if event.type in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP]:
+        return [event.type, event.button, list(event.pos)]
+
+    return [event.type]
+
+def decode_event(data):
+    if data[0] in [pygame.KEYDOWN, pygame.KEYUP]:
+        return pygame.event.Event(data[0], key=data[1], mod=data[2])
+
+    if data[0] in [pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP]:
+        return pygame.event.Event(data[0], button=data[1], pos=tuple(data[2]))
+
+    return pygame.event.Event(data[0])
+
+class InputRecorder:
+    def __init__(self, source, seed):
+        self.source = source
+        self.seed = seed
+
+        self.keys = get_recorded_keys()
+        self.scene_handler = None
+
+        self.frames = []
+        self.checksums = []
+
+    def attach(self, scene_handler):
+        self.scene_handler = scene_handler
+
+        if hasattr(self.source, 'attach'):
+            self.source.attach(scene_handler)
+
+    def get_frame(self, dt):
+        dt, events, keys, mouse_pos, mods = self.source.get_frame(dt)
+
+        self.frames.append([
+            dt,
+            [encode_event(e) for e in events if e.type in RECORDED_EVENTS],
+            [k for k in self.keys if keys[k]],
+            list(mouse_pos),
+            mods
+        ])
+
+        if self.scene_handler:
+            self.checksums.append(get_checksum(self.scene_handler.current_scene))
+
+        return dt, events, keys, mouse_pos, mods
+
+    def save(self, path):
+        data = {
+            'version': REPLAY_VERSION,
+            'game_version': VERSION,
+            'seed': self.seed,
+            'frames': self.frames,
+            'checksums': self.checksums
+        }
+
+        with open(path, 'wb') as f:
+            f.write(zlib.compress(json.dumps(data, separators=(',', ':')).encode(), 9))
+
+class InputReplayer:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = json.loads(zlib.decompress(f.read()))
+
+        if data['version'] != REPLAY_VERSION:
+            raise ValueError(f'replay version {data["version"]} is not supported')
+
+        if data['game_version'] != VERSION:
+            print(f'[REPLAY] Replay was recorded on {data["game_version"]}, running {VERSION}.')
+
+        self.seed = data['seed']
+
+        self.frames = data['frames']
+        self.checksums = data['checksums']
+
+        self.frame = 0
+        self.desync = None
+
+        self.scene_handler = None
+
+    def attach(self, scene_handler):
+        self.scene_handler = scene_handler
+
+    def get_frame(self, dt):
+        pygame.event.pump()
+
+        if self.frame >= len(self.frames):
+            return dt, [pygame.event.Event(pygame.QUIT)], KeyState([]), Inputs.mouse_pos, 0
+
+        if self.scene_handler and self.frame < len(self.checksums) and self.desync is None:
+            if get_checksum(self.scene_handler.current_scene) != self.checksums[self.frame]:
+                self.desync = self.frame
+                print(f'[REPLAY] Desync at frame {self.frame}.')
+
+        dt, events, keys, mouse_pos, mods = self.frames[self.frame]
+        self.frame += 1
+
+        return dt, [decode_event(e) for e in events], KeyState(keys), tuple(mouse_pos), mods
+
+def create_input_source(source, seed=None, record=False, replay_path=None):
+    if replay_path:
+        source = InputReplayer(replay_path)
+        seed = source.seed
+
+    Rng.seed(seed)
+
+    if record:
+        source = InputRecorder(source, Rng.seed_value)
+
+    return source
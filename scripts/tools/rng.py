@@ -0,0 +1,33 @@
+import random
+
+# Every gameplay roll goes through here so a run can be reproduced from its seed
+class Rng:
+    generator = random.Random()
+    seed_value = None
+
+    def seed(seed=None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+
+        Rng.seed_value = seed
+        Rng.generator.seed(seed)
+
+        return seed
+
+    def random():
+        return Rng.generator.random()
+
+    def randint(a, b):
+        return Rng.generator.randint(a, b)
+
+    def uniform(a, b):
+        return Rng.generator.uniform(a, b)
+
+    def choice(seq):
+        return Rng.generator.choice(seq)
+
+    def sample(population, k):
+        return Rng.generator.sample(population, k)
+
+    def shuffle(seq):
+        Rng.generator.shuffle(seq)
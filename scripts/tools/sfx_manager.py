@@ -1,3 +1,5 @@
+from scripts.tools.asset_loader import AssetLoader
+
 import pygame
 import os
 
@@ -5,16 +7,118 @@ class Sfx:
     SOUNDS = {}
     SETTINGS = {}
 
+    CATEGORIES = {
+        'default': 4,
+        'player': 4,
+        'enemy': 6,
+        'ability': 6,
+        'ui': 2
+    }
+
+    # max_voices: how many copies of a sound can play at once, retrigger: minimum ms between two plays
+    DEFAULT_SOUND_SETTINGS = {
+        'volume': 1.0,
+        'max_voices': 3,
+        'retrigger': 40
+    }
+
+    channels = {}
+    voices = {}
+
+    last_played = {}
+    queued = {}
+
+    counters = {
+        'requested': 0,
+        'coalesced': 0,
+        'played': 0,
+
+        'dropped_retrigger': 0,
+        'dropped_voices': 0,
+        'dropped_channels': 0,
+
+        'active': 0
+    }
+
     def init():
         for file in os.listdir(os.path.join('resources', 'sound_fx')):
             if file.split('.')[0] == 'placeholder':
                 continue
-            
-            Sfx.SOUNDS[file.split('.')[0]] = pygame.mixer.Sound(os.path.join('resources', 'sound_fx', file))
 
-    def play(sound):
+            Sfx.SOUNDS[file.split('.')[0]] = AssetLoader.load_sound(os.path.join('resources', 'sound_fx', file))
+
+        # Every channel is reserved so plain Sound.play() calls can never steal from a pool
+        total = sum(Sfx.CATEGORIES.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        for category, count in Sfx.CATEGORIES.items():
+            Sfx.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+
+    def get_category(sound):
+        category = sound.split('-')[0]
+        return category if category in Sfx.CATEGORIES else 'default'
+
+    def get_settings(sound):
+        return {**Sfx.DEFAULT_SOUND_SETTINGS, **Sfx.SETTINGS.get(sound, {})}
+
+    def play(sound, volume=1.0):
         if sound not in Sfx.SOUNDS:
             print(f'[SFX_MANAGER] Sound "{sound}" not found.')
             return
-    
-        Sfx.SOUNDS[sound].play()
+
+        Sfx.counters['requested'] += 1
+
+        if sound in Sfx.queued:
+            Sfx.counters['coalesced'] += 1
+            Sfx.queued[sound] = max(Sfx.queued[sound], volume)
+            return
+
+        Sfx.queued[sound] = volume
+
+    def get_free_channel(category):
+        for channel in Sfx.channels[category]:
+            if not channel.get_busy():
+                return channel
+
+        return None
+
+    def update():
+        if not Sfx.channels:
+            Sfx.queued.clear()
+            return
+
+        for sound in Sfx.voices:
+            Sfx.voices[sound] = [c for c in Sfx.voices[sound] if c.get_busy() and c.get_sound() is Sfx.SOUNDS[sound]]
+
+        ticks = pygame.time.get_ticks()
+        for sound, volume in Sfx.queued.items():
+            settings = Sfx.get_settings(sound)
+
+            if sound in Sfx.last_played and ticks - Sfx.last_played[sound] < settings['retrigger']:
+                Sfx.counters['dropped_retrigger'] += 1
+                continue
+
+            if len(Sfx.voices.get(sound, [])) >= settings['max_voices']:
+                Sfx.counters['dropped_voices'] += 1
+                continue
+
+            channel = Sfx.get_free_channel(Sfx.get_category(sound))
+            if channel is None:
+                Sfx.counters['dropped_channels'] += 1
+                continue
+
+            channel.set_volume(min(volume * settings['volume'], 1.0))
+            channel.play(Sfx.SOUNDS[sound])
+
+            Sfx.voices.setdefault(sound, []).append(channel)
+            Sfx.last_played[sound] = ticks
+            Sfx.counters['played'] += 1
+
+        Sfx.queued.clear()
+        Sfx.counters['active'] = sum(len(v) for v in Sfx.voices.values())
+
+    def get_counters():
+        return dict(Sfx.counters)
@@ -1,3 +1,6 @@
+from scripts.tools.asset_cache import AssetCache
+from scripts.tools.asset_loader import AssetLoader
+
 import pygame
 import json
 import os
@@ -5,14 +8,13 @@ import os
 config = json.load(open(os.path.join('resources', 'data', 'config.json')))
 spritesheet_stop_code = tuple(config['spritesheet_stop_code'])
 
-def load_spritesheet(pngpath, frames=None, colorkey=(0, 0, 0), scale=1.0):
+def slice_spritesheet(pngpath, colorkey=(0, 0, 0), scale=1.0):
     imgs = []   
-    sheet = pygame.image.load(pngpath).convert_alpha()
+    sheet = AssetLoader.take_image(pngpath)
 
     width = sheet.get_width()
     height = sheet.get_height()
 
-    img_count = 0
     start, stop = 0, 0
     i = 0
 
@@ -28,14 +30,24 @@ def load_spritesheet(pngpath, frames=None, colorkey=(0, 0, 0), scale=1.0):
         if scale != 1.0:
             img = pygame.transform.scale(img, (img.get_width() * scale, img.get_height() * scale)).convert_alpha()
 
-        if frames:
-            for _ in range(frames[img_count]):
-                imgs.append(img)
+        imgs.append(img)
+        start = stop + 1
 
-        else:
-            imgs.append(img)
+    return imgs
 
-        img_count += 1
-        start = stop + 1
+def load_spritesheet(pngpath, frames=None, colorkey=(0, 0, 0), scale=1.0):
+    sliced_imgs = AssetCache.load(
+        pngpath, 
+        {'op': 'spritesheet', 'colorkey': list(colorkey), 'scale': scale, 'stop_code': list(spritesheet_stop_code)}, 
+        lambda: slice_spritesheet(pngpath, colorkey, scale)
+    )
+
+    if not frames:
+        return sliced_imgs
+
+    imgs = []
+    for img_count, img in enumerate(sliced_imgs):
+        for _ in range(frames[img_count]):
+            imgs.append(img)
 
     return imgs
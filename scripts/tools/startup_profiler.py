@@ -0,0 +1,117 @@
+from contextlib import contextmanager
+
+import importlib.abc
+import time
+import sys
+
+class TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, name):
+        self.loader = loader
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(self.loader, attr)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        StartupProfiler.import_stack.append([self.name, time.perf_counter(), 0])
+
+        try:
+            self.loader.exec_module(module)
+
+        finally:
+            name, start, children = StartupProfiler.import_stack.pop()
+            elapsed = time.perf_counter() - start
+
+            StartupProfiler.imports[name] = [elapsed, elapsed - children]
+            if StartupProfiler.import_stack:
+                StartupProfiler.import_stack[-1][2] += elapsed
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, prefixes):
+        self.prefixes = prefixes
+
+    def find_spec(self, name, path, target=None):
+        if not any(name == p or name.startswith(p + '.') for p in self.prefixes):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = TimedLoader(spec.loader, name)
+
+            return spec
+
+        return None
+
+class StartupProfiler:
+    FIRST_FRAME_BUDGET = 250
+    FIRST_GAME_FRAME_BUDGET = 1500
+
+    enabled = False
+
+    start = time.perf_counter()
+    finder = None
+
+    imports = {}
+    import_stack = []
+
+    sections = {}
+    marks = {}
+
+    def init(prefixes=['scripts']):
+        StartupProfiler.enabled = True
+
+        StartupProfiler.finder = ImportTimer(prefixes)
+        sys.meta_path.insert(0, StartupProfiler.finder)
+
+    def stop():
+        if StartupProfiler.finder in sys.meta_path:
+            sys.meta_path.remove(StartupProfiler.finder)
+
+    @contextmanager
+    def section(name):
+        start = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            StartupProfiler.sections[name] = time.perf_counter() - start
+
+    def mark(name):
+        if name not in StartupProfiler.marks:
+            StartupProfiler.marks[name] = time.perf_counter() - StartupProfiler.start
+
+    def get_report():
+        return {
+            'marks_ms': {k: round(v * 1000, 2) for k, v in StartupProfiler.marks.items()},
+            'sections_ms': {k: round(v * 1000, 2) for k, v in StartupProfiler.sections.items()},
+            'imports_ms': {k: [round(v[0] * 1000, 2), round(v[1] * 1000, 2)] for k, v in sorted(StartupProfiler.imports.items(), key=lambda i: -i[1][0])}
+        }
+
+    def print_report(limit=15):
+        report = StartupProfiler.get_report()
+
+        print('[STARTUP_PROFILER] imports (cumulative / self ms):')
+        for name, times in list(report['imports_ms'].items())[:limit]:
+            print(f'    {name:<45} {times[0]:>9.2f} {times[1]:>9.2f}')
+
+        print('[STARTUP_PROFILER] sections (ms):')
+        for name, elapsed in report['sections_ms'].items():
+            print(f'    {name:<45} {elapsed:>9.2f}')
+
+        print('[STARTUP_PROFILER] marks (ms since launch):')
+        for name, elapsed in report['marks_ms'].items():
+            budget = {'first_frame': StartupProfiler.FIRST_FRAME_BUDGET, 'first_game_frame': StartupProfiler.FIRST_GAME_FRAME_BUDGET}.get(name)
+            status = '' if budget is None else (f' (budget {budget} ms, ' + ('ok)' if elapsed <= budget else 'OVER)'))
+
+            print(f'    {name:<45} {elapsed:>9.2f}{status}')
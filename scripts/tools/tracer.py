@@ -0,0 +1,124 @@
+from contextlib import contextmanager
+
+import functools
+import threading
+import queue
+import json
+import time
+import os
+
+# Events are handed to a writer thread through a bounded queue, when it is full events are dropped instead of stalling the frame
+class Tracer:
+    QUEUE_SIZE = 8192
+
+    enabled = False
+
+    path = None
+    queue = None
+    thread = None
+
+    start_ns = 0
+    pid = os.getpid()
+    tid = threading.get_ident()
+
+    dropped = 0
+
+    def start(path):
+        if Tracer.enabled:
+            Tracer.stop()
+
+        Tracer.path = path
+        Tracer.queue = queue.Queue(maxsize=Tracer.QUEUE_SIZE)
+        Tracer.dropped = 0
+
+        Tracer.start_ns = time.perf_counter_ns()
+        Tracer.pid = os.getpid()
+        Tracer.tid = threading.get_ident()
+
+        Tracer.thread = threading.Thread(target=Tracer.write, args=(path, Tracer.queue), name='tracer', daemon=True)
+        Tracer.thread.start()
+
+        Tracer.enabled = True
+
+        Tracer.name_thread('main')
+
+    def name_thread(name):
+        Tracer.emit({'name': 'thread_name', 'ph': 'M', 'pid': Tracer.pid, 'tid': threading.get_ident(), 'args': {'name': name}})
+
+    def stop():
+        if not Tracer.enabled:
+            return
+
+        Tracer.enabled = False
+
+        Tracer.queue.put(None)
+        Tracer.thread.join()
+
+        if Tracer.dropped:
+            print(f'[TRACER] Dropped {Tracer.dropped} events, the writer could not keep up.')
+
+    def write(path, events):
+        with open(path, 'w') as f:
+            f.write('{"traceEvents": [\n')
+
+            first = True
+            while True:
+                event = events.get()
+                if event is None:
+                    break
+
+                f.write(('' if first else ',\n') + json.dumps(event, separators=(',', ':')))
+                first = False
+
+            f.write('\n], "displayTimeUnit": "ms"}\n')
+
+    def emit(event):
+        try:
+            Tracer.queue.put_nowait(event)
+
+        except queue.Full:
+            Tracer.dropped += 1
+
+    def get_ts(ns):
+        return (ns - Tracer.start_ns) / 1000
+
+    def complete(name, start, end, cat='frame', args=None, tid=None):
+        if not Tracer.enabled:
+            return
+
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': Tracer.get_ts(start), 'dur': (end - start) / 1000, 'pid': Tracer.pid, 'tid': tid if tid else Tracer.tid}
+        if args:
+            event['args'] = args
+
+        Tracer.emit(event)
+
+    def counter(name, values):
+        if not Tracer.enabled:
+            return
+
+        Tracer.emit({'name': name, 'ph': 'C', 'ts': Tracer.get_ts(time.perf_counter_ns()), 'pid': Tracer.pid, 'args': values})
+
+    @contextmanager
+    def span(name, cat='load', args=None):
+        if not Tracer.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+
+        try:
+            yield
+
+        finally:
+            Tracer.complete(name, start, time.perf_counter_ns(), cat, args)
+
+def traced(name, cat='load'):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with Tracer.span(name, cat):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
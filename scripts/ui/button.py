@@ -1,4 +1,3 @@
-from scripts.tools.bezier import presets, get_bezier_point
 from scripts.tools import create_outline_edge
 
 from scripts.ui.frame import Frame
@@ -17,8 +16,6 @@ class Button(Frame):
             'color': (255, 255, 255)
         }
 
-        self.bezier_info['inherited'] = False
-
     def on_hover_start(self, scene):
         if self.flag is not None:
             return
@@ -48,27 +45,7 @@ class Button(Frame):
         self.flag = flag
 
     def display(self, scene, dt):
-        if self.bezier_info['x']['f'][0] < self.bezier_info['x']['f'][1]:
-            x_info = self.bezier_info['x']
-            self.rect.x = x_info['p_0'] + (x_info['p_1'] - x_info['p_0']) * get_bezier_point(x_info['f'][0] / x_info['f'][1], *x_info['b'])
-
-            self.bezier_info['x']['f'][0] += 1 * dt
-
-        if self.bezier_info['y']['f'][0] < self.bezier_info['y']['f'][1]:
-            y_info = self.bezier_info['y']
-            self.rect.y = y_info['p_0'] + (y_info['p_1'] - y_info['p_0']) * get_bezier_point(y_info['f'][0] / y_info['f'][1], *y_info['b'])
-
-            self.bezier_info['y']['f'][0] += 1 * dt
-
-        if self.bezier_info['alpha']['f'][0] < self.bezier_info['alpha']['f'][1]:
-            alpha_info = self.bezier_info['alpha']
-            alpha = alpha_info['a_0'] + (alpha_info['a_1'] - alpha_info['a_0']) * get_bezier_point(alpha_info['f'][0] / alpha_info['f'][1], *alpha_info['b'])
-
-            self.image.set_alpha(alpha)
-
-            self.bezier_info['alpha']['f'][0] += 1 * dt
-
-        if self.hovering:
-            create_outline_edge(self, self.hover_info['color'], scene.ui_surface, 3)
+        if self.hovering and scene.render:
+            create_outline_edge(self, self.hover_info['color'], scene.draw_list.layers['ui'], 3)
 
         super().display(scene, dt)
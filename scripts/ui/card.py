@@ -1,85 +1,128 @@
 from scripts import SCREEN_DIMENSIONS, PLAYER_COLOR
 
 from scripts.tools.spritesheet_loader import load_spritesheet
+from scripts.tools.asset_cache import AssetCache
 
 from scripts.ui.text_box import TextBox
 from scripts.ui.frame import Frame
 
 from scripts.tools import create_outline_edge
-from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.bezier import presets
+
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 import os
 
+class IconRegistry:
+    executor = None
+
+    def __init__(self, path, load):
+        self.path = path
+        self.load = load
+
+        self.files = {}
+        self.icons = {}
+        self.pending = {}
+
+    def index(self):
+        self.files.clear()
+
+        for file in os.listdir(self.path):
+            self.files[file.split('.')[0]] = os.path.join(self.path, file)
+
+    def __contains__(self, name):
+        return name in self.files
+
+    def __getitem__(self, name):
+        if name not in self.icons:
+            if name in self.pending:
+                self.icons[name] = self.pending.pop(name).result().convert_alpha()
+
+            else:
+                self.icons[name] = self.load(self.files[name])
+
+        return self.icons[name]
+
+    # Decodes icons on a worker thread; convert_alpha is left to __getitem__ on the main thread
+    def prewarm(self, names):
+        if IconRegistry.executor is None:
+            IconRegistry.executor = ThreadPoolExecutor(max_workers=1)
+
+        for name in names:
+            if name in self.icons or name in self.pending or name not in self.files:
+                continue
+
+            self.pending[name] = IconRegistry.executor.submit(self.load, self.files[name], False)
+
+    def get_surfaces(self):
+        surfaces = list(self.icons.values())
+        for future in self.pending.values():
+            if future.done() and future.exception() is None:
+                surfaces.append(future.result())
+
+        return surfaces
+
+class SymbolSheet:
+    def __init__(self, path, keys):
+        self.path = path
+        self.keys = keys
+
+        self.symbols = None
+
+    def __getitem__(self, key):
+        if self.symbols is None:
+            self.symbols = dict(zip(self.keys, load_spritesheet(self.path, scale=Card.IMG_SCALE)))
+
+        return self.symbols[key]
+
+    def get_surfaces(self):
+        return list(self.symbols.values()) if self.symbols else []
+
 class Card(Frame):
     IMG_SCALE = 4
 
+    CARD_PATH = os.path.join('resources', 'images', 'ui', 'card')
+
     BASE = None
 
-    ICONS = {
-        'talent': {},
-        'ability': {},
-        'stats': {}
-    }
+    ICONS = {}
 
-    SYMBOLS = {
-        'type': {
-            'talent': None,
-            'ability': None,
-        },
-
-        'action': {
-            'damage': None, 
-            'heal': None, 
-            'resistance/immunity': None,
-            'speed': None, 
-            'cooldown': None, 
-            'other': None
-        },
-        
-        'talent': {
-            'ability': None, 
-            'attack/kill': None, 
-            'hurt/death': None, 
-            'passive': None, 
-            'other': None
-        },
-
-        'ability': {
-            'contact': None,
-            'physical': None,
-            'magical': None,
-            'status': None, 
-            'special': None
-        }
+    SYMBOLS = {}
+
+    SYMBOL_KEYS = {
+        'type': ['talent', 'ability'],
+        'action': ['damage', 'heal', 'resistance/immunity', 'speed', 'cooldown', 'other'],
+        'talent': ['ability', 'attack/kill', 'hurt/death', 'passive', 'other'],
+        'ability': ['contact', 'physical', 'magical', 'status', 'special']
     }
 
     @staticmethod
-    def init():
-        base = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'card-base.png'))
-        Card.BASE = pygame.transform.scale(base, (base.get_width() * Card.IMG_SCALE, base.get_height() * Card.IMG_SCALE)).convert_alpha()
+    def load_icon(path, convert=True):
+        def build():
+            img = pygame.image.load(path)
+            img = pygame.transform.scale(img, (img.get_width() * Card.IMG_SCALE, img.get_height() * Card.IMG_SCALE))
 
-        for icon in os.listdir(os.path.join('resources', 'images', 'ui', 'card', 'talents')):
-            img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'talents', icon)).convert_alpha()                 
-            img = pygame.transform.scale(img, (img.get_width() * Card.IMG_SCALE, img.get_height() * Card.IMG_SCALE)).convert_alpha()
-            Card.ICONS['talent'][icon.split('.')[0]] = img
+            return [img.convert_alpha() if convert else img]
 
-        for icon in os.listdir(os.path.join('resources', 'images', 'ui', 'card', 'abilities')):
-            img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'abilities', icon)).convert_alpha()
-            img = pygame.transform.scale(img, (img.get_width() * Card.IMG_SCALE, img.get_height() * Card.IMG_SCALE)).convert_alpha()
-            Card.ICONS['ability'][icon.split('.')[0]] = img
+        return AssetCache.load(path, {'op': 'scale', 'scale': Card.IMG_SCALE}, build, convert)[0]
 
-        for icon in os.listdir(os.path.join('resources', 'images', 'ui', 'card', 'stats')):
-            img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'card', 'stats', icon)).convert_alpha()
-            img = pygame.transform.scale(img, (img.get_width() * Card.IMG_SCALE, img.get_height() * Card.IMG_SCALE)).convert_alpha()
-            Card.ICONS['stats'][icon.split('.')[0]] = img
+    @staticmethod
+    def init():
+        for icon_type, folder in [['talent', 'talents'], ['ability', 'abilities'], ['stats', 'stats']]:
+            Card.ICONS[icon_type] = IconRegistry(os.path.join(Card.CARD_PATH, folder), Card.load_icon)
+            Card.ICONS[icon_type].index()
 
-        for symbol in os.listdir(os.path.join('resources', 'images', 'ui', 'card', 'symbols')):
+        for symbol in os.listdir(os.path.join(Card.CARD_PATH, 'symbols')):
             name = symbol.split('-')[1].split('.')[0]
-            for index, img in enumerate(load_spritesheet(os.path.join('resources', 'images', 'ui', 'card', 'symbols', symbol))):
-                keys = list(Card.SYMBOLS[name].keys())
-                img = pygame.transform.scale(img, (img.get_width() * Card.IMG_SCALE, img.get_height() * Card.IMG_SCALE)).convert_alpha()
-                Card.SYMBOLS[name][keys[index]] = img
+            Card.SYMBOLS[name] = SymbolSheet(os.path.join(Card.CARD_PATH, 'symbols', symbol), Card.SYMBOL_KEYS[name])
+
+    @staticmethod
+    def get_base():
+        if Card.BASE is None:
+            Card.BASE = Card.load_icon(os.path.join(Card.CARD_PATH, 'card-base.png'))
+
+        return Card.BASE
 
     def __init__(self, position, img, strata, spawn):
         super().__init__(position, img, None, strata)
@@ -88,7 +131,7 @@ class Card(Frame):
         self.on_select = None
         
         self.flag = 'init'
-        self.delay_timers.append([30, lambda: self.set_flag(None), []])
+        self.add_delay_timer(30, lambda: self.set_flag(None))
 
         self.hover_info = {
             'x': self.rect.x,
@@ -102,8 +145,6 @@ class Card(Frame):
         self.hover_rect.width = self.rect.width
         self.hover_rect.height = self.rect.height + 16
 
-        self.bezier_info['inherited'] = False
-
         if spawn is not None:
             if spawn == 'y':
                 self.rect.y = 0 - (self.image.get_height())
@@ -136,32 +177,18 @@ class Card(Frame):
         self.flag = flag
 
     def display(self, scene, dt):
-        if self.bezier_info['x']['f'][0] < self.bezier_info['x']['f'][1]:
-            x_info = self.bezier_info['x']
-            self.rect.x = x_info['p_0'] + (x_info['p_1'] - x_info['p_0']) * get_bezier_point(x_info['f'][0] / x_info['f'][1], *x_info['b'])
-
-            self.bezier_info['x']['f'][0] += 1 * dt
-
-        if self.bezier_info['y']['f'][0] < self.bezier_info['y']['f'][1]:
-            y_info = self.bezier_info['y']
-            self.rect.y = y_info['p_0'] + (y_info['p_1'] - y_info['p_0']) * get_bezier_point(y_info['f'][0] / y_info['f'][1], *y_info['b'])
-
-            self.bezier_info['y']['f'][0] += 1 * dt
-
-        if self.bezier_info['alpha']['f'][0] < self.bezier_info['alpha']['f'][1]:
-            alpha_info = self.bezier_info['alpha']
-            alpha = alpha_info['a_0'] + (alpha_info['a_1'] - alpha_info['a_0']) * get_bezier_point(alpha_info['f'][0] / alpha_info['f'][1], *alpha_info['b'])
-
-            self.image.set_alpha(alpha)
-
-            self.bezier_info['alpha']['f'][0] += 1 * dt
-
-        if self.hovering:
-            create_outline_edge(self, self.hover_info['color'], scene.ui_surface, 3)
+        if self.hovering and scene.render:
+            create_outline_edge(self, self.hover_info['color'], scene.draw_list.layers['ui'], 3)
 
         super().display(scene, dt)
 
 class StandardCard(Card):
+    @staticmethod
+    def prewarm(draws):
+        for draw in draws:
+            info = draw.fetch()
+            Card.ICONS[info['type']].prewarm([info['icon']])
+
     def __init__(self, position, draw, spawn=None):
         self.draw = draw
         self.cards = None
@@ -187,7 +214,7 @@ class StandardCard(Card):
             self.hover_texts['description'].rect.x = (SCREEN_DIMENSIONS[0] * .5) - (self.hover_texts['description'].image.get_width() * .5)
 
     def create_card(self):
-        img = self.BASE.copy()
+        img = self.get_base().copy()
     
         icon = None
         symbols = None
@@ -264,7 +291,7 @@ class StatCard(Card):
         self.hover_texts['description'].rect.x = (SCREEN_DIMENSIONS[0] * .5) - (self.hover_texts['description'].image.get_width() * .5)
 
     def create_card(self):
-        img = self.BASE.copy()
+        img = self.get_base().copy()
         
         icon = None
         icon_name = None
@@ -18,20 +18,28 @@ class Frame(Sprite):
     def display(self, scene, dt):    
         super().display(scene, dt)
 
+        if not scene.render:
+            return
+
         if self.uses_entity_surface:
-            scene.entity_surface.blit(
+            scene.draw_list.blit(
+                'entity',
                 self.image, 
                 (self.rect.x + self.global_offset[0], self.rect.y + self.global_offset[1]),
+                copy=not self.static_image,
+                motion=self.get_tick_motion()
             )
             
         else:
-            scene.ui_surface.blit(
+            scene.draw_list.blit(
+                'ui',
                 self.image, 
                 (self.rect.x + self.global_offset[0], self.rect.y + self.global_offset[1]),
+                copy=not self.static_image
             )
 
     def on_del_sprite(self, scene, time):
-        self.delay_timers.append([time, lambda: scene.del_sprites(self), []])
+        self.add_delay_timer(time, lambda: scene.del_sprites(self))
         
     def on_hover_start(self, scene):
         ...
@@ -4,6 +4,7 @@ from scripts.ui.text_box import TextBox
 from scripts.ui.frame import Frame
 
 from scripts.tools.bezier import presets, get_bezier_point
+from scripts.tools.asset_loader import AssetLoader
 
 import pygame
 import os
@@ -16,7 +17,7 @@ class InfoBar(Frame):
 class HealthBar(InfoBar):
     def __init__(self, player):
         img_scale = 3
-        img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'player', 'player-frame.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'ui', 'player', 'player-frame.png'))
         img = pygame.transform.scale(img, (img.get_width() * img_scale, img.get_height() * img_scale))
 
         super().__init__((0, 0), pygame.Surface((img.get_width(), img.get_height())).convert_alpha(), None, 2)
@@ -98,7 +99,7 @@ class HealthBar(InfoBar):
 class EnemyBar(InfoBar):
     def __init__(self, sprite):
         img_scale = 1.25
-        img = pygame.image.load(os.path.join('resources', 'images', 'ui', 'enemies', 'enemy-frame.png')).convert_alpha()
+        img = AssetLoader.load_image(os.path.join('resources', 'images', 'ui', 'enemies', 'enemy-frame.png'))
         img = pygame.transform.scale(img, (img.get_width() * img_scale, img.get_height() * img_scale))
 
         super().__init__((0, 0), pygame.Surface((img.get_width(), img.get_height())).convert_alpha(), None, 2)
@@ -126,6 +127,9 @@ class EnemyBar(InfoBar):
         self.health.fill(UI_HEALTH_COLOR)
         self.original_health = self.health.copy()
 
+    def get_tick_motion(self):
+        return self.enemy.get_tick_motion()
+
     def set_pulse(self, frames, color):
         self.pulse_info['surface'] = self.pulse_info['original_surface'].copy()
         self.pulse_info['surface'].fill(color)
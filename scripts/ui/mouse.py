@@ -1,13 +1,15 @@
 from scripts.ui.frame import Frame
 
 from scripts.tools import check_pixel_collision
+from scripts.tools.inputs import Inputs
+from scripts.tools.asset_loader import AssetLoader
 
 import pygame
 import os
 
 class Mouse(pygame.sprite.Sprite):
     def __init__(self):
-        self.image = pygame.image.load(os.path.join('resources', 'images', 'ui', 'mouse.png')).convert_alpha()
+        self.image = AssetLoader.load_image(os.path.join('resources', 'images', 'ui', 'mouse.png'))
         self.image = pygame.transform.scale(self.image, (32, 32))
 
         self.rect = self.image.get_rect()
@@ -30,11 +32,12 @@ class Mouse(pygame.sprite.Sprite):
                 sprite.on_hover_start(scene)
 
     def display(self, scene, screen):
-        self.rect.center = pygame.mouse.get_pos()
+        self.rect.center = Inputs.mouse_pos
 
         self.entity_pos[0] = self.rect.centerx + scene.camera_offset[0]
         self.entity_pos[1] = self.rect.centery + scene.camera_offset[1]
 
         self.check_ui_hover(scene)
 
-        screen.blit(self.image, self.rect)
+        if scene.render:
+            scene.draw_list.blit('screen', self.image, self.rect)
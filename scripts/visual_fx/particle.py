@@ -5,6 +5,9 @@ from scripts.tools.bezier import presets, get_bezier_point
 import pygame
 
 class Particle(Entity):
+    # Particles only go away by running out their goals, asleep they would pile up off screen
+    ALWAYS_AWAKE = True
+
     def __init__(self, position, img, dimensions, strata, alpha=None):
         super().__init__(position, img, dimensions, strata, alpha)
         self.sprite_id = 'particle'
@@ -0,0 +1,30 @@
+import pytest
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The game loads its resources relative to the repository root
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+@pytest.fixture(scope='session')
+def display():
+    from scripts.headless import init_headless
+
+    return init_headless()
+
+@pytest.fixture
+def new_game(display):
+    from scripts.headless import create_scene_handler
+    from scripts.tools.input_source import ScriptedInput
+    from scripts.tools.rng import Rng
+
+    def new_game(script=lambda frame: ([], []), render=True):
+        Rng.seed(0)
+        return create_scene_handler(*display, ScriptedInput(script), render)
+
+    return new_game
@@ -0,0 +1,78 @@
+import pygame
+import pytest
+
+VISIBLE_VIEW = pygame.Rect(0, 0, 100, 100)
+NEAR_VIEW = VISIBLE_VIEW.inflate(200, 200)
+
+class Enemy:
+    def __init__(self, position):
+        from scripts.core_systems.enemy_ai import AiLod
+
+        self.rect = pygame.Rect(position, (10, 10))
+        self.visible = True
+        self.lod_info = AiLod.get_lod_info()
+
+@pytest.fixture(autouse=True)
+def lod():
+    from scripts.core_systems.enemy_ai import AiLod
+
+    AiLod.reset()
+    AiLod.enabled = True
+    yield AiLod
+    AiLod.reset()
+    AiLod.enabled = True
+
+def run(lod, enemies, ticks, dt=1):
+    updates = []
+    for _ in range(ticks):
+        lod.update(enemies, VISIBLE_VIEW, NEAR_VIEW, dt)
+        updates.append([enemy.lod_info['dt'] for enemy in enemies])
+
+    return updates
+
+def test_enemies_are_tiered_by_distance_to_the_view(lod):
+    enemies = [Enemy((50, 50)), Enemy((-60, 50)), Enemy((1000, 50))]
+
+    lod.update(enemies, VISIBLE_VIEW, NEAR_VIEW, 1)
+
+    assert [enemy.lod_info['tier'] for enemy in enemies] == ['visible', 'near', 'far']
+    assert [enemy.visible for enemy in enemies] == [True, False, False]
+    assert lod.get_counts(enemies) == {'visible': 1, 'near': 1, 'far': 1}
+
+def test_every_enemy_is_visible_with_tiers_off(lod):
+    lod.enabled = False
+    enemies = [Enemy((-60, 50)), Enemy((1000, 50))]
+
+    assert run(lod, enemies, 3) == [[1, 1]] * 3
+    assert lod.get_counts(enemies)['visible'] == 2
+
+@pytest.mark.parametrize('position, interval', [((50, 50), 1), ((-60, 50), 'NEAR_INTERVAL'), ((1000, 50), 'FAR_INTERVAL')])
+def test_each_tier_updates_once_an_interval_with_the_dt_it_skipped(lod, position, interval):
+    interval = getattr(lod, interval) if isinstance(interval, str) else interval
+    enemy = Enemy(position)
+
+    updates = [tick[0] for tick in run(lod, [enemy], lod.FAR_INTERVAL * 2, .5)]
+    updated = [dt for dt in updates if dt is not None]
+
+    assert len(updated) == lod.FAR_INTERVAL * 2 // interval
+    assert updated == [.5 * interval] * len(updated)
+    assert all(updates[i] is None for i in range(len(updates)) if (i + 1 + enemy.lod_info['offset']) % interval)
+
+def test_enemies_in_a_tier_are_spread_over_its_interval(lod):
+    enemies = [Enemy((-60, 50)) for _ in range(lod.NEAR_INTERVAL * 2)]
+
+    updates = run(lod, enemies, lod.NEAR_INTERVAL)
+
+    assert [sum(dt is not None for dt in tick) for tick in updates] == [2] * lod.NEAR_INTERVAL
+
+def test_paused_ticks_owe_no_steering(lod):
+    enemy = Enemy((-60, 50))
+
+    owed = []
+    for dt in [0, 1] * lod.NEAR_INTERVAL * 2:
+        lod.update([enemy], VISIBLE_VIEW, NEAR_VIEW, dt)
+        if enemy.lod_info['dt'] is not None:
+            owed.append([enemy.lod_info['dt'], enemy.lod_info['steps']])
+
+    assert owed and all(dt == steps for dt, steps in owed)
+    assert sum(dt for dt, _ in owed) > 0
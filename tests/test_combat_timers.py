@@ -0,0 +1,83 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def timers():
+    from scripts.core_systems.combat_handler import CombatTimers
+
+    CombatTimers.reset()
+    yield CombatTimers
+    CombatTimers.reset()
+
+def test_reset_clears_the_clock_and_the_wheel(timers):
+    from scripts.core_systems.combat_handler import Mitigations
+
+    mitigations = Mitigations(True)
+    mitigations['a'] = [.5, 30]
+    timers.advance(10)
+
+    timers.reset()
+
+    assert timers.time == 0
+    assert not any(timers.slots)
+
+def test_timed_mitigations_expire_after_their_frames(timers):
+    from scripts.core_systems.combat_handler import Mitigations
+
+    mitigations = Mitigations(True)
+    mitigations['a'] = [.5, 3]
+
+    timers.advance(2)
+    assert mitigations.total == .5
+
+    timers.advance(1)
+    assert 'a' not in mitigations
+    assert mitigations.total == 0
+
+def test_an_entry_due_now_expires_on_the_next_tick_not_a_lap_later(timers):
+    from scripts.core_systems.combat_handler import Mitigations
+
+    mitigations = Mitigations(True)
+    timers.advance(5)
+
+    mitigations['a'] = [.5, 0]
+    timers.advance(1)
+
+    assert 'a' not in mitigations
+
+def test_mitigation_total_follows_every_dict_method(timers):
+    from scripts.core_systems.combat_handler import Mitigations
+
+    mitigations = Mitigations(False)
+
+    mitigations.update({'a': .25, 'b': .5})
+    assert mitigations.total == .75
+
+    mitigations.setdefault('c', .125)
+    mitigations.setdefault('a', 1)
+    assert mitigations.total == .875
+
+    mitigations.pop('b')
+    assert mitigations.total == .375
+
+    mitigations.popitem()
+    assert mitigations.total == sum(mitigations.values())
+
+    mitigations.clear()
+    assert mitigations.total == 0
+
+def test_immunities_read_as_frames_left_every_way(timers):
+    from scripts.core_systems.combat_handler import get_immunity_dict
+
+    immunities = get_immunity_dict()
+    immunities['physical'] = 30
+    immunities['magical&'] = True
+
+    timers.advance(10)
+    copy = immunities.copy()
+    timers.advance(5)
+
+    assert immunities['physical'] == immunities.get('physical') == dict(immunities.items())['physical'] == 15
+    assert 15 in immunities.values()
+    assert immunities['magical&'] is True
+    assert copy['physical'] == 15
+    assert immunities.get('missing', 0) == 0
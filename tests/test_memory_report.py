@@ -0,0 +1,41 @@
+def get_bytes(surfaces):
+    from scripts.tools.memory_report import MemoryReport
+
+    return sum(MemoryReport.get_surface_bytes(surface) for surface in {id(s): s for s in surfaces}.values())
+
+def test_caches_count_every_loaded_card_icon_and_symbol(new_game):
+    from scripts.tools.memory_report import MemoryReport
+    from scripts.ui.card import Card
+
+    scene = new_game(render=False).current_scene
+
+    Card.init()
+    for registry in Card.ICONS.values():
+        for name in registry.files:
+            registry[name]
+
+    for name, sheet in Card.SYMBOLS.items():
+        sheet[Card.SYMBOL_KEYS[name][0]]
+
+    card_surfaces = [Card.get_base()]
+    for cache in list(Card.ICONS.values()) + list(Card.SYMBOLS.values()):
+        card_surfaces.extend(cache.get_surfaces())
+
+    assert len(card_surfaces) > len(Card.ICONS) + len(Card.SYMBOLS)
+    assert MemoryReport.get_surface_totals(scene)['caches'] >= get_bytes(card_surfaces)
+
+def test_growth_is_flagged_from_the_first_floor_of_a_map():
+    from scripts.tools.memory_report import MemoryReport
+
+    MemoryReport.floors = []
+    MemoryReport.flags = []
+
+    for floor in range(12):
+        MemoryReport.floors.append({'floor': floor + 1, 'map': 'caverns/floor-1', 'surface_total_kb': 5000 + 105 * floor, 'traced_kb': 2000})
+        MemoryReport.check_growth()
+
+    assert [flag[1] for flag in MemoryReport.flags] == ['surface_total_kb', 'surface_total_kb']
+    assert MemoryReport.flags[0][0] == MemoryReport.WINDOW + 1
+
+    MemoryReport.floors = []
+    MemoryReport.flags = []
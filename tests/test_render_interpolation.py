@@ -0,0 +1,110 @@
+import pygame
+
+# The player is held still for the floor's intro, so tests that need it moving run past it first
+INTRO_FRAMES = 100
+
+def run_right(frame):
+    return [pygame.K_d], []
+
+def get_pullbacks(layer, interpolation):
+    return [
+        (before[0], before[1], (after[1][0] - before[1][0], after[1][1] - before[1][1]))
+        for before, after in zip(layer.commands, layer.get_commands(interpolation))
+    ]
+
+def test_moving_blits_are_pulled_back_by_the_interpolation():
+    from scripts.renderer import DrawLayer
+
+    layer = DrawLayer()
+    surface = pygame.Surface((4, 4))
+
+    layer.blit(surface, (10, 10), motion=[4, -2])
+    layer.blit(surface, (20, 20))
+
+    assert [c[1] for c in layer.get_commands(0)] == [(6, 12), (20, 20)]
+    assert [c[1] for c in layer.get_commands(.5)] == [(8, 11), (20, 20)]
+    assert layer.get_commands(1) is layer.commands
+
+def test_holdfast_outline_is_pulled_back_with_the_player(new_game):
+    from scripts.core_systems.talents import Holdfast, add_talent
+
+    scene_handler = new_game(run_right)
+    scene = scene_handler.current_scene
+    player = scene.player
+
+    talent = add_talent(player, Holdfast(scene, player))
+    for _ in range(INTRO_FRAMES):
+        scene_handler.update(1)
+
+    talent.call('on_player_damaged', scene, {'type': 'physical'})
+    scene_handler.update(1)
+
+    motion = player.get_tick_motion()
+    assert motion != [0, 0]
+
+    x, y = player.rect.x - player.rect_offset[0], player.rect.y - player.rect_offset[1]
+    owned = [
+        offset for surface, dest, offset in get_pullbacks(scene.draw_list.layers['entity'], 0)
+        if surface.get_size() == player.image.get_size() and abs(dest[0] - x) <= 1 and abs(dest[1] - y) <= 1
+    ]
+
+    assert len(owned) == 17
+    assert set(owned) == {(-motion[0], -motion[1])}
+
+def test_halo_is_pulled_back_with_the_player(new_game):
+    scene_handler = new_game(run_right)
+    player = scene_handler.current_scene.player
+
+    for _ in range(INTRO_FRAMES):
+        scene_handler.update(1)
+
+    assert player.get_tick_motion() != [0, 0]
+    assert player.visuals[0].get_tick_motion() == player.get_tick_motion()
+
+def test_tweened_sprites_report_their_motion(new_game):
+    from scripts.entities.entity import Entity
+
+    scene_handler = new_game()
+    scene = scene_handler.current_scene
+
+    sprite = Entity(scene.player.center_position, pygame.Surface((8, 8)), None, scene.player.strata)
+    sprite.sprite_id = 'tweened'
+    scene.add_sprites(sprite)
+    sprite.set_x_bezier(sprite.rect.x + 200, 20, [[0, 0], [0, 0], [1, 1], [1, 1], 0])
+
+    scene_handler.update(1)
+    scene_handler.update(1)
+
+    motion = sprite.get_tick_motion()
+    assert motion[0] > 0
+
+    pullbacks = [offset for surface, dest, offset in get_pullbacks(scene.draw_list.layers['entity'], 0) if surface.get_size() == (8, 8)]
+    assert pullbacks == [(-motion[0], -motion[1])]
+
+def test_ticks_that_do_not_render_skip_the_holdfast_outline(new_game):
+    from scripts.core_systems.talents import Holdfast, add_talent
+
+    scene_handler = new_game(run_right, render=False)
+    scene = scene_handler.current_scene
+    player = scene.player
+
+    talent = add_talent(player, Holdfast(scene, player))
+    for _ in range(INTRO_FRAMES):
+        scene_handler.update(1)
+
+    talent.call('on_player_damaged', scene, {'type': 'physical'})
+    scene_handler.update(1)
+
+    assert not [c for c in scene.draw_list.layers['entity'].commands if c[0].get_size() == player.image.get_size()]
+
+def test_owned_and_static_surfaces_are_not_copied_for_the_render_thread():
+    from scripts.renderer import DrawLayer
+
+    layer = DrawLayer(copy_all=True)
+    surface = pygame.Surface((4, 4))
+
+    layer.blit(surface, (0, 0))
+    layer.blit(surface, (0, 0), owned=True)
+    layer.blit(surface, (0, 0), static=True)
+
+    assert [command[0] is surface for command in layer.commands] == [False, True, True]